@@ -2,12 +2,20 @@
 """Main entry point for loading fantasy baseball data."""
 
 import json
+import os
 import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
 from .db import get_connection, init_schema
-from .loaders.players import load_players
+from .exporters.direct import DIRECT_TABLES, DirectParquetSink, check_direct_export
+from .exporters.parquet import DEFAULT_EXPORT_LAYOUT
+from .loaders.players import PLAYER_TABLE_COLUMNS, load_players, prepare_player_rows
 from .loaders.leagues import load_league
 from .loaders.matchups import load_matchups
 from .loaders.position_summary import load_all_position_summaries
@@ -22,9 +30,201 @@ LOAD_DIR = Path("/Users/Shared/BaseballHQ/resources/load")
 # Fallback to test fixtures if pipeline dirs don't exist
 FIXTURES_DIR = Path("tests/fixtures")
 
+# One summary file per league; the id in the filename keys the matching
+# league_<id>_schedule.json.
+LEAGUE_SUMMARY_GLOB = "league_*_summary.json"
 
-def load_all(year: int | None = None):
-    """Load all data from ETL pipeline or test fixtures into the database."""
+
+def discover_leagues(data_dir: Path) -> list[int]:
+    """Return the sorted league ids that have a summary file in data_dir."""
+    league_ids = []
+    for summary_file in data_dir.glob(LEAGUE_SUMMARY_GLOB):
+        league_id = summary_file.name[len("league_"):-len("_summary.json")]
+        if league_id.isdigit():
+            league_ids.append(int(league_id))
+    return sorted(league_ids)
+
+
+# Stages of a league load, in order. Each inserts into SERIAL tables:
+# league_scoring_categories; roster_slots and player_fantasy_assignments;
+# matchup_categories.
+LEAGUE_STAGES: tuple[str, ...] = ("league", "teams", "schedule")
+
+
+class _StageOrder:
+    """Runs each league stage in league order while stages overlap.
+
+    SERIAL ids are handed out in insert order. Leagues inserting into the
+    same table at once would number its rows differently on every run,
+    changing the exported parquet and its sha256 though the data did not
+    change. Stage ``s`` of league ``i`` therefore waits until league
+    ``i - 1`` is done with ``s``; league ``i`` can still load its rosters
+    while league ``i + 1`` loads its summary.
+    """
+
+    def __init__(self, count: int):
+        self._done = {
+            stage: [threading.Event() for _ in range(count)] for stage in LEAGUE_STAGES
+        }
+
+    @contextmanager
+    def turn(self, stage: str, index: int) -> Iterator[None]:
+        if index:
+            self._done[stage][index - 1].wait()
+        try:
+            yield
+        finally:
+            self._done[stage][index].set()
+
+    def release(self, index: int) -> None:
+        """Let later leagues past every stage of league ``index`` (it failed)."""
+        for events in self._done.values():
+            events[index].set()
+
+
+def _load_league_bundle(
+    league_id: int,
+    data_dir: Path,
+    teams: list[dict],
+    order: _StageOrder | None = None,
+    index: int = 0,
+) -> dict:
+    """Load one league's summary, rosters and schedule on a dedicated connection.
+
+    Runs inside a worker thread. FK order within the league is preserved:
+    leagues -> teams/roster_slots -> matchups (which reference teams).
+    With ``order``, each stage waits for the previous league's (see
+    _StageOrder); ``index`` is this league's position. Returns counts plus
+    a per-stage timing breakdown in seconds, waits excluded.
+    """
+    counts = {"scoring_categories": 0, "teams": 0, "roster_slots": 0,
+              "matchups": 0, "matchup_categories": 0}
+    timings: dict[str, float] = {}
+    order = order or _StageOrder(index + 1)
+    start = time.perf_counter()
+
+    conn = get_connection()
+    try:
+        league = json.loads((data_dir / f"league_{league_id}_summary.json").read_text())
+        with order.turn("league", index):
+            stage = time.perf_counter()
+            counts["scoring_categories"] = load_league(conn, league)["scoring_categories"]
+            timings["league"] = time.perf_counter() - stage
+
+        with order.turn("teams", index):
+            stage = time.perf_counter()
+            for team in teams:
+                team_counts = load_team_roster(conn, team)
+                counts["teams"] += 1
+                counts["roster_slots"] += team_counts["roster_slots"]
+                print(f"  ✓ [{league_id}] Team {team['team_id']} ({team['team_name']}): "
+                      f"{team_counts['roster_slots']} roster slots")
+            timings["teams"] = time.perf_counter() - stage
+
+        schedule_file = data_dir / f"league_{league_id}_schedule.json"
+        with order.turn("schedule", index):
+            stage = time.perf_counter()
+            if schedule_file.exists():
+                schedule = json.loads(schedule_file.read_text())
+                matchup_counts = load_matchups(conn, schedule)
+                counts["matchups"] = matchup_counts["matchups"]
+                counts["matchup_categories"] = matchup_counts["matchup_categories"]
+            else:
+                print(f"   ⚠️  Schedule file not found: {schedule_file}")
+            timings["schedule"] = time.perf_counter() - stage
+    except Exception:
+        order.release(index)
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    timings["total"] = time.perf_counter() - start
+    return {"league_id": league_id, "counts": counts, "timings": timings}
+
+
+def _load_leagues(
+    league_ids: list[int],
+    data_dir: Path,
+    teams_by_league: dict[int, list[dict]],
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Fan league bundles out over a thread pool; results keep league_ids order.
+
+    Each worker owns its connection, so leagues insert concurrently and the
+    database spreads them across backends. Each stage still runs in
+    league_ids order (see _StageOrder), so SERIAL ids come out the same on
+    every run. The first failure is re-raised after the pool drains.
+    """
+    if not league_ids:
+        return []
+    workers = max_workers or min(len(league_ids), os.cpu_count() or 1)
+    order = _StageOrder(len(league_ids))
+    # The pool starts leagues in submission order, so the league a stage
+    # waits on has always started: no deadlock however few workers.
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="league") as pool:
+        futures = [
+            pool.submit(_load_league_bundle, league_id, data_dir,
+                        teams_by_league.get(league_id, []), order, i)
+            for i, league_id in enumerate(league_ids)
+        ]
+        return [f.result() for f in futures]
+
+
+def _print_league_summary(results: list[dict]) -> None:
+    """Per-league counts and stage timings, printed after all workers finish."""
+    for r in results:
+        c, t = r["counts"], r["timings"]
+        print(f"  ✓ League {r['league_id']}: {c['scoring_categories']} scoring categories, "
+              f"{c['teams']} teams, {c['roster_slots']} roster slots, "
+              f"{c['matchups']} matchups, {c['matchup_categories']} category rows")
+        print(f"    ⏱️  league {t['league']:.2f}s · teams {t['teams']:.2f}s · "
+              f"schedule {t['schedule']:.2f}s · total {t['total']:.2f}s")
+
+
+def _player_dir() -> Path:
+    """Where hitters.json / pitchers.json live: LOAD_DIR, or the fixtures."""
+    return LOAD_DIR if TRANSFORM_DIR.exists() and LOAD_DIR.exists() else FIXTURES_DIR
+
+
+def _finish_direct_parquet(
+    conn, writer, target_dir: Path, layout: str, verify: bool = False
+) -> None:
+    """Wait for the direct parquet writer; with ``verify``, check it against Postgres."""
+    writer.result()
+    if not verify:
+        print(f"  ✓ {len(DIRECT_TABLES)} tables written to {target_dir} "
+              "(not checked against Postgres)\n")
+        return
+    print("🔎 Checking direct parquet against a Postgres export...")
+    mismatched = check_direct_export(conn, target_dir, layout=layout)
+    conn.rollback()
+    if mismatched:
+        raise RuntimeError(
+            f"Direct parquet differs from Postgres for: {', '.join(mismatched)}"
+        )
+    print(f"  ✓ {len(DIRECT_TABLES)} tables match; sidecars written to {target_dir}\n")
+
+
+def load_all(
+    year: int | None = None,
+    max_workers: int | None = None,
+    direct_parquet_dir: Path | None = None,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    verify_direct: bool = False,
+):
+    """Load all data from ETL pipeline or test fixtures into the database.
+
+    Every ``league_<id>_summary.json`` in the data dir is loaded, each league
+    (summary, rosters, schedule) in its own worker on its own connection.
+    ``max_workers`` defaults to one per league, capped at the CPU count.
+
+    ``direct_parquet_dir`` also writes DIRECT_TABLES parquet from the
+    loader's rows. The write runs in a thread while leagues load and reads
+    nothing back from Postgres. ``verify_direct`` then checks it against a
+    full Postgres export of the same tables (check_direct_export), which
+    also gives matching tables sidecars so export-parquets skips them.
+    """
     season_id = year or datetime.now().year
     print(f"   📅 Season: {season_id}\n")
 
@@ -39,7 +239,10 @@ def load_all(year: int | None = None):
         print("🚀 Starting database load from test fixtures...\n")
         print(f"   📁 Fixtures dir: {FIXTURES_DIR}\n")
 
+    sink = DirectParquetSink() if direct_parquet_dir is not None else None
+    writer = None
     conn = get_connection()
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="direct-parquet")
     try:
         # Initialize schema
         print("\n📋 Initializing schema...")
@@ -67,7 +270,7 @@ def load_all(year: int | None = None):
         if hitters_file.exists():
             print(f"   📄 Reading {hitters_file}")
             hitters = json.loads(hitters_file.read_text())
-            counts = load_players(conn, hitters, season_id=season_id)
+            counts = load_players(conn, hitters, season_id=season_id, sink=sink)
             print(f"  ✓ Hitters: {counts['players']} players, {counts['batting']} stat records")
             print(f"    {counts['projections']} projections, {counts['valuations']} valuations")
         else:
@@ -76,7 +279,7 @@ def load_all(year: int | None = None):
         if pitchers_file.exists():
             print(f"   📄 Reading {pitchers_file}")
             pitchers = json.loads(pitchers_file.read_text())
-            counts = load_players(conn, pitchers, season_id=season_id)
+            counts = load_players(conn, pitchers, season_id=season_id, sink=sink)
             print(f"  ✓ Pitchers: {counts['players']} players, {counts['pitching']} stat records")
             print(f"    {counts['projections']} projections, {counts['valuations']} valuations")
         else:
@@ -84,31 +287,34 @@ def load_all(year: int | None = None):
 
         print()
 
-        # Load league - from TRANSFORM directory
-        print("🏆 Loading league...")
-        league_file = data_dir / "league_10998_summary.json"
-        if league_file.exists():
-            print(f"   📄 Reading {league_file}")
-            league = json.loads(league_file.read_text())
-            counts = load_league(conn, league)
-            print(f"  ✓ League {league['league_id']}: {counts['scoring_categories']} scoring categories")
-        else:
-            print(f"   ⚠️  League file not found: {league_file}")
-        print()
+        # Leagues fan out: each league's summary -> rosters -> schedule runs
+        # on its own connection. Players are already committed above, so the
+        # roster_slots -> players FK is satisfied for every worker.
+        conn.commit()
+        if sink is not None and direct_parquet_dir is not None:
+            print(f"📦 Writing {', '.join(DIRECT_TABLES)} parquet directly "
+                  f"to {direct_parquet_dir} (in background)\n")
+            sink.bind(conn)
+            conn.commit()
+            writer = pool.submit(sink.write, direct_parquet_dir, layout=layout)
+        print("🏆 Loading leagues...")
+        league_ids = discover_leagues(data_dir)
+        if not league_ids:
+            print(f"   ⚠️  No league summary files found in {data_dir}")
 
-        # Load teams FIRST (before matchups) - from TRANSFORM directory
-        print("⚾ Loading teams...")
         team_files = sorted(data_dir.glob("team_*_roster.json"))
         if not team_files:
             print(f"   ⚠️  No team files found in {data_dir}")
-        total_rosters = 0
+        teams_by_league: dict[int, list[dict]] = {}
         for team_file in team_files:
             team = json.loads(team_file.read_text())
-            counts = load_team_roster(conn, team)
-            total_rosters += counts["roster_slots"]
-            print(f"  ✓ Team {team['team_id']} ({team['team_name']}): {counts['roster_slots']} roster slots")
-        if team_files:
-            print(f"\n  Total: {len(team_files)} teams, {total_rosters} roster slots")
+            teams_by_league.setdefault(team["league_id"], []).append(team)
+        for orphan in sorted(set(teams_by_league) - set(league_ids)):
+            print(f"   ⚠️  Skipping {len(teams_by_league[orphan])} team file(s) for "
+                  f"league {orphan}: no league_{orphan}_summary.json")
+
+        results = _load_leagues(league_ids, data_dir, teams_by_league, max_workers)
+        _print_league_summary(results)
         print()
 
         # Load per-position auction-pricing aggregates - from LOAD subdirs
@@ -122,18 +328,10 @@ def load_all(year: int | None = None):
                   f"under {player_dir}/<scenario>/")
         print()
 
-        # Load schedule/matchups (after teams) - from TRANSFORM directory
-        print("📅 Loading schedule...")
-        schedule_file = data_dir / "league_10998_schedule.json"
-        if schedule_file.exists():
-            print(f"   📄 Reading {schedule_file}")
-            schedule = json.loads(schedule_file.read_text())
-            counts = load_matchups(conn, schedule)
-            print(f"  ✓ Loaded {counts['matchups']} matchups, "
-                  f"{counts['matchup_categories']} category rows")
-        else:
-            print(f"   ⚠️  Schedule file not found: {schedule_file}")
-        print()
+        if writer is not None and direct_parquet_dir is not None:
+            _finish_direct_parquet(
+                conn, writer, direct_parquet_dir, layout, verify=verify_direct
+            )
 
         print("\n✅ Load complete!\n")
 
@@ -141,8 +339,46 @@ def load_all(year: int | None = None):
         print(f"\n❌ Error: {e}")
         conn.rollback()
         raise
+    finally:
+        pool.shutdown(wait=True)
+        conn.close()
+
+
+def emit_direct_parquets(
+    target_dir: Path,
+    year: int | None = None,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+) -> list[Path]:
+    """Write DIRECT_TABLES parquet from the player JSON without loading it.
+
+    The database is only asked for column metadata (the schema must exist);
+    no rows are inserted or read back. No sidecars are written, so a later
+    export-parquets run re-exports these tables from Postgres. manifest.json
+    is rewritten to describe the new files, so upload-parquets can upload
+    them as they are.
+    """
+    season_id = year or datetime.now().year
+    player_dir = _player_dir()
+    print(f"   📅 Season: {season_id}")
+    print(f"   📁 Player dir: {player_dir}\n")
+
+    sink = DirectParquetSink()
+    for name in ("hitters.json", "pitchers.json"):
+        path = player_dir / name
+        if not path.exists():
+            print(f"   ⚠️  {name} not found: {path}")
+            continue
+        print(f"   📄 Reading {path}")
+        rows = prepare_player_rows(json.loads(path.read_text()), season_id)
+        for table in DIRECT_TABLES:
+            sink.add(table, list(PLAYER_TABLE_COLUMNS[table]), rows[table])
+
+    conn = get_connection()
+    try:
+        sink.bind(conn)
     finally:
         conn.close()
+    return sink.write(target_dir, layout=layout)
 
 
 def main():
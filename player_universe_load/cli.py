@@ -6,6 +6,7 @@ import os
 import subprocess
 import sys
 import time
+import tracemalloc
 
 from dotenv import load_dotenv
 
@@ -17,9 +18,34 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from .__main__ import load_all
+from .__main__ import emit_direct_parquets, load_all
 from .db import console, get_connection
-from .exporters import PARQUET_DIR, export_all, upload_all, verify_all
+from .exporters import (
+    DEFAULT_EXPORT_LAYOUT,
+    DEFAULT_EXPORT_METHOD,
+    DEFAULT_EXPORT_PROFILE,
+    DEFAULT_EXPORT_WORKERS,
+    DEFAULT_IPC_MODE,
+    DEFAULT_JSONB_MODE,
+    DEFAULT_KEY_SCHEME,
+    DEFAULT_UPLOAD_WORKERS,
+    DEFAULT_VERIFY_MODE,
+    DEFAULT_VERIFY_WORKERS,
+    EXPORT_LAYOUTS,
+    EXPORT_METHODS,
+    EXPORT_PROFILES,
+    IPC_MODES,
+    JSONB_MODES,
+    KEY_SCHEMES,
+    PARQUET_DIR,
+    VERIFY_MODES,
+    MultipartConfig,
+    export_all,
+    export_and_upload,
+    rollback_artifact,
+    upload_all,
+    verify_all,
+)
 
 load_dotenv()
 
@@ -57,14 +83,42 @@ def _timed(label: str):
 
 
 @_timed("load-local")
-def load_local(year: int | None = None):
-    """Load data to local PostgreSQL database."""
+def load_local(
+    year: int | None = None,
+    workers: int | None = None,
+    direct_parquet: bool = False,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    verify_direct: bool = False,
+):
+    """Load data to local PostgreSQL database.
+
+    ``direct_parquet`` also writes the player tables' parquet under
+    PARQUET_DIR straight from the loaded rows (see exporters.direct);
+    ``verify_direct`` checks those files against a Postgres export.
+    """
     local_url = _local_url()
     print("🏠 Loading to LOCAL PostgreSQL database...")
     print(f"   Connection: {local_url}\n")
 
     os.environ["DATABASE_URL"] = local_url
-    load_all(year=year)
+    load_all(
+        year=year,
+        max_workers=workers,
+        direct_parquet_dir=PARQUET_DIR if direct_parquet else None,
+        layout=layout,
+        verify_direct=verify_direct,
+    )
+
+
+@_timed("direct-parquets")
+def direct_parquets(year: int | None = None, layout: str = DEFAULT_EXPORT_LAYOUT):
+    """Write the player tables' parquet from the JSON, skipping Postgres rows."""
+    print("📦 Writing player parquet files directly from the load JSON...")
+    print(f"   Target dir: {PARQUET_DIR}\n")
+
+    os.environ["DATABASE_URL"] = _local_url()
+    paths = emit_direct_parquets(PARQUET_DIR, year=year, layout=layout)
+    print(f"\n✅ Wrote {len(paths)} parquet files to {PARQUET_DIR}")
 
 
 def _spinner_progress(description: str) -> Progress:
@@ -154,7 +208,15 @@ def sync_to_neon():
 
 
 @_timed("export-parquets")
-def export_parquets():
+def export_parquets(
+    method: str = DEFAULT_EXPORT_METHOD,
+    workers: int | None = None,
+    force: bool = False,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    profile: str = DEFAULT_EXPORT_PROFILE,
+    jsonb: str = DEFAULT_JSONB_MODE,
+    ipc: str = DEFAULT_IPC_MODE,
+):
     """Export local Postgres tables to parquet files under PARQUET_DIR."""
     print("📦 Exporting Postgres tables to parquet files...")
     print(f"   Target dir: {PARQUET_DIR}\n")
@@ -162,7 +224,10 @@ def export_parquets():
     os.environ["DATABASE_URL"] = _local_url()
     conn = get_connection()
     try:
-        paths = export_all(conn)
+        paths = export_all(
+            conn, method=method, max_workers=workers, force=force, layout=layout,
+            profile=profile, jsonb=jsonb, ipc=ipc,
+        )
     finally:
         conn.close()
 
@@ -170,7 +235,13 @@ def export_parquets():
 
 
 @_timed("upload-parquets")
-def upload_parquets():
+def upload_parquets(
+    workers: int | None = None,
+    multipart: MultipartConfig | None = None,
+    force: bool = False,
+    check_remote: bool = False,
+    key_scheme: str = DEFAULT_KEY_SCHEME,
+):
     """Upload local parquet files to R2 and record metadata in Postgres."""
     print("☁️  Uploading parquet files to R2...")
     print(f"   Source dir: {PARQUET_DIR}\n")
@@ -178,85 +249,199 @@ def upload_parquets():
     os.environ["DATABASE_URL"] = _local_url()
     conn = get_connection()
     try:
-        results = upload_all(conn)
+        results = upload_all(
+            conn, max_workers=workers, multipart=multipart, force=force,
+            check_remote=check_remote, key_scheme=key_scheme,
+        )
     finally:
         conn.close()
 
-    total_bytes = sum(r["size_bytes"] for r in results)
+    _print_upload_summary(results)
+
+
+def _print_upload_summary(results: list[dict]) -> None:
+    uploaded = [r for r in results if not r.get("skipped")]
+    skipped = [r for r in results if r.get("skipped")]
+    uploaded_bytes = sum(r["size_bytes"] for r in uploaded)
+    skipped_bytes = sum(r["size_bytes"] for r in skipped)
     print(
-        f"\n✅ Uploaded {len(results)} parquet files "
-        f"({total_bytes / 1024 / 1024:.1f}MB) to R2"
+        f"\n✅ Uploaded {len(uploaded)} parquet files "
+        f"({uploaded_bytes / 1024 / 1024:.1f}MB) to R2, skipped {len(skipped)} "
+        f"unchanged ({skipped_bytes / 1024 / 1024:.1f}MB)"
     )
 
 
 @_timed("parquet-and-sync")
-def parquet_and_sync():
+def parquet_and_sync(
+    export_method: str = DEFAULT_EXPORT_METHOD,
+    export_workers: int | None = None,
+    force: bool = False,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    profile: str = DEFAULT_EXPORT_PROFILE,
+    jsonb: str = DEFAULT_JSONB_MODE,
+    ipc: str = DEFAULT_IPC_MODE,
+    upload_workers: int | None = None,
+    multipart: MultipartConfig | None = None,
+    check_remote: bool = False,
+    key_scheme: str = DEFAULT_KEY_SCHEME,
+    pipelined: bool = False,
+):
     """Parquet pipeline: export local Postgres -> parquet -> upload to R2.
 
     Mirrors load-and-sync's shape for just the parquet path. Useful when
     the local Postgres is already current and you want to refresh R2
-    without re-running the full ETL.
+    without re-running the full ETL. ``pipelined`` starts each table's
+    upload as soon as it is exported instead of after the last one (see
+    exporters.pipeline) and reports each stage's utilization.
     """
+    if pipelined:
+        print("📦 Parquet workflow: Export parquets ⇉ Upload to R2 (pipelined)\n")
+        print(f"   Target dir: {PARQUET_DIR}\n")
+        os.environ["DATABASE_URL"] = _local_url()
+        conn = get_connection()
+        upload_conn = get_connection()
+        try:
+            paths, results, _ = export_and_upload(
+                conn, upload_conn, method=export_method, export_workers=export_workers,
+                force=force, layout=layout, profile=profile, jsonb=jsonb, ipc=ipc,
+                upload_workers=upload_workers, multipart=multipart,
+                check_remote=check_remote, key_scheme=key_scheme,
+            )
+        finally:
+            upload_conn.close()
+            conn.close()
+        print(f"\n✅ Exported {len(paths)} parquet files to {PARQUET_DIR}")
+        _print_upload_summary(results)
+        return
+
     print("📦 Parquet workflow: Export parquets → Upload to R2\n")
     print("=" * 60)
-    export_parquets()
+    export_parquets(
+        method=export_method, workers=export_workers, force=force, layout=layout,
+        profile=profile, jsonb=jsonb, ipc=ipc,
+    )
     print("\n" + "=" * 60)
-    upload_parquets()
+    upload_parquets(
+        workers=upload_workers, multipart=multipart, force=force,
+        check_remote=check_remote, key_scheme=key_scheme,
+    )
     print("\n" + "=" * 60)
     print("\n✅ Complete! Parquets exported and uploaded to R2.")
 
 
+@_timed("rollback-r2")
+def rollback_r2(table: str, sha256: str, partition: str = ""):
+    """Point a table's parquet_artifacts row back at an earlier generation.
+
+    No parquet object is touched; the bucket's manifest.json is re-uploaded
+    to match. The generation must have been uploaded under a
+    content-addressed key.
+    """
+    os.environ["DATABASE_URL"] = _local_url()
+    conn = get_connection()
+    try:
+        result = rollback_artifact(conn, table, sha256, partition_path=partition)
+    finally:
+        conn.close()
+    print(
+        f"\n✅ {table} now points at {result['object_key']} "
+        f"(uploaded {result['uploaded_at']:%Y-%m-%d %H:%M})"
+    )
+    if result["manifest_updated"]:
+        print("   manifest.json in the bucket points at it too.")
+    print("   Run verify-r2 to confirm the object is still in the bucket.")
+
+
 @_timed("verify-r2")
-def verify_r2():
+def verify_r2(mode: str = DEFAULT_VERIFY_MODE, workers: int | None = None):
     """Verify each R2 object matches its parquet_artifacts row.
 
-    Downloads each object, checks the PAR1 magic, recomputes sha256, and
-    compares against the recorded value. Exits non-zero if any mismatch.
+    deep: streams each object, checks both PAR1 magics, recomputes sha256,
+    and compares against the recorded value. fast: HEAD plus two 4-byte
+    Range GETs per object, comparing size, ETag and the sha256 metadata.
+    Objects are checked ``workers`` at a time and listed in table order.
+    Reports time, bytes fetched and peak Python memory for the mode. Exits
+    non-zero if any mismatch.
     """
-    print("🔍 Verifying R2 objects against parquet_artifacts metadata...\n")
+    print(f"🔍 Verifying R2 objects against parquet_artifacts metadata ({mode})...\n")
 
     os.environ["DATABASE_URL"] = _local_url()
     conn = get_connection()
+    tracemalloc.start()
+    start = time.perf_counter()
     try:
-        results = verify_all(conn)
+        results = verify_all(conn, mode=mode, max_workers=workers)
     finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
         conn.close()
 
     ok = [r for r in results if r["ok"]]
     bad = [r for r in results if not r["ok"]]
     for r in results:
         flag = "✓" if r["ok"] else "✗"
+        label = f"{r['table']}/{r['partition']}" if r.get("partition") else r["table"]
         if r["ok"]:
-            print(f"  {flag} {r['table']:<32} {r['size_bytes']:>10,} bytes")
+            print(f"  {flag} {label:<32} {r['size_bytes']:>10,} bytes")
         else:
-            print(f"  {flag} {r['table']:<32} {r['error']}")
+            print(f"  {flag} {label:<32} {r['error']}")
     print(f"\nResult: {len(ok)} ok, {len(bad)} failed")
+    bytes_read = sum(r.get("bytes_read", 0) for r in results)
+    print(
+        f"   {mode} mode: {elapsed:.1f}s, {bytes_read / 1024 / 1024:.1f}MB fetched, "
+        f"peak memory {peak / 1024 / 1024:.1f}MB"
+    )
     if bad:
         sys.exit(1)
     print("\n✅ All R2 objects verified.")
 
 
 @_timed("load-and-sync")
-def load_and_sync(year: int | None = None):
-    """Load local -> export parquets -> upload parquets to R2 -> sync to Neon."""
+def load_and_sync(
+    year: int | None = None,
+    workers: int | None = None,
+    export_method: str = DEFAULT_EXPORT_METHOD,
+    export_workers: int | None = None,
+    force: bool = False,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    profile: str = DEFAULT_EXPORT_PROFILE,
+    jsonb: str = DEFAULT_JSONB_MODE,
+    ipc: str = DEFAULT_IPC_MODE,
+    upload_workers: int | None = None,
+    multipart: MultipartConfig | None = None,
+    check_remote: bool = False,
+    key_scheme: str = DEFAULT_KEY_SCHEME,
+):
+    """Load local -> export parquets -> upload parquets to R2 -> sync to Neon.
+
+    The export and upload options are passed to export_parquets and
+    upload_parquets as in parquet_and_sync.
+    """
     print(
         "🚀 Full workflow: Load local → Export parquets → Upload to R2 → Upload to Neon\n"
     )
     print("=" * 60)
 
     # Step 1: Load locally
-    load_local(year=year)
+    load_local(year=year, workers=workers)
 
     print("\n" + "=" * 60)
 
     # Step 2: Export parquets (local files)
-    export_parquets()
+    export_parquets(
+        method=export_method, workers=export_workers, force=force, layout=layout,
+        profile=profile, jsonb=jsonb, ipc=ipc,
+    )
 
     print("\n" + "=" * 60)
 
     # Step 3: Upload parquets to R2 (records metadata in local Postgres
     # *before* the dump, so the parquet_artifacts table travels to Neon).
-    upload_parquets()
+    upload_parquets(
+        workers=upload_workers, multipart=multipart, force=force,
+        check_remote=check_remote, key_scheme=key_scheme,
+    )
 
     print("\n" + "=" * 60)
 
@@ -305,9 +490,15 @@ Examples:
   # Parquet pipeline (export + upload) without touching the database load
   uv run player-universe-load parquet-and-sync
 
+  # Same, uploading each table while the next ones export
+  uv run player-universe-load parquet-and-sync --pipeline
+
   # Verify R2 objects against the parquet_artifacts metadata (sha256 + PAR1)
   uv run player-universe-load verify-r2
 
+  # Point players back at an earlier uploaded generation (metadata only)
+  uv run player-universe-load rollback-r2 --table players --sha256 <sha256>
+
   # Verify database structure and counts
   uv run player-universe-load verify
         """,
@@ -323,7 +514,9 @@ Examples:
             "upload-parquets",
             "parquet-and-sync",
             "verify-r2",
+            "rollback-r2",
             "verify",
+            "direct-parquets",
         ],
         help="Command to execute",
     )
@@ -333,25 +526,226 @@ Examples:
         default=None,
         help="Season year to stamp on loaded rows (default: current year)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parallel league loads, one connection each "
+             "(default: one per league, capped at CPU count)",
+    )
+
+    parser.add_argument(
+        "--direct-parquet",
+        action="store_true",
+        help="load-local: also write players/stats/projections parquet straight "
+             "from the loaded rows, without reading them back from Postgres",
+    )
+    parser.add_argument(
+        "--verify-direct",
+        action="store_true",
+        help="load-local --direct-parquet: compare the direct files with a full "
+             "Postgres export of the same tables and fail on any difference",
+    )
+
+    parser.add_argument(
+        "--export-method",
+        choices=EXPORT_METHODS,
+        default=DEFAULT_EXPORT_METHOD,
+        help="How export-parquets reads tables: COPY ... TO STDOUT parsed by "
+             "pyarrow.csv, or a server-side cursor (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        default=None,
+        help=f"Tables exported concurrently, all reading one Postgres snapshot "
+             f"(default: {DEFAULT_EXPORT_WORKERS})",
+    )
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=None,
+        help=f"Concurrent R2 PUTs over one shared client "
+             f"(default: {DEFAULT_UPLOAD_WORKERS})",
+    )
+    parser.add_argument(
+        "--multipart-threshold-mb",
+        type=int,
+        default=MultipartConfig.threshold // 1024 // 1024,
+        help="Files at least this large upload as parallel multipart parts "
+             "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--part-size-mb",
+        type=int,
+        default=MultipartConfig.part_size // 1024 // 1024,
+        help="Multipart part size, minimum 5 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite every parquet even if its table fingerprint is unchanged; "
+             "re-upload every object even if its sha256 is already recorded",
+    )
+    parser.add_argument(
+        "--key-scheme",
+        choices=KEY_SCHEMES,
+        default=DEFAULT_KEY_SCHEME,
+        help="content: immutable <table>/<sha256>.parquet objects with "
+             "long-lived Cache-Control; fixed: overwrite <table>.parquet in "
+             "place (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--table",
+        help="rollback-r2: table whose parquet_artifacts pointer to move",
+    )
+    parser.add_argument(
+        "--sha256",
+        help="rollback-r2: sha256 of the generation to point back at",
+    )
+    parser.add_argument(
+        "--partition",
+        default="",
+        help="rollback-r2: Hive partition path, e.g. season_id=2026 "
+             "(default: the single-file artifact)",
+    )
+    parser.add_argument(
+        "--verify-mode",
+        choices=VERIFY_MODES,
+        default=DEFAULT_VERIFY_MODE,
+        help="verify-r2: fast checks HEAD metadata and the PAR1 magics only; "
+             "deep streams and re-hashes every object (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--verify-workers",
+        type=int,
+        default=None,
+        help=f"verify-r2: objects checked concurrently "
+             f"(default: {DEFAULT_VERIFY_WORKERS})",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="parquet-and-sync: upload each table as soon as it is exported, "
+             "overlapping export and upload, and report stage utilization",
+    )
+    parser.add_argument(
+        "--head-check",
+        action="store_true",
+        help="Before skipping an unchanged upload, HEAD the object and require "
+             "its sha256 metadata to match",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=EXPORT_LAYOUTS,
+        default=DEFAULT_EXPORT_LAYOUT,
+        help="hive: write stats/projections as Hive-partitioned datasets "
+             "(season_id=/stat_period=), one R2 object per partition "
+             "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=EXPORT_PROFILES,
+        default=DEFAULT_EXPORT_PROFILE,
+        help="compact: dictionary-encoded category columns and integer/float64 "
+             "instead of decimal128(18,3) (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--jsonb",
+        choices=JSONB_MODES,
+        default=DEFAULT_JSONB_MODE,
+        help="nested: write JSONB columns as inferred struct/map/list columns "
+             "instead of JSON strings (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--ipc",
+        choices=IPC_MODES,
+        default=DEFAULT_IPC_MODE,
+        help="Also write <table>.arrow (Arrow IPC) next to each parquet for "
+             "memory-mapped local reads; uncompressed is zero-copy "
+             "(default: %(default)s)",
+    )
 
     args = parser.parse_args()
+    try:
+        multipart = MultipartConfig(
+            threshold=args.multipart_threshold_mb * 1024 * 1024,
+            part_size=args.part_size_mb * 1024 * 1024,
+        )
+    except ValueError as e:
+        parser.error(str(e))
 
     if args.command == "load-and-sync":
-        load_and_sync(year=args.year)
+        load_and_sync(
+            year=args.year,
+            workers=args.workers,
+            export_method=args.export_method,
+            export_workers=args.export_workers,
+            force=args.force,
+            layout=args.layout,
+            profile=args.profile,
+            jsonb=args.jsonb,
+            ipc=args.ipc,
+            upload_workers=args.upload_workers,
+            multipart=multipart,
+            check_remote=args.head_check,
+            key_scheme=args.key_scheme,
+        )
     elif args.command == "load-local":
-        load_local(year=args.year)
+        if args.verify_direct and not args.direct_parquet:
+            parser.error("--verify-direct needs --direct-parquet")
+        load_local(
+            year=args.year,
+            workers=args.workers,
+            direct_parquet=args.direct_parquet,
+            layout=args.layout,
+            verify_direct=args.verify_direct,
+        )
     elif args.command == "sync-to-neon":
         sync_to_neon()
     elif args.command == "export-parquets":
-        export_parquets()
+        export_parquets(
+            method=args.export_method,
+            workers=args.export_workers,
+            force=args.force,
+            layout=args.layout,
+            profile=args.profile,
+            jsonb=args.jsonb,
+            ipc=args.ipc,
+        )
     elif args.command == "upload-parquets":
-        upload_parquets()
+        upload_parquets(
+            workers=args.upload_workers,
+            multipart=multipart,
+            force=args.force,
+            check_remote=args.head_check,
+            key_scheme=args.key_scheme,
+        )
     elif args.command == "parquet-and-sync":
-        parquet_and_sync()
+        parquet_and_sync(
+            export_method=args.export_method,
+            export_workers=args.export_workers,
+            force=args.force,
+            layout=args.layout,
+            profile=args.profile,
+            jsonb=args.jsonb,
+            ipc=args.ipc,
+            upload_workers=args.upload_workers,
+            multipart=multipart,
+            check_remote=args.head_check,
+            key_scheme=args.key_scheme,
+            pipelined=args.pipeline,
+        )
     elif args.command == "verify-r2":
-        verify_r2()
+        verify_r2(mode=args.verify_mode, workers=args.verify_workers)
+    elif args.command == "rollback-r2":
+        if not args.table or not args.sha256:
+            parser.error("rollback-r2 needs --table and --sha256")
+        rollback_r2(args.table, args.sha256, partition=args.partition)
     elif args.command == "verify":
         verify()
+    elif args.command == "direct-parquets":
+        direct_parquets(year=args.year, layout=args.layout)
 
     return 0
 
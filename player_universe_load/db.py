@@ -3,6 +3,7 @@
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -72,6 +73,64 @@ def init_schema(conn) -> None:
     print("✓ Schema initialized")
 
 
+# Tables declared ``PARTITION BY LIST (season_id)`` in schemas/07-11. Order
+# matters: player_valuation_details' FK is cloned onto its partition at
+# ATTACH time and needs the player_valuations partition in place first.
+SEASON_PARTITIONED_TABLES: tuple[str, ...] = (
+    "player_stats_batting",
+    "player_stats_pitching",
+    "player_projections",
+    "player_valuations",
+    "player_valuation_details",
+)
+
+
+def ensure_season_partitions(conn, season_id: int) -> list[str]:
+    """Create and attach ``<table>_<season_id>`` for each season-partitioned table.
+
+    Each missing partition is built detached (``LIKE`` the parent), given a
+    ``CHECK (season_id = ...)`` so ATTACH can skip its validation scan, then
+    attached. Existing partitions are left alone, so loading a new season
+    never touches the historical ones. Returns the partitions created.
+    """
+    created = []
+    with conn.cursor() as cur:
+        for table in SEASON_PARTITIONED_TABLES:
+            partition = f"{table}_{season_id}"
+            cur.execute("SELECT to_regclass(%s)", (partition,))
+            if cur.fetchone()[0] is not None:
+                continue
+            cur.execute(f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)")
+            cur.execute(
+                f"ALTER TABLE {partition} ADD CONSTRAINT {partition}_season "
+                "CHECK (season_id = %s)",
+                (season_id,),
+            )
+            cur.execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES IN (%s)",
+                (season_id,),
+            )
+            # The partition bound now enforces the same rule.
+            cur.execute(f"ALTER TABLE {partition} DROP CONSTRAINT {partition}_season")
+            created.append(partition)
+    conn.commit()
+    if created:
+        console.print(
+            f"   [green]✓[/green] Attached [bold]{len(created)}[/bold] "
+            f"season [cyan]{season_id}[/cyan] partitions"
+        )
+    return created
+
+
+# Tables bulk_insert upserts (ON CONFLICT (...) DO UPDATE) instead of
+# ON CONFLICT DO NOTHING, keyed by their conflict target. Two-way players
+# produce the same (player, season, period) stats row twice.
+UPSERT_CONFLICT_KEYS: dict[str, tuple[str, ...]] = {
+    "player_stats_batting": ("player_id", "season_id", "stat_period"),
+    "player_stats_pitching": ("player_id", "season_id", "stat_period"),
+}
+
+
 def bulk_insert(
     conn,
     table: str,
@@ -93,19 +152,22 @@ def bulk_insert(
         cols = ",".join(f'"{c}"' for c in columns)
 
         # For player_stats tables, use ON CONFLICT DO UPDATE to handle two-way players
-        if table in ("player_stats_batting", "player_stats_pitching"):
-            update_cols = [
-                c for c in columns if c not in ("player_id", "season_id", "stat_period")
-            ]
+        if table in UPSERT_CONFLICT_KEYS:
+            conflict_cols = UPSERT_CONFLICT_KEYS[table]
+            update_cols = [c for c in columns if c not in conflict_cols]
             updates = ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in update_cols)
-            sql = f"INSERT INTO {table} ({cols}) VALUES ({placeholders}) ON CONFLICT (player_id, season_id, stat_period) DO UPDATE SET {updates}"
+            target = ", ".join(conflict_cols)
+            sql = f"INSERT INTO {table} ({cols}) VALUES ({placeholders}) ON CONFLICT ({target}) DO UPDATE SET {updates}"
         else:
             sql = f"INSERT INTO {table} ({cols}) VALUES ({placeholders}) ON CONFLICT DO NOTHING"
 
         # Live progress bar only for batched inserts. Small inserts skip
         # the bar AND skip the "✓ Inserted" summary line — they happen too
-        # fast to be worth either log artifact.
-        if len(rows) > 100:
+        # fast to be worth either log artifact. Rich allows one live display
+        # per console, so worker threads (parallel league loads) batch
+        # without a bar and log the one-line summary instead.
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        if len(rows) > 100 and on_main_thread:
             batch_size = 100
             # transient=False — Postgres inserts are network/SQL API work,
             # persist the bar so elapsed time stays in the log. The persisted
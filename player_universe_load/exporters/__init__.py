@@ -1,15 +1,76 @@
 """Exporters: emit data artifacts derived from the loaded Postgres tables."""
 
-from .parquet import EXPORTED_TABLES, PARQUET_DIR, export_all, export_table
-from .r2 import R2Config, upload_all, upload_table, verify_all, verify_table
+from .direct import DIRECT_TABLES, DirectParquetSink, check_direct_export
+from .parquet import (
+    DEFAULT_EXPORT_LAYOUT,
+    DEFAULT_EXPORT_METHOD,
+    DEFAULT_EXPORT_PROFILE,
+    DEFAULT_EXPORT_WORKERS,
+    DEFAULT_IPC_MODE,
+    DEFAULT_JSONB_MODE,
+    EXPORT_LAYOUTS,
+    EXPORT_METHODS,
+    EXPORT_PROFILES,
+    EXPORTED_TABLES,
+    IPC_MODES,
+    JSONB_MODES,
+    PARQUET_DIR,
+    export_all,
+    export_table,
+)
+from .pipeline import export_and_upload
+from .r2 import (
+    DEFAULT_KEY_SCHEME,
+    DEFAULT_UPLOAD_WORKERS,
+    DEFAULT_VERIFY_MODE,
+    DEFAULT_VERIFY_WORKERS,
+    KEY_SCHEMES,
+    VERIFY_MODES,
+    MultipartConfig,
+    R2Config,
+    UploadPipeline,
+    rollback_artifact,
+    upload_all,
+    upload_dataset,
+    upload_table,
+    verify_all,
+    verify_table,
+)
+from .wide import WIDE_TABLE
 
 __all__ = [
+    "DIRECT_TABLES",
+    "DEFAULT_EXPORT_LAYOUT",
+    "DEFAULT_EXPORT_METHOD",
+    "DEFAULT_EXPORT_PROFILE",
+    "DEFAULT_EXPORT_WORKERS",
+    "DEFAULT_IPC_MODE",
+    "DEFAULT_JSONB_MODE",
+    "DEFAULT_KEY_SCHEME",
+    "DEFAULT_UPLOAD_WORKERS",
+    "DEFAULT_VERIFY_MODE",
+    "DEFAULT_VERIFY_WORKERS",
+    "EXPORT_LAYOUTS",
+    "EXPORT_METHODS",
+    "EXPORT_PROFILES",
     "EXPORTED_TABLES",
+    "IPC_MODES",
+    "JSONB_MODES",
+    "KEY_SCHEMES",
     "PARQUET_DIR",
+    "VERIFY_MODES",
+    "WIDE_TABLE",
+    "DirectParquetSink",
+    "MultipartConfig",
     "R2Config",
+    "UploadPipeline",
+    "check_direct_export",
     "export_all",
+    "export_and_upload",
     "export_table",
+    "rollback_artifact",
     "upload_all",
+    "upload_dataset",
     "upload_table",
     "verify_all",
     "verify_table",
@@ -0,0 +1,362 @@
+"""Write parquet straight from the loader's prepared rows.
+
+export-parquets reads every table back out of Postgres after load-local put
+it there. For the tables load_players fills (DIRECT_TABLES) the loader
+already holds every row, so DirectParquetSink collects the batches handed
+to bulk_insert, replays what Postgres does with them (ON CONFLICT handling,
+SERIAL ids, column defaults, typmod rounding) and writes the same parquet
+export_table would. check_direct_export compares the result against a
+Postgres-sourced export and, when they match, adopts that export's sidecar
+so the next export-parquets run skips the table.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import tempfile
+import threading
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ..db import UPSERT_CONFLICT_KEYS, console
+from .manifest import SIDECAR_FILES_KEY
+from .parquet import (
+    DEFAULT_EXPORT_LAYOUT,
+    DEFAULT_ROW_GROUP_SIZE,
+    EXPORT_BATCH_SIZE,
+    EXPORT_LAYOUTS,
+    FINGERPRINT_EXCLUDED_COLUMNS,
+    NUMERIC_QUANTUM,
+    SIDECAR_SUFFIX,
+    arrow_schema_for,
+    export_table,
+    read_sidecar,
+    rewrite_manifest,
+    sort_columns,
+    table_columns,
+    write_sidecar,
+    write_table_files,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tables written only by load_players; nothing else inserts into them, so
+# the loader's rows are the whole table.
+DIRECT_TABLES: tuple[str, ...] = (
+    "players",
+    "player_stats_batting",
+    "player_stats_pitching",
+    "player_projections",
+)
+
+# Unique constraints that can reject a row under ON CONFLICT DO NOTHING, in
+# constraint-check order. NULL never conflicts. Upsert tables conflict only
+# on their UPSERT_CONFLICT_KEYS target.
+_UNIQUE_KEYS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "players": (("id_espn",), ("id_xmlbam",)),
+    "player_projections": (
+        ("player_id", "season_id", "projection_source", "projection_period", "player_type"),
+    ),
+}
+
+_DEFAULT_LITERAL = re.compile(r"^'(.*)'::[a-z ]+$", re.DOTALL)
+
+
+def _unique_keys(table: str) -> tuple[tuple[str, ...], ...]:
+    if table in UPSERT_CONFLICT_KEYS:
+        return (UPSERT_CONFLICT_KEYS[table],)
+    return _UNIQUE_KEYS[table]
+
+
+def _jsonb_value(value: Any) -> Any:
+    """``value`` as it comes back out of a jsonb column via psycopg2.
+
+    jsonb stores object keys ordered by length then bytes, prints numbers
+    in plain (non-exponent) notation, so 1e+16 comes back as an int, and
+    has no negative zero.
+    """
+    if isinstance(value, dict):
+        ordered = sorted(value, key=lambda k: (len(k.encode()), k.encode()))
+        return {k: _jsonb_value(value[k]) for k in ordered}
+    if isinstance(value, list):
+        return [_jsonb_value(v) for v in value]
+    if isinstance(value, float) and value == 0:
+        return 0.0
+    if isinstance(value, float) and "e" in repr(value):
+        exact = Decimal(repr(value))
+        exponent = exact.as_tuple().exponent
+        # inf/nan carry a str exponent ('F', 'n', 'N').
+        if exact.is_finite() and isinstance(exponent, int) and exponent >= 0:
+            return int(exact)
+    return value
+
+
+def _jsonb_text(value: Any) -> str | None:
+    """The string the exporter writes for a jsonb value (see _stringify_jsonb)."""
+    if value is None:
+        return None
+    parsed = json.loads(value) if isinstance(value, str) else value
+    if isinstance(parsed, str):
+        return parsed
+    return json.dumps(_jsonb_value(parsed), default=str)
+
+
+def _numeric(value: Any, scale: int | None) -> Decimal | None:
+    """What Postgres stores for ``value`` in NUMERIC(_, scale), export-rounded."""
+    if value is None:
+        return None
+    # psycopg2 sends floats as their repr; Postgres parses that exactly.
+    exact = Decimal(repr(value)) if isinstance(value, float) else Decimal(str(value))
+    if not exact.is_finite():
+        return None
+    if scale is not None:
+        exact = exact.quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+    return exact.quantize(NUMERIC_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def _coerce(value: Any, pg_type: str, scale: int | None) -> Any:
+    """Apply the assignment cast Postgres would for a ``pg_type`` column."""
+    if value is None:
+        return None
+    if pg_type == "numeric":
+        return _numeric(value, scale)
+    if pg_type in ("smallint", "integer", "bigint"):
+        if isinstance(value, float):
+            return int(Decimal(repr(value)).to_integral_value(rounding=ROUND_HALF_UP))
+        return int(value)
+    if pg_type in ("text", "character varying", "character"):
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float):
+            return repr(value)
+        return str(value)
+    if pg_type == "jsonb":
+        return _jsonb_text(value)
+    if pg_type == "date" and isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+class _TableSpec:
+    """Per-table column metadata DirectParquetSink.write needs (no DB access)."""
+
+    def __init__(self, conn, table: str):
+        self.cols = table_columns(conn, table)
+        self.schema = arrow_schema_for(conn, table)
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT column_name, numeric_scale, column_default "
+                "FROM information_schema.columns WHERE table_name = %s",
+                (table,),
+            )
+            meta = cur.fetchall()
+        self.scales = {name: scale for name, scale, _ in meta}
+        self.defaults = {name: default for name, _, default in meta if default is not None}
+
+    def default(self, column: str, serial: int, loaded_at: datetime) -> Any:
+        """Value Postgres fills in for an omitted column."""
+        expr = self.defaults.get(column)
+        if expr is None:
+            return None
+        if expr.startswith("nextval("):
+            return serial
+        if expr.upper() in ("CURRENT_TIMESTAMP", "NOW()"):
+            return loaded_at
+        literal = _DEFAULT_LITERAL.match(expr)
+        return literal.group(1).replace("''", "'") if literal else None
+
+
+class DirectParquetSink:
+    """Collects loader rows for DIRECT_TABLES and writes them as parquet.
+
+    ``add`` mirrors bulk_insert: rows are applied one at a time, in order,
+    with ON CONFLICT DO UPDATE for UPSERT_CONFLICT_KEYS tables and ON
+    CONFLICT DO NOTHING for the rest. Every row consumes a SERIAL value
+    whether or not it is kept, as nextval() does. ``bind`` reads column
+    metadata once; ``write`` then needs no database, so it can run in a
+    thread while the load carries on.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[str, list[dict[str, Any]]] = {t: [] for t in DIRECT_TABLES}
+        self._index: dict[str, dict[tuple[str, ...], dict[tuple, dict]]] = {
+            t: {key: {} for key in _unique_keys(t)} for t in DIRECT_TABLES
+        }
+        self._attempts: dict[str, int] = {t: 0 for t in DIRECT_TABLES}
+        self._specs: dict[str, _TableSpec] = {}
+        self._loaded_at = datetime.now()
+        self._lock = threading.Lock()
+
+    def add(self, table: str, columns: list[str], rows: list[tuple]) -> None:
+        """Apply one bulk_insert batch; tables outside DIRECT_TABLES are ignored."""
+        if table not in self._rows:
+            return
+        keys = _unique_keys(table)
+        upsert = UPSERT_CONFLICT_KEYS.get(table)
+        with self._lock:
+            for row in rows:
+                self._attempts[table] += 1
+                record = dict(zip(columns, row))
+                existing = None
+                for key in keys:
+                    value = tuple(record.get(c) for c in key)
+                    if None not in value and value in self._index[table][key]:
+                        existing = self._index[table][key][value]
+                        break
+                if existing is None:
+                    record["_serial"] = self._attempts[table]
+                    self._rows[table].append(record)
+                    for key in keys:
+                        value = tuple(record.get(c) for c in key)
+                        if None not in value:
+                            self._index[table][key][value] = record
+                elif upsert:
+                    existing.update((c, v) for c, v in record.items() if c not in upsert)
+
+    def row_count(self, table: str) -> int:
+        return len(self._rows[table])
+
+    def bind(self, conn) -> None:
+        """Read column metadata for every DIRECT_TABLES table from ``conn``."""
+        for table in DIRECT_TABLES:
+            self._specs[table] = _TableSpec(conn, table)
+
+    def _arrow_table(self, table: str) -> pa.Table:
+        spec = self._specs[table]
+        records = []
+        for rec in self._rows[table]:
+            out = {}
+            for name, pg_type in spec.cols:
+                if name in rec:
+                    out[name] = _coerce(rec[name], pg_type, spec.scales.get(name))
+                else:
+                    out[name] = spec.default(name, rec["_serial"], self._loaded_at)
+            records.append(out)
+        data = pa.Table.from_pylist(records, schema=spec.schema)
+        sort_keys = sort_columns(table)
+        if sort_keys and data.num_rows:
+            # Arrow compares strings bytewise, like the export's COLLATE "C",
+            # and places nulls last by default, like its NULLS LAST.
+            data = data.sort_by(
+                [(name, "descending" if desc else "ascending") for name, desc in sort_keys]
+            )
+        return data
+
+    def write_table(
+        self,
+        table: str,
+        target_dir: Path,
+        *,
+        layout: str = DEFAULT_EXPORT_LAYOUT,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> Path:
+        """Write one table the way export_table lays it out; return its path.
+
+        Any sidecar is removed: there is no Postgres fingerprint for these
+        rows until check_direct_export confirms them. manifest.json is left
+        for the caller (write rewrites it).
+        """
+        if layout not in EXPORT_LAYOUTS:
+            raise ValueError(f"Unknown export layout {layout!r}; expected one of {EXPORT_LAYOUTS}")
+        if table not in self._specs:
+            raise RuntimeError(f"DirectParquetSink.bind() not called before writing {table}")
+        (target_dir / f"{table}{SIDECAR_SUFFIX}").unlink(missing_ok=True)
+        data = self._arrow_table(table)
+        final, _ = write_table_files(
+            table, target_dir, self._specs[table].schema,
+            data.to_batches(max_chunksize=EXPORT_BATCH_SIZE),
+            row_count=data.num_rows, layout=layout, row_group_size=row_group_size,
+        )
+        logger.info("Wrote %d rows to %s directly from the loader", data.num_rows, final)
+        return final
+
+    def write(
+        self,
+        target_dir: Path,
+        *,
+        layout: str = DEFAULT_EXPORT_LAYOUT,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> list[Path]:
+        """Write every DIRECT_TABLES table; return paths in DIRECT_TABLES order.
+
+        ``target_dir/manifest.json`` is then rewritten (see
+        rewrite_manifest) so it describes the new files, not the ones they
+        replaced.
+        """
+        paths = []
+        for table in DIRECT_TABLES:
+            paths.append(self.write_table(
+                table, target_dir, layout=layout, row_group_size=row_group_size
+            ))
+            console.print(
+                f"   [green]✓[/green] {table:<28} [dim]{self.row_count(table):,} rows "
+                "(direct)[/dim]"
+            )
+        rewrite_manifest(target_dir)
+        return paths
+
+
+def _read_for_compare(path: Path, table: str) -> pa.Table:
+    """Read an exported file or dataset, minus audit columns, in key order."""
+    if path.is_dir():
+        data = ds.dataset(path, format="parquet", partitioning="hive").to_table()
+    else:
+        data = pq.read_table(path)
+    data = data.drop_columns([c for c in data.column_names if c in FINGERPRINT_EXCLUDED_COLUMNS])
+    # Rows tied on SORT_KEYS come back in arbitrary order from Postgres.
+    key = _unique_keys(table)[0]
+    return data.sort_by([(c, "ascending") for c in key]).select(sorted(data.column_names))
+
+
+def check_direct_export(
+    conn,
+    target_dir: Path,
+    tables: tuple[str, ...] = DIRECT_TABLES,
+    *,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> list[str]:
+    """Compare directly written parquet with a Postgres export; return mismatches.
+
+    Each table is exported from ``conn`` into a scratch directory and both
+    are compared ignoring FINGERPRINT_EXCLUDED_COLUMNS (the loader can't
+    know Postgres' transaction timestamps). A matching table gets the
+    scratch export's sidecar (minus its per-file hashes), so export-parquets
+    treats the direct file as current, and manifest.json is rewritten to
+    carry its fingerprint.
+    """
+    mismatched = []
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch_dir = Path(scratch)
+        for table in tables:
+            reference = export_table(
+                conn, table, target_dir=scratch_dir, force=True,
+                layout=layout, row_group_size=row_group_size,
+            )
+            direct = target_dir / reference.name
+            if direct.exists() and _read_for_compare(direct, table).equals(
+                _read_for_compare(reference, table)
+            ):
+                # The per-file hashes describe the scratch files, not these.
+                scratch_sidecar = scratch_dir / f"{table}{SIDECAR_SUFFIX}"
+                meta = read_sidecar(scratch_sidecar)
+                if meta is None:
+                    raise RuntimeError(
+                        f"Reference export of {table} left no readable sidecar "
+                        f"at {scratch_sidecar}"
+                    )
+                meta.pop(SIDECAR_FILES_KEY, None)
+                write_sidecar(target_dir / f"{table}{SIDECAR_SUFFIX}", meta)
+            else:
+                mismatched.append(table)
+    if len(mismatched) < len(tables):
+        rewrite_manifest(target_dir)
+    return mismatched
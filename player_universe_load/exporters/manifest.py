@@ -0,0 +1,192 @@
+"""``manifest.json``: one small index of every parquet in the analytics dir.
+
+Without it a consumer learns what an export holds by opening each parquet
+footer or by querying ``parquet_artifacts`` over Neon. export_all writes the
+manifest after every run, listing each artifact (each Hive partition file
+separately, like parquet_artifacts) with:
+
+- ``path``, relative to the analytics dir, plus ``table`` and
+  ``partition_path`` ('' for single files);
+- ``row_count``, ``size_bytes`` and ``sha256`` of the file;
+- ``schema`` (the file's Arrow column names and types) and ``schema_hash``,
+  its sha256, so readers can tell "same shape" with one string compare;
+- ``fingerprint`` (the table's content hash from its sidecar), ``profile``,
+  ``sort_keys`` and ``partition_keys``;
+- ``columns``: per leaf column (``birth_place.city``), ``null_count``,
+  ``min`` and ``max`` aggregated over row groups. ``min`` / ``max`` are null
+  when a row group with values lacks statistics; decimals are exact strings
+  and temporal values ISO 8601.
+
+Clients fetch manifest.json, compare sha256 or fingerprint with what they
+hold, and only then fetch files. It is written tmp + rename like every
+other artifact here.
+
+sha256 normally comes from the sidecar's SIDECAR_FILES_KEY entries, hashed
+by the exporter while it wrote each file; a file is only read to hash it
+when neither the sidecar nor the previous manifest still describes it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pyarrow.parquet as pq
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Sidecar key holding {partition_path: {sha256, size_bytes, row_count,
+# mtime_ns}} for every file the export wrote ('' for single files).
+SIDECAR_FILES_KEY = "files"
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Stream-hash a file to keep peak memory bounded for large parquets."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def sidecar_file_entry(
+    sidecar: dict | None, partition_path: str, st: os.stat_result
+) -> dict | None:
+    """The sidecar's entry for one exported file, if it still describes it.
+
+    Trusted only while the file on disk has the recorded size and mtime,
+    i.e. nothing rewrote it after the exporter hashed it.
+    """
+    entry = ((sidecar or {}).get(SIDECAR_FILES_KEY) or {}).get(partition_path)
+    if entry and entry.get("size_bytes") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+        return entry
+    return None
+
+
+def _json_stat(value: Any) -> Any:
+    """A parquet statistics value as something json.dumps writes losslessly."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return None
+    return value
+
+
+def _schema_hash(schema) -> str:
+    """sha256 of an Arrow schema's column names and types (no metadata)."""
+    spec = json.dumps([[f.name, str(f.type)] for f in schema])
+    return hashlib.sha256(spec.encode()).hexdigest()
+
+
+def _column_stats(meta: pq.FileMetaData) -> dict[str, dict[str, Any]]:
+    """Per-leaf-column null count and min/max over all row groups."""
+    stats: dict[str, dict[str, Any]] = {}
+    for i in range(meta.num_columns):
+        null_count: int | None = 0
+        lo = hi = None
+        bounded = True
+        for rg in range(meta.num_row_groups):
+            s = meta.row_group(rg).column(i).statistics
+            if s is None:
+                null_count, bounded = None, False
+                continue
+            if null_count is not None:
+                null_count = null_count + s.null_count if s.has_null_count else None
+            if not s.has_min_max:
+                # An all-null row group has no min/max and needs none.
+                bounded = bounded and s.num_values == 0
+                continue
+            lo = s.min if lo is None else min(lo, s.min)
+            hi = s.max if hi is None else max(hi, s.max)
+        if not bounded:
+            lo = hi = None
+        stats[meta.schema.column(i).path] = {
+            "null_count": null_count, "min": _json_stat(lo), "max": _json_stat(hi),
+        }
+    return stats
+
+
+def _artifact_files(target_dir: Path, final: Path) -> list[tuple[str, Path]]:
+    """[(partition_path, file), ...] for one exported table."""
+    if final.is_dir():
+        return sorted(
+            (f.parent.relative_to(final).as_posix(), f) for f in final.rglob("*.parquet")
+        )
+    return [("", final)]
+
+
+def read_manifest(target_dir: Path) -> dict | None:
+    """The manifest in ``target_dir``, or None if missing or unreadable."""
+    try:
+        return json.loads((target_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(
+    target_dir: Path,
+    tables: list[tuple[str, Path, dict | None]],
+) -> Path:
+    """Write ``target_dir/manifest.json`` for ``(table, final_path, sidecar)``.
+
+    ``final_path`` is what export_table returned (file or dataset dir) and
+    ``sidecar`` that table's ``.meta.json`` content. A file's sha256 comes
+    from the sidecar entry written with it, else from the previous manifest
+    when size and mtime match (skip-unchanged left the file untouched); only
+    failing both is the file re-read.
+    """
+    previous = {
+        a["path"]: a for a in (read_manifest(target_dir) or {}).get("artifacts", [])
+    }
+    artifacts = []
+    for table, final, sidecar in tables:
+        sidecar = sidecar or {}
+        for partition_path, path in _artifact_files(target_dir, final):
+            rel = path.relative_to(target_dir).as_posix()
+            st = path.stat()
+            old = previous.get(rel)
+            written = sidecar_file_entry(sidecar, partition_path, st)
+            if written:
+                sha256 = written["sha256"]
+            elif old and old.get("size_bytes") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+                sha256 = old["sha256"]
+            else:
+                sha256 = sha256_file(path)
+            pf = pq.ParquetFile(path)
+            artifacts.append({
+                "table": table,
+                "path": rel,
+                "partition_path": partition_path,
+                "row_count": pf.metadata.num_rows,
+                "size_bytes": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": sha256,
+                "schema": [[f.name, str(f.type)] for f in pf.schema_arrow],
+                "schema_hash": _schema_hash(pf.schema_arrow),
+                "fingerprint": sidecar.get("fingerprint"),
+                "profile": sidecar.get("profile"),
+                "sort_keys": sidecar.get("sort_keys", []),
+                "partition_keys": sidecar.get("partition_keys", []),
+                "columns": _column_stats(pf.metadata),
+            })
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "artifacts": artifacts,
+    }
+    final_path = target_dir / MANIFEST_NAME
+    tmp = final_path.with_name(final_path.name + ".tmp")
+    # Compact: the wide table alone carries ~1,500 column entries.
+    tmp.write_text(json.dumps(manifest, separators=(",", ":")) + "\n")
+    tmp.rename(final_path)
+    return final_path
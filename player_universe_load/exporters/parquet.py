@@ -7,13 +7,26 @@ or duplicates.
 
 from __future__ import annotations
 
+import hashlib
+import inspect
 import json
 import logging
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
+from typing import Any
 
 import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 from rich.progress import (
     BarColumn,
@@ -24,20 +37,154 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from ..db import console
+from ..db import console, get_connection
+from .manifest import MANIFEST_NAME, SIDECAR_FILES_KEY, write_manifest
+from .wide import WIDE_TABLE, wide_column_types, wide_select_sql
 
 # All NUMERIC values are stored as decimal128(18, 3): 15 integer digits + 3
 # fractional digits, lossless within that range. Quantize with ROUND_HALF_UP
 # so .5 rounds up (regulatory accounting convention), not banker's rounding.
 _NUMERIC_PRECISION = 18
 _NUMERIC_SCALE = 3
-_QUANTUM = Decimal("0.001")
+NUMERIC_QUANTUM = Decimal("0.001")
 
 logger = logging.getLogger(__name__)
 
 PARQUET_DIR = Path("/Users/Shared/BaseballHQ/resources/analytics")
 
-# Mirrors the schema in player_universe_load/schemas/ (minus parquet_artifacts).
+# Rows pulled per fetchmany() from the server-side cursor. Each chunk becomes
+# one RecordBatch / row group, so this bounds exporter memory per table.
+EXPORT_BATCH_SIZE = 50_000
+
+# How export_table pulls rows out of Postgres:
+#   "copy"   - COPY (SELECT ...) TO STDOUT as CSV, parsed by pyarrow.csv
+#              straight into typed columns. NUMERIC rounding happens in SQL.
+#   "cursor" - server-side cursor -> Python dicts -> RecordBatch.from_pylist.
+# Both produce identical parquet data; "copy" skips per-value Python objects.
+EXPORT_METHODS: tuple[str, ...] = ("copy", "cursor")
+DEFAULT_EXPORT_METHOD = "copy"
+
+# Column types the CSV path can't parse back into their _PG_TO_ARROW type;
+# tables containing any of them are exported through the cursor path.
+_COPY_UNSUPPORTED_TYPES = frozenset(("bytea", "ARRAY", "json"))
+
+# Export layouts:
+#   "file" - one <table>.parquet per table.
+#   "hive" - tables in HIVE_PARTITION_KEYS become Hive-partitioned dataset
+#            directories (<table>/season_id=2026/stat_period=.../part-0.parquet)
+#            so readers can prune partitions before fetching; the rest stay
+#            single files.
+EXPORT_LAYOUTS: tuple[str, ...] = ("file", "hive")
+DEFAULT_EXPORT_LAYOUT = "file"
+HIVE_PARTITION_KEYS: dict[str, tuple[str, ...]] = {
+    "player_stats_batting": ("season_id", "stat_period"),
+    "player_stats_pitching": ("season_id", "stat_period"),
+    "player_projections": ("season_id", "projection_source"),
+    WIDE_TABLE: ("season_id",),
+}
+
+# Column type profiles:
+#   "exact"   - NUMERIC as decimal128(18, 3), strings as plain strings. Lossless
+#               within range; the default.
+#   "compact" - DICTIONARY_COLUMNS become dictionary<int32, string> (pandas
+#               categoricals, Polars Categorical); NUMERIC with scale 0
+#               becomes int32/int64 by precision and every other NUMERIC
+#               (including unconstrained stat columns) float64.
+#               Cheaper to decode, but float64 is not exact for money-like
+#               values, so it is opt-in.
+EXPORT_PROFILES: tuple[str, ...] = ("exact", "compact")
+DEFAULT_EXPORT_PROFILE = "exact"
+DICTIONARY_COLUMNS = frozenset((
+    "stat_period", "valuation_type", "projection_source", "projection_period",
+    "player_type", "lineup_slot", "tier", "primary_position", "position",
+    "role", "stat_category",
+))
+_DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# How JSONB columns are written:
+#   "string" - JSON text; readers json.loads() each value.
+#   "nested" - one Arrow type inferred per column from its values (struct
+#              with nullable fields, map<string, T>, list<T>), so readers
+#              can select projections.HR without parsing. A column whose
+#              values don't unify into one type (e.g. objects in some rows,
+#              arrays in others) stays a JSON string column.
+JSONB_MODES: tuple[str, ...] = ("string", "nested")
+DEFAULT_JSONB_MODE = "string"
+# JSONB objects keyed by data rather than by a fixed set of names; written
+# as map<string, T> instead of a struct.
+JSONB_MAP_COLUMNS = frozenset(("eligible_date_by_position",))
+# Objects with more distinct keys than this become maps, not structs.
+_MAX_STRUCT_FIELDS = 256
+
+# Arrow IPC (Feather v2) side outputs, <table>.arrow next to the parquet, for
+# notebooks on the same machine that would otherwise decompress and decode
+# the parquet on every open:
+#   "off"          - parquet only.
+#   "uncompressed" - raw buffers; ``pa.ipc.open_file(pa.memory_map(path))``
+#                    reads them zero-copy from the page cache.
+#   "lz4"          - LZ4_FRAME-compressed buffers: smaller, but each read
+#                    decompresses, so memory-mapping saves only the decode.
+# The .arrow file holds the whole table whatever the layout. "compact"
+# dictionary columns are plain strings there: the IPC file format allows one
+# dictionary per column and every exported batch brings its own.
+IPC_MODES: tuple[str, ...] = ("off", "uncompressed", "lz4")
+DEFAULT_IPC_MODE = "off"
+IPC_SUFFIX = ".arrow"
+
+# Natural access key per table; exports are written in this order so row
+# group / page min-max statistics on the leading key actually prune. Append
+# " DESC" for descending. Tables not listed keep heap order.
+SORT_KEYS: dict[str, tuple[str, ...]] = {
+    "players": ("id_espn",),
+    "roster_slots": ("team_id", "player_id"),
+    "player_fantasy_assignments": ("player_id", "league_id"),
+    "player_stats_batting": ("player_id", "stat_period"),
+    "player_stats_pitching": ("player_id", "stat_period"),
+    "player_projections": ("player_id", "projection_source", "projection_period"),
+    "player_valuations": ("valuation_type", "primary_position", "total_dollars DESC"),
+    "player_valuation_details": ("valuation_id", "stat_category"),
+    "position_summary": ("valuation_type", "position"),
+    WIDE_TABLE: ("player_id", "season_id"),
+}
+
+# Rows per parquet row group. Smaller groups prune finer on point lookups;
+# larger ones compress better and cost less footer metadata.
+DEFAULT_ROW_GROUP_SIZE = 16_384
+
+# Point-lookup columns that get a bloom filter in every row group.
+BLOOM_FILTER_COLUMNS: tuple[str, ...] = ("player_id", "id_espn")
+BLOOM_FILTER_FPP = 0.05
+# bloom_filter_options landed in pyarrow's ParquetWriter after our minimum
+# supported version; older pyarrow writes everything else unchanged.
+_SUPPORTS_BLOOM_FILTERS = (
+    "bloom_filter_options" in inspect.signature(pq.ParquetWriter.__init__).parameters
+)
+
+# Sidecar written next to each parquet: row count, content fingerprint and
+# schema of what the file holds. export_table skips tables whose current
+# fingerprint matches. Its SIDECAR_FILES_KEY entry records each written
+# file's sha256, size, row count and mtime, hashed as the bytes were written,
+# so the manifest and R2 upload don't read the file again to hash it.
+SIDECAR_SUFFIX = ".meta.json"
+
+# Parquet writers emit many small writes (page headers, footer pieces);
+# buffering them in front of the hashing sink keeps the per-call Python
+# cost off the write path.
+_HASH_BUFFER_SIZE = 1 << 20
+
+# Audit timestamps are reset by every load (the schema is rebuilt), so they
+# would defeat skip-unchanged. A skipped file keeps the audit values from
+# the run that wrote it.
+FINGERPRINT_EXCLUDED_COLUMNS = frozenset(("created_at", "updated_at"))
+
+# Tables exported concurrently by export_all, one connection each.
+DEFAULT_EXPORT_WORKERS = 4
+
+# Bytes of CSV pyarrow parses per block when reading a COPY spool.
+_COPY_BLOCK_SIZE = 8 << 20
+
+# Mirrors the schema in player_universe_load/schemas/ (minus parquet_artifacts),
+# plus the derived player_universe_wide query (see exporters/wide.py).
 # Add a new entry here when a new table is added to the schema.
 EXPORTED_TABLES: tuple[str, ...] = (
     "players",
@@ -54,13 +201,23 @@ EXPORTED_TABLES: tuple[str, ...] = (
     "player_valuations",
     "player_valuation_details",
     "position_summary",
+    WIDE_TABLE,
 )
 # Note: parquet_artifacts is intentionally excluded — it's the Postgres-side
 # join point pointing AT the R2 objects, not itself an exported artifact.
 
 
-def _table_columns(conn, table: str) -> list[tuple[str, str]]:
+def _table_source(table: str) -> sql.Composable:
+    """What an export reads ``FROM``: the table, or WIDE_TABLE's SELECT."""
+    if table == WIDE_TABLE:
+        return sql.SQL("({}) AS {}").format(wide_select_sql(), sql.Identifier(table))
+    return sql.Identifier(table)
+
+
+def table_columns(conn, table: str) -> list[tuple[str, str]]:
     """Return [(column_name, data_type), ...] from information_schema."""
+    if table == WIDE_TABLE:
+        return [(name, data_type) for name, data_type, _, _ in wide_column_types(conn)]
     with conn.cursor() as cur:
         cur.execute(
             "SELECT column_name, data_type FROM information_schema.columns "
@@ -102,16 +259,71 @@ _PG_TO_ARROW = {
 }
 
 
-def _arrow_schema_for(conn, table: str) -> pa.Schema:
-    """Build a pyarrow Schema with real types sourced from information_schema."""
-    cols = _table_columns(conn, table)
+def arrow_schema_for(conn, table: str, profile: str = DEFAULT_EXPORT_PROFILE) -> pa.Schema:
+    """Build a pyarrow Schema with real types sourced from information_schema.
+
+    ``profile="compact"`` narrows the exact types as described at
+    EXPORT_PROFILES.
+    """
+    cols = table_columns(conn, table)
     fields = []
     for name, pg_type in cols:
         arrow_type = _PG_TO_ARROW.get(pg_type, pa.string())
         fields.append(pa.field(name, arrow_type))
+    schema = pa.schema(fields)
+    if profile == "compact":
+        schema = _compact_schema(conn, table, schema)
+    return schema
+
+
+def _compact_schema(conn, table: str, schema: pa.Schema) -> pa.Schema:
+    """Narrow an exact export schema to the "compact" profile."""
+    if table == WIDE_TABLE:
+        numeric = {
+            name: (precision, scale)
+            for name, data_type, precision, scale in wide_column_types(conn)
+            if data_type == "numeric"
+        }
+    else:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT column_name, numeric_precision, numeric_scale "
+                "FROM information_schema.columns "
+                "WHERE table_name = %s AND data_type = 'numeric'",
+                (table,),
+            )
+            numeric = {name: (precision, scale) for name, precision, scale in cur.fetchall()}
+    fields = []
+    for field in schema:
+        if field.name in numeric:
+            precision, scale = numeric[field.name]
+            # Unconstrained NUMERIC reports NULL precision/scale.
+            if scale == 0 and precision is not None and precision <= 9:
+                field = field.with_type(pa.int32())
+            elif scale == 0 and precision is not None and precision <= 18:
+                field = field.with_type(pa.int64())
+            else:
+                field = field.with_type(pa.float64())
+        elif field.name in DICTIONARY_COLUMNS and pa.types.is_string(field.type):
+            field = field.with_type(_DICTIONARY_TYPE)
+        fields.append(field)
     return pa.schema(fields)
 
 
+def _undictionary(schema: pa.Schema) -> pa.Schema:
+    """``schema`` with dictionary columns read back as their value type."""
+    return pa.schema([
+        f.with_type(f.type.value_type) if pa.types.is_dictionary(f.type) else f
+        for f in schema
+    ])
+
+
+def _cast_batches(batches: Iterable[pa.RecordBatch], schema: pa.Schema) -> Iterator[pa.RecordBatch]:
+    """Dictionary-encode string columns of ``batches`` to match ``schema``."""
+    for batch in batches:
+        yield batch.cast(schema)
+
+
 def _sanitize_decimals(rows: list[dict]) -> list[dict]:
     """Normalize Decimal values for parquet emission.
 
@@ -121,6 +333,9 @@ def _sanitize_decimals(rows: list[dict]) -> list[dict]:
     - Finite Decimal values quantized to thousandths with ROUND_HALF_UP so
       they fit decimal128(18, 3) exactly. .5 rounds up (regulatory
       convention), not Python's default banker's rounding.
+
+    Table exports do this server-side in bulk (see _export_select); this
+    row-level version is the reference that projection is tested against.
     """
     for r in rows:
         for k, v in list(r.items()):
@@ -129,7 +344,7 @@ def _sanitize_decimals(rows: list[dict]) -> list[dict]:
             if not v.is_finite():
                 r[k] = None
             else:
-                r[k] = v.quantize(_QUANTUM, rounding=ROUND_HALF_UP)
+                r[k] = v.quantize(NUMERIC_QUANTUM, rounding=ROUND_HALF_UP)
     return rows
 
 
@@ -151,71 +366,968 @@ def _stringify_jsonb(rows: list[dict], jsonb_cols: list[str]) -> list[dict]:
     return rows
 
 
-def export_table(conn, table: str, target_dir: Path = PARQUET_DIR) -> Path:
-    """Read one Postgres table and write it as a parquet file with atomic swap.
+def _tee_ipc(batches: Iterable[pa.RecordBatch],
+             writer: pa.ipc.RecordBatchFileWriter) -> Iterator[pa.RecordBatch]:
+    """Pass ``batches`` through, also appending each one to ``writer``."""
+    for batch in batches:
+        writer.write_batch(batch)
+        yield batch
 
-    Returns the final path of the written .parquet file.
 
-    Atomic swap: write to ``<table>.parquet.tmp`` then ``rename`` to
-    ``<table>.parquet``. POSIX rename on the same filesystem is atomic, so a
-    concurrent reader either sees the previous run's file or the new one,
-    never a partial.
+def sort_columns(table: str) -> list[tuple[str, bool]]:
+    """SORT_KEYS entry for ``table`` as [(column, descending), ...]."""
+    keys = []
+    for key in SORT_KEYS.get(table, ()):
+        name, _, direction = key.partition(" ")
+        keys.append((name, direction.strip().upper() == "DESC"))
+    return keys
+
+
+def _export_select(conn, table: str, cols: list[tuple[str, str]],
+                   sort_keys: Sequence[tuple[str, bool]] = (),
+                   schema: pa.Schema | None = None) -> str:
+    """``SELECT`` for an export, sanitizing NUMERIC columns in SQL.
+
+    Does server-side, per column, what _sanitize_decimals does per cell:
+    NaN/±Infinity -> NULL, finite values rounded to thousandths. Postgres
+    ``round(numeric, int)`` rounds half away from zero, the same as
+    ROUND_HALF_UP, so values arrive already fitting decimal128(18, 3).
+
+    If ``schema`` narrows a NUMERIC column to float64 or an integer (the
+    "compact" profile), the rounded value is cast in SQL too. Postgres'
+    numeric -> double conversion is correctly rounded; Arrow's decimal ->
+    float64 cast is not (11.700 becomes 11.700000000000001).
+
+    ``sort_keys`` adds an ORDER BY, NULLS LAST in both directions. Text keys
+    sort with ``COLLATE "C"`` so the order is the bytewise order parquet
+    min/max statistics use.
+    """
+    narrowed = {}
+    if schema is not None:
+        for field in schema:
+            if pa.types.is_float64(field.type):
+                narrowed[field.name] = sql.SQL("::double precision")
+            elif pa.types.is_int32(field.type):
+                narrowed[field.name] = sql.SQL("::integer")
+            elif pa.types.is_int64(field.type):
+                narrowed[field.name] = sql.SQL("::bigint")
+    exprs: list[sql.Composable] = []
+    for name, pg_type in cols:
+        col = sql.Identifier(name)
+        if pg_type == "numeric":
+            exprs.append(sql.SQL(
+                "CASE WHEN {c} IN ('NaN', 'Infinity', '-Infinity') THEN NULL "
+                "ELSE round({c}, {scale}){cast} END AS {c}"
+            ).format(c=col, scale=sql.Literal(_NUMERIC_SCALE),
+                     cast=narrowed.get(name, sql.SQL(""))))
+        else:
+            exprs.append(col)
+    query = sql.SQL("SELECT {cols} FROM {table}").format(
+        cols=sql.SQL(", ").join(exprs), table=_table_source(table)
+    )
+    if sort_keys:
+        types = dict(cols)
+        order = []
+        for name, descending in sort_keys:
+            key: sql.Composable = sql.Identifier(name)
+            if types[name] in ("text", "character varying", "character"):
+                key = sql.SQL('{} COLLATE "C"').format(key)
+            order.append(sql.SQL("{} {} NULLS LAST").format(
+                key, sql.SQL("DESC" if descending else "ASC")
+            ))
+        query = sql.SQL("{} ORDER BY {}").format(query, sql.SQL(", ").join(order))
+    return query.as_string(conn)
+
+
+def _iter_record_batches(
+    conn,
+    table: str,
+    schema: pa.Schema,
+    cols: list[tuple[str, str]],
+    batch_size: int,
+    sort_keys: Sequence[tuple[str, bool]] = (),
+) -> Iterator[pa.RecordBatch]:
+    """Stream a table as RecordBatches of ``batch_size`` rows.
+
+    Uses a named (server-side) cursor so Postgres holds the result set and
+    only one chunk of rows is materialized client-side at a time.
+    """
+    # Nested JSONB columns go to Arrow as the parsed Python values.
+    jsonb_cols = [name for name, dtype in cols
+                  if dtype == "jsonb" and pa.types.is_string(schema.field(name).type)]
+    with conn.cursor(name=f"export_{table}", cursor_factory=RealDictCursor) as cur:
+        cur.itersize = batch_size
+        cur.execute(_export_select(conn, table, cols, sort_keys, schema))
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            # JSONB columns are JSON-encoded as strings (pyarrow type-inference
+            # rejects heterogeneous nested shapes). NUMERIC values were already
+            # sanitized by the SELECT. Other column types come back from
+            # psycopg2 as native Python types that match the declared schema
+            # directly.
+            rows = _stringify_jsonb(rows, jsonb_cols)
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def _reencode_jsonb(values: list[str | None]) -> list[str | None]:
+    """Turn COPY's jsonb text into what the cursor path emits.
+
+    psycopg2 json.loads() each jsonb value and _stringify_jsonb json.dumps()
+    it back (leaving bare JSON strings as-is); Postgres' own jsonb text
+    differs in escaping and number formatting, so round-trip it the same way.
     """
+    out = []
+    for text in values:
+        v = json.loads(text) if text is not None else None
+        out.append(v if v is None or isinstance(v, str) else json.dumps(v, default=str))
+    return out
+
+
+class _MixedJsonShape(ValueError):
+    """JSONB values whose shapes don't unify into one Arrow type."""
+
+
+def _json_type(value: Any) -> pa.DataType:
+    """Arrow type of one parsed JSON value; pa.null() where unknown."""
+    if value is None:
+        return pa.null()
+    if isinstance(value, bool):
+        return pa.bool_()
+    if isinstance(value, int):
+        if not -(1 << 63) <= value < (1 << 63):
+            raise _MixedJsonShape(f"integer {value} does not fit int64")
+        return pa.int64()
+    if isinstance(value, float):
+        return pa.float64()
+    if isinstance(value, str):
+        return pa.string()
+    if isinstance(value, list):
+        item = pa.null()
+        for v in value:
+            item = _merge_json_types(item, _json_type(v))
+        return pa.list_(item)
+    if isinstance(value, dict):
+        return pa.struct([pa.field(k, _json_type(value[k])) for k in sorted(value)])
+    raise _MixedJsonShape(f"unsupported JSON value {type(value).__name__}")
+
+
+def _merge_json_types(a: pa.DataType, b: pa.DataType) -> pa.DataType:
+    """Smallest Arrow type holding values of both ``a`` and ``b``."""
+    if pa.types.is_null(a):
+        return b
+    if pa.types.is_null(b) or a.equals(b):
+        return a
+    if {a, b} == {pa.int64(), pa.float64()}:
+        return pa.float64()
+    if pa.types.is_list(a) and pa.types.is_list(b):
+        return pa.list_(_merge_json_types(a.value_type, b.value_type))
+    if pa.types.is_struct(a) and pa.types.is_struct(b):
+        fields = {f.name: f.type for f in a}
+        for f in b:
+            fields[f.name] = _merge_json_types(fields.get(f.name, pa.null()), f.type)
+        return pa.struct([pa.field(k, fields[k]) for k in sorted(fields)])
+    if pa.types.is_map(a) and pa.types.is_map(b):
+        return pa.map_(pa.string(), _merge_json_types(a.item_type, b.item_type))
+    raise _MixedJsonShape(f"cannot unify {a} and {b}")
+
+
+def _finalize_json_type(t: pa.DataType, as_map: bool = False) -> pa.DataType:
+    """Resolve an inferred type into one parquet can store.
+
+    Never-seen value types (pa.null()) become string; empty, very wide or
+    ``as_map`` structs become map<string, T> over their merged field types.
+    """
+    if pa.types.is_null(t):
+        return pa.string()
+    if pa.types.is_list(t):
+        return pa.list_(_finalize_json_type(t.value_type))
+    if pa.types.is_struct(t):
+        if as_map or t.num_fields == 0 or t.num_fields > _MAX_STRUCT_FIELDS:
+            item = pa.null()
+            for f in t:
+                item = _merge_json_types(item, f.type)
+            return pa.map_(pa.string(), _finalize_json_type(item))
+        return pa.struct([pa.field(f.name, _finalize_json_type(f.type)) for f in t])
+    return t
+
+
+def _infer_jsonb_types(conn, table: str, cols: list[tuple[str, str]],
+                       batch_size: int) -> dict[str, pa.DataType]:
+    """Nested Arrow type per JSONB column of ``table`` (JSONB_MODES "nested").
+
+    One server-side-cursor pass over just the JSONB columns. Columns that
+    are all NULL, hold bare scalars, or mix shapes are left out and keep
+    their JSON string encoding.
+    """
+    jsonb_cols = [name for name, dtype in cols if dtype == "jsonb"]
+    if not jsonb_cols:
+        return {}
+    inferred = {name: pa.null() for name in jsonb_cols}
+    mixed: set[str] = set()
+    query = sql.SQL("SELECT {cols} FROM {table}").format(
+        cols=sql.SQL(", ").join(sql.Identifier(c) for c in jsonb_cols),
+        table=_table_source(table),
+    )
+    with conn.cursor(name=f"infer_{table}") as cur:
+        cur.itersize = batch_size
+        cur.execute(query)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                for name, value in zip(jsonb_cols, row):
+                    if name in mixed:
+                        continue
+                    try:
+                        inferred[name] = _merge_json_types(inferred[name], _json_type(value))
+                    except _MixedJsonShape as e:
+                        logger.info("%s.%s stays a JSON string: %s", table, name, e)
+                        mixed.add(name)
+    types = {}
+    for name, t in inferred.items():
+        if name in mixed or not (pa.types.is_list(t) or pa.types.is_struct(t)):
+            continue
+        types[name] = _finalize_json_type(t, as_map=name in JSONB_MAP_COLUMNS)
+    return types
+
+
+def _rebatch(batches: Iterable[pa.RecordBatch], batch_size: int) -> Iterator[pa.RecordBatch]:
+    """Re-slice arbitrarily sized batches into ``batch_size``-row batches."""
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= batch_size:
+            combined = pa.Table.from_batches(pending).combine_chunks()
+            yield combined.slice(0, batch_size).to_batches()[0]
+            rest = combined.slice(batch_size)
+            pending = rest.to_batches()
+            pending_rows = rest.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+
+def _iter_copy_batches(
+    conn,
+    table: str,
+    schema: pa.Schema,
+    cols: list[tuple[str, str]],
+    batch_size: int,
+    sort_keys: Sequence[tuple[str, bool]] = (),
+) -> Iterator[pa.RecordBatch]:
+    """Stream a table via ``COPY ... TO STDOUT`` CSV parsed by pyarrow.csv.
+
+    COPY output is spooled to an anonymous temp file (bounded memory, like
+    the cursor path) and read back block by block with column types taken
+    from ``schema``. Booleans arrive as t/f; an unquoted empty field is NULL
+    while a quoted "" is the empty string. Nested JSONB columns are read as
+    text and parsed into their Arrow type.
+    """
+    select = _export_select(conn, table, cols, sort_keys, schema)
+    copy_sql = f"COPY ({select}) TO STDOUT WITH (FORMAT csv, HEADER true)"
+    jsonb_idx = [i for i, (_, dtype) in enumerate(cols) if dtype == "jsonb"]
+    csv_schema = pa.schema([
+        schema.field(i).with_type(pa.string()) if i in jsonb_idx else schema.field(i)
+        for i in range(len(schema))
+    ])
+    with tempfile.TemporaryFile() as spool:
+        with conn.cursor() as cur:
+            cur.copy_expert(copy_sql, spool)
+        spool.seek(0)
+        reader = pa_csv.open_csv(
+            spool,
+            read_options=pa_csv.ReadOptions(block_size=_COPY_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=csv_schema,
+                null_values=[""],
+                true_values=["t"],
+                false_values=["f"],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+
+        def typed():
+            for batch in reader:
+                arrays = batch.columns
+                for i in jsonb_idx:
+                    texts = arrays[i].to_pylist()
+                    target = schema.field(i).type
+                    if pa.types.is_string(target):
+                        arrays[i] = pa.array(_reencode_jsonb(texts), pa.string())
+                    else:
+                        arrays[i] = pa.array(
+                            [json.loads(t) if t is not None else None for t in texts], target
+                        )
+                yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+        yield from _rebatch(typed(), batch_size)
+
+
+def _table_fingerprint(conn, table: str, cols: list[tuple[str, str]]) -> tuple[int, str]:
+    """Server-side ``(row_count, hash)`` of a table's content.
+
+    Each row (minus FINGERPRINT_EXCLUDED_COLUMNS) is md5'd as its row text
+    and the sorted row hashes are md5'd together, so the result depends on
+    content only, not on physical row order.
+    """
+    hashed = [sql.Identifier(name) for name, _ in cols
+              if name not in FINGERPRINT_EXCLUDED_COLUMNS]
+    query = sql.SQL(
+        "SELECT count(*), coalesce(md5(string_agg(h, '' ORDER BY h)), '') "
+        "FROM (SELECT md5(ROW({cols})::text) AS h FROM {table}) rows"
+    ).format(cols=sql.SQL(", ").join(hashed), table=_table_source(table))
+    with conn.cursor() as cur:
+        cur.execute(query)
+        count, digest = cur.fetchone()
+    return count, digest
+
+
+def read_sidecar(path: Path) -> dict | None:
+    """A table's JSON sidecar, or None if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_sidecar(path: Path, meta: dict) -> None:
+    """Atomically write a JSON sidecar (tmp + rename, like the parquet)."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(meta, indent=2, sort_keys=True) + "\n")
+    tmp.rename(path)
+
+
+def _write_options(schema: pa.Schema, sort_keys: list[tuple[str, bool]],
+                   row_count: int, row_group_size: int) -> dict[str, Any]:
+    """Parquet writer options shared by the single-file and dataset writers.
+
+    ``schema`` is the schema of the written files (for Hive datasets, minus
+    the partition columns), so sorting_columns indexes line up with it.
+    """
+    names = schema.names
+    options: dict[str, Any] = {
+        "compression": "zstd",
+        "write_page_index": True,
+        "sorting_columns": [
+            pq.SortingColumn(names.index(name), descending=descending, nulls_first=False)
+            for name, descending in sort_keys
+            if name in names
+        ] or None,
+    }
+    bloom_cols = [c for c in BLOOM_FILTER_COLUMNS if c in names]
+    if bloom_cols and _SUPPORTS_BLOOM_FILTERS:
+        # Bloom filters are per row group; size them for one group's worth of
+        # distinct values rather than pyarrow's 1M default.
+        ndv = max(1, min(row_count, row_group_size))
+        options["bloom_filter_options"] = {
+            c: {"ndv": ndv, "fpp": BLOOM_FILTER_FPP} for c in bloom_cols
+        }
+    return options
+
+
+class _HashingWriter:
+    """Write-through file object hashing (sha256) and counting what it writes.
+
+    pyarrow writes to it through ``pa.PythonFile``; ``on_close`` gets the
+    writer once the file is closed and ``hexdigest()`` is final.
+    """
+
+    def __init__(self, path: Path,
+                 on_close: Callable[[_HashingWriter], None] | None = None) -> None:
+        self.path = path
+        self.size_bytes = 0
+        self._f = path.open("wb")
+        self._hash = hashlib.sha256()
+        self._on_close = on_close
+
+    @property
+    def closed(self) -> bool:
+        return self._f.closed
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        self.size_bytes += len(data)
+        return self._f.write(data)
+
+    def tell(self) -> int:
+        return self.size_bytes
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        self._f.close()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _hashing_stream(path: Path,
+                    on_close: Callable[[_HashingWriter], None] | None = None,
+                    ) -> tuple[pa.NativeFile, _HashingWriter]:
+    """A buffered pyarrow output stream writing ``path`` through a _HashingWriter."""
+    sink = _HashingWriter(path, on_close)
+    return pa.BufferedOutputStream(pa.PythonFile(sink, mode="w"), _HASH_BUFFER_SIZE), sink
+
+
+class _HashingFileSystem(pafs.FileSystemHandler):
+    """Local filesystem whose output streams hash what ds.write_dataset writes.
+
+    Everything else delegates to LocalFileSystem. ``written`` maps each
+    closed file's path to its _HashingWriter.
+    """
+
+    def __init__(self) -> None:
+        self._fs = pafs.LocalFileSystem()
+        self.written: dict[str, _HashingWriter] = {}
+
+    def __eq__(self, other) -> bool:
+        return self is other
+
+    def __ne__(self, other) -> bool:
+        return self is not other
+
+    def get_type_name(self) -> str:
+        return "hashing-local"
+
+    def normalize_path(self, path):
+        return self._fs.normalize_path(path)
+
+    def get_file_info(self, paths):
+        return self._fs.get_file_info(paths)
+
+    def get_file_info_selector(self, selector):
+        return self._fs.get_file_info(selector)
+
+    def create_dir(self, path, recursive):
+        self._fs.create_dir(path, recursive=recursive)
+
+    def delete_dir(self, path):
+        self._fs.delete_dir(path)
+
+    def delete_dir_contents(self, path, missing_dir_ok=False):
+        self._fs.delete_dir_contents(path, missing_dir_ok=missing_dir_ok)
+
+    def delete_root_dir_contents(self):
+        raise NotImplementedError("refusing to delete the filesystem root")
+
+    def delete_file(self, path):
+        self._fs.delete_file(path)
+
+    def move(self, src, dest):
+        self._fs.move(src, dest)
+
+    def copy_file(self, src, dest):
+        self._fs.copy_file(src, dest)
+
+    def open_input_stream(self, path):
+        return self._fs.open_input_stream(path)
+
+    def open_input_file(self, path):
+        return self._fs.open_input_file(path)
+
+    def open_output_stream(self, path, metadata):
+        stream, _ = _hashing_stream(
+            Path(path), lambda sink: self.written.__setitem__(path, sink)
+        )
+        return stream
+
+    def open_append_stream(self, path, metadata):
+        raise NotImplementedError("appending would invalidate the running hash")
+
+
+def _written_file(sink: _HashingWriter, final: Path, row_count: int) -> dict[str, Any]:
+    """Sidecar entry for one written file, now at ``final``.
+
+    ``mtime_ns`` (rename keeps it) lets readers tell whether the file is
+    still the one that was hashed.
+    """
+    return {
+        "sha256": sink.hexdigest(),
+        "size_bytes": sink.size_bytes,
+        "row_count": row_count,
+        "mtime_ns": final.stat().st_mtime_ns,
+    }
+
+
+def _write_parquet_file(tmp: Path, final: Path, schema: pa.Schema,
+                        batches: Iterable[pa.RecordBatch],
+                        write_options: dict[str, Any],
+                        row_group_size: int) -> dict[str, dict[str, Any]]:
+    """Write batches as ``row_group_size``-row groups of one parquet file.
+
+    tmp + rename swap. Returns ``{"": sidecar file entry}``: sha256, size
+    and row count come from the write itself (see _HashingWriter).
+    """
+    n_rows = 0
+    stream, sink = _hashing_stream(tmp)
+    try:
+        writer = pq.ParquetWriter(stream, schema, **write_options)
+        try:
+            for batch in _rebatch(batches, row_group_size):
+                writer.write_batch(batch, row_group_size=row_group_size)
+                n_rows += batch.num_rows
+        finally:
+            # Closing writes the footer; a zero-row table still yields a valid
+            # file carrying the schema.
+            writer.close()
+    finally:
+        stream.close()
+    tmp.rename(final)
+    return {"": _written_file(sink, final, n_rows)}
+
+
+def _write_hive_dataset(tmp: Path, final: Path, schema: pa.Schema,
+                        batches: Iterable[pa.RecordBatch],
+                        partition_keys: tuple[str, ...],
+                        write_options: dict[str, Any],
+                        row_group_size: int) -> dict[str, dict[str, Any]]:
+    """Write batches as a Hive-partitioned dataset directory; swap into place.
+
+    One ``part-0.parquet`` per partition directory
+    (``season_id=2026/stat_period=espn_last_7/``); partition columns live in
+    the path, not the files. The new tree is built under ``tmp`` and
+    swapped in with two renames, so readers see the old or new dataset
+    except for the instant between them. Returns the sidecar file entries
+    keyed by partition path, hashed as each file was written.
+    """
+    fs = _HashingFileSystem()
+    row_counts: dict[str, int] = {}
+
+    def visit(written) -> None:
+        row_counts[written.path] = written.metadata.num_rows
+
+    tmp.mkdir()
+    ds.write_dataset(
+        batches,
+        str(tmp),
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([schema.field(k) for k in partition_keys]), flavor="hive"
+        ),
+        basename_template="part-{i}.parquet",
+        file_options=ds.ParquetFileFormat().make_write_options(**write_options),
+        min_rows_per_group=row_group_size,
+        max_rows_per_group=row_group_size,
+        # Single-threaded keeps rows in export order within each partition.
+        use_threads=False,
+        filesystem=pafs.PyFileSystem(fs),
+        file_visitor=visit,
+    )
+    old = final.with_name(final.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if final.exists():
+        final.rename(old)
+    tmp.rename(final)
+    shutil.rmtree(old, ignore_errors=True)
+    files = {}
+    for path, sink in fs.written.items():
+        rel = Path(path).relative_to(tmp)
+        files[rel.parent.as_posix()] = _written_file(sink, final / rel, row_counts[path])
+    return dict(sorted(files.items()))
+
+
+def _layout_paths(
+    table: str, target_dir: Path, layout: str
+) -> tuple[Path, Path, tuple[str, ...] | None]:
+    """(final, stale, partition_keys) for ``table`` exported with ``layout``.
+
+    ``stale`` is where the other layout would have put the table.
+    """
+    partition_keys = HIVE_PARTITION_KEYS.get(table) if layout == "hive" else None
+    file_path = target_dir / f"{table}.parquet"
+    dataset_path = target_dir / table
+    if partition_keys:
+        return dataset_path, file_path, partition_keys
+    return file_path, dataset_path, None
+
+
+def write_table_files(
+    table: str,
+    target_dir: Path,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch],
+    *,
+    row_count: int,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> tuple[Path, dict[str, dict[str, Any]]]:
+    """Write ``batches`` as ``table``'s parquet, laid out as export_table does.
+
+    One ``<table>.parquet``, or a Hive dataset directory for
+    HIVE_PARTITION_KEYS tables under ``layout="hive"``, with the table's
+    SORT_KEYS as sorting_columns, page index and bloom filters; the other
+    layout's file or directory is removed. ``batches`` must already be in
+    SORT_KEYS order; ``row_count`` sizes the bloom filters. No sidecar is
+    written. Returns the final path and its SIDECAR_FILES_KEY entries.
+    """
+    if layout not in EXPORT_LAYOUTS:
+        raise ValueError(f"Unknown export layout {layout!r}; expected one of {EXPORT_LAYOUTS}")
+    final, stale, partition_keys = _layout_paths(table, target_dir, layout)
     target_dir.mkdir(parents=True, exist_ok=True)
-    final = target_dir / f"{table}.parquet"
-    tmp = target_dir / f"{table}.parquet.tmp"
+    tmp = final.with_name(final.name + ".tmp")
     # If a prior run died mid-write, sweep the stale tmp before retry.
+    if tmp.is_dir():
+        shutil.rmtree(tmp)
     tmp.unlink(missing_ok=True)
 
-    cols = _table_columns(conn, table)
-    jsonb_cols = [name for name, dtype in cols if dtype == "jsonb"]
-    schema = _arrow_schema_for(conn, table)
+    sort_keys = sort_columns(table)
+    if partition_keys:
+        file_schema = pa.schema([f for f in schema if f.name not in partition_keys])
+        options = _write_options(file_schema, sort_keys, row_count, row_group_size)
+        files = _write_hive_dataset(
+            tmp, final, schema, batches, partition_keys, options, row_group_size
+        )
+    else:
+        options = _write_options(schema, sort_keys, row_count, row_group_size)
+        files = _write_parquet_file(tmp, final, schema, batches, options, row_group_size)
+    # Switching layouts: drop the other layout so uploads see only one.
+    if stale.is_dir():
+        shutil.rmtree(stale)
+    stale.unlink(missing_ok=True)
+    return final, files
 
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(f"SELECT * FROM {table}")
-        rows = [dict(r) for r in cur.fetchall()]
 
-    if not rows:
-        logger.warning("Table %s is empty; writing zero-row parquet", table)
+def _export_table(
+    conn,
+    table: str,
+    target_dir: Path,
+    *,
+    batch_size: int,
+    method: str,
+    force: bool,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    profile: str = DEFAULT_EXPORT_PROFILE,
+    jsonb: str = DEFAULT_JSONB_MODE,
+    ipc: str = DEFAULT_IPC_MODE,
+) -> tuple[Path, bool]:
+    """export_table's implementation; also returns whether it was skipped."""
+    if method not in EXPORT_METHODS:
+        raise ValueError(f"Unknown export method {method!r}; expected one of {EXPORT_METHODS}")
+    if layout not in EXPORT_LAYOUTS:
+        raise ValueError(f"Unknown export layout {layout!r}; expected one of {EXPORT_LAYOUTS}")
+    if profile not in EXPORT_PROFILES:
+        raise ValueError(f"Unknown export profile {profile!r}; expected one of {EXPORT_PROFILES}")
+    if jsonb not in JSONB_MODES:
+        raise ValueError(f"Unknown JSONB mode {jsonb!r}; expected one of {JSONB_MODES}")
+    if ipc not in IPC_MODES:
+        raise ValueError(f"Unknown IPC mode {ipc!r}; expected one of {IPC_MODES}")
+    final, _, partition_keys = _layout_paths(table, target_dir, layout)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    sidecar = target_dir / f"{table}{SIDECAR_SUFFIX}"
+    ipc_path = target_dir / f"{table}{IPC_SUFFIX}"
+    ipc_tmp = ipc_path.with_name(ipc_path.name + ".tmp")
+    # If a prior run died mid-write, sweep the stale tmp before retry
+    # (write_table_files does the same for the parquet's).
+    ipc_tmp.unlink(missing_ok=True)
+
+    cols = table_columns(conn, table)
+    schema = arrow_schema_for(conn, table, profile)
+    row_count, fingerprint = _table_fingerprint(conn, table, cols)
+    meta = {
+        "table": table,
+        "profile": profile,
+        "jsonb": jsonb,
+        "ipc": ipc,
+        "row_count": row_count,
+        "fingerprint": fingerprint,
+        "schema": [[f.name, str(f.type)] for f in schema],
+        "partition_keys": list(partition_keys or ()),
+        "sort_keys": list(SORT_KEYS.get(table, ())),
+        "row_group_size": row_group_size,
+        "bloom_filter_columns": [c for c in BLOOM_FILTER_COLUMNS if c in schema.names],
+    }
+    recorded = read_sidecar(sidecar) or {}
+    recorded.pop(SIDECAR_FILES_KEY, None)
+    if (not force and final.exists() and (ipc == "off" or ipc_path.exists())
+            and recorded == meta):
+        logger.info("Skipped %s: fingerprint unchanged", table)
+        return final, True
+    # The old sidecar no longer describes what's about to be on disk.
+    sidecar.unlink(missing_ok=True)
+
+    if jsonb == "nested":
+        # Inferred types depend only on content, which the fingerprint
+        # already covers, so this pass runs only when actually exporting.
+        nested = _infer_jsonb_types(conn, table, cols, batch_size)
+        schema = pa.schema([
+            f.with_type(nested[f.name]) if f.name in nested else f for f in schema
+        ])
+    # Numerics are narrowed in the SELECT; dictionary encoding happens after
+    # the rows are in Arrow.
+    read_schema = _undictionary(schema)
+    if method == "copy" and any(dtype in _COPY_UNSUPPORTED_TYPES for _, dtype in cols):
+        method = "cursor"
+    sort_keys = sort_columns(table)
+    if method == "copy":
+        batches = _iter_copy_batches(conn, table, read_schema, cols, batch_size, sort_keys)
+    else:
+        batches = _iter_record_batches(conn, table, read_schema, cols, batch_size, sort_keys)
+    ipc_writer = None
+    if ipc != "off":
+        ipc_writer = pa.ipc.new_file(
+            str(ipc_tmp), read_schema,
+            options=pa.ipc.IpcWriteOptions(compression="lz4" if ipc == "lz4" else None),
+        )
+        batches = _tee_ipc(batches, ipc_writer)
+    if not read_schema.equals(schema):
+        batches = _cast_batches(batches, schema)
+
+    try:
+        _, files = write_table_files(
+            table, target_dir, schema, batches,
+            row_count=row_count, layout=layout, row_group_size=row_group_size,
+        )
+    finally:
+        if ipc_writer is not None:
+            # Closing writes the IPC footer.
+            ipc_writer.close()
+    # Same tmp + rename swap as the parquet. An "off" run drops an old
+    # .arrow so it can't be read as current.
+    if ipc_writer is not None:
+        ipc_tmp.rename(ipc_path)
     else:
-        # JSONB columns are JSON-encoded as strings (pyarrow type-inference
-        # rejects heterogeneous nested shapes). NUMERIC values quantized to
-        # thousandths so they fit decimal128(18, 3) exactly. Other column
-        # types come back from psycopg2 as native Python types that match
-        # the declared schema directly.
-        rows = _sanitize_decimals(rows)
-        rows = _stringify_jsonb(rows, jsonb_cols)
+        ipc_path.unlink(missing_ok=True)
 
-    arrow_table = pa.Table.from_pylist(rows, schema=schema)
+    n_rows = sum(f["row_count"] for f in files.values())
+    if not n_rows:
+        logger.warning("Table %s is empty; writing zero-row parquet", table)
+    write_sidecar(sidecar, {**meta, SIDECAR_FILES_KEY: files})
+    logger.info("Wrote %d rows to %s", n_rows, final)
+    return final, False
 
-    pq.write_table(arrow_table, tmp, compression="zstd")
-    tmp.rename(final)
-    logger.info("Wrote %d rows to %s", len(rows), final)
-    return final
+
+def export_table(
+    conn,
+    table: str,
+    target_dir: Path = PARQUET_DIR,
+    *,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    method: str = DEFAULT_EXPORT_METHOD,
+    force: bool = False,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    profile: str = DEFAULT_EXPORT_PROFILE,
+    jsonb: str = DEFAULT_JSONB_MODE,
+    ipc: str = DEFAULT_IPC_MODE,
+) -> Path:
+    """Stream one Postgres table into a parquet file with atomic swap.
+
+    Returns the final path of the written .parquet file, or of the dataset
+    directory when ``layout="hive"`` and the table is in HIVE_PARTITION_KEYS.
+
+    Rows are read ``batch_size`` at a time, so memory stays bounded by the
+    batch size rather than the table size, and written in row groups of
+    ``row_group_size`` rows. ``method`` picks how rows leave
+    Postgres (see EXPORT_METHODS); tables with column types the COPY path
+    can't parse fall back to "cursor".
+
+    Layout for pruning: rows are ordered by the table's SORT_KEYS (recorded
+    as the file's sorting_columns), every file carries a page index, and
+    BLOOM_FILTER_COLUMNS get per-row-group bloom filters, so point lookups
+    on player_id can skip row groups and pages via min/max and bloom.
+
+    ``profile`` picks the column types (see EXPORT_PROFILES): "exact"
+    decimals, or "compact" dictionary strings and integer/float64 numerics.
+    ``jsonb="nested"`` writes JSONB columns as inferred struct/map/list
+    columns instead of JSON strings (see JSONB_MODES). ``ipc`` also writes
+    the rows to ``<table>.arrow`` for memory-mapped local reads (see
+    IPC_MODES), swapped into place the same way as the parquet.
+
+    Skip-unchanged: a server-side fingerprint (row count + content hash) is
+    stored next to the parquet in ``<table>.meta.json``. If the existing
+    sidecar matches the table's current fingerprint and schema, the file is
+    left untouched (same bytes, same sha256 downstream). ``force`` rewrites
+    regardless.
+
+    Atomic swap: write to ``<table>.parquet.tmp`` then ``rename`` to
+    ``<table>.parquet``. POSIX rename on the same filesystem is atomic, so a
+    concurrent reader either sees the previous run's file or the new one,
+    never a partial.
+    """
+    path, _ = _export_table(
+        conn, table, target_dir,
+        batch_size=batch_size, method=method, force=force, layout=layout,
+        row_group_size=row_group_size, profile=profile, jsonb=jsonb, ipc=ipc,
+    )
+    return path
+
+
+def rewrite_manifest(target_dir: Path = PARQUET_DIR) -> Path:
+    """Rewrite ``target_dir/manifest.json`` for the tables exported there now.
+
+    For writers other than export_all (see exporters.direct): every
+    EXPORTED_TABLES table with a file or dataset in ``target_dir`` is
+    listed with its current sidecar, so the manifest never describes a
+    file that has since been replaced. Untouched files keep their
+    recorded sha256 (see write_manifest).
+    """
+    tables = []
+    for table in EXPORTED_TABLES:
+        dataset_path = target_dir / table
+        final = dataset_path if dataset_path.is_dir() else target_dir / f"{table}.parquet"
+        if final.exists():
+            tables.append((table, final, read_sidecar(target_dir / f"{table}{SIDECAR_SUFFIX}")))
+    return write_manifest(target_dir, tables)
+
+
+def _begin_export_snapshot(conn) -> str:
+    """Open a REPEATABLE READ transaction on ``conn`` and export its snapshot.
+
+    Any transaction the caller left open is rolled back first (export is
+    read-only). The snapshot stays importable until ``conn``'s transaction
+    ends.
+    """
+    conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        cur.execute("SELECT pg_export_snapshot()")
+        return cur.fetchone()[0]
 
 
-def export_all(conn, target_dir: Path = PARQUET_DIR) -> list[Path]:
-    """Export every table in EXPORTED_TABLES; return list of written paths."""
-    paths: list[Path] = []
+def _snapshot_connection(snapshot: str):
+    """New connection whose transaction sees exactly ``snapshot``."""
+    conn = get_connection()
+    # get_connection's version probe already opened a transaction.
+    conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        cur.execute("SET TRANSACTION SNAPSHOT %s", (snapshot,))
+    return conn
+
+
+def export_all(
+    conn,
+    target_dir: Path = PARQUET_DIR,
+    *,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    method: str = DEFAULT_EXPORT_METHOD,
+    max_workers: int | None = None,
+    force: bool = False,
+    layout: str = DEFAULT_EXPORT_LAYOUT,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    profile: str = DEFAULT_EXPORT_PROFILE,
+    jsonb: str = DEFAULT_JSONB_MODE,
+    ipc: str = DEFAULT_IPC_MODE,
+    on_exported: Callable[[str, Path, float], None] | None = None,
+) -> list[Path]:
+    """Export every table in EXPORTED_TABLES; return list of written paths.
+
+    All tables are read from one snapshot: ``conn`` exports it with
+    ``pg_export_snapshot()`` and each worker connection imports it with
+    ``SET TRANSACTION SNAPSHOT``, so the parquet set is consistent even if
+    the database changes mid-export. Up to ``max_workers`` tables export at
+    once (default DEFAULT_EXPORT_WORKERS); with one worker everything runs
+    on ``conn``. Paths are returned in EXPORTED_TABLES order.
+
+    Opening the snapshot rolls back whatever transaction is open on
+    ``conn``: uncommitted work on it is lost, so commit before calling.
+    The snapshot transaction is rolled back again when the export ends.
+
+    Tables whose fingerprint matches their sidecar are skipped (see
+    export_table) unless ``force``; the skipped count is reported at the end.
+    ``layout="hive"`` writes HIVE_PARTITION_KEYS tables as partitioned
+    dataset directories. ``profile``, ``jsonb`` and ``ipc`` are passed
+    through to export_table. Afterwards ``target_dir/manifest.json`` is
+    rewritten to describe every exported file (see exporters/manifest.py).
+
+    ``on_exported(table, path, seconds)`` is called on this thread as each
+    table finishes (skipped ones included), once its files and sidecar are
+    in place, while later tables are still exporting. It must not use
+    ``conn``, which holds the snapshot.
+    """
+    workers = max_workers or DEFAULT_EXPORT_WORKERS
+    workers = max(1, min(workers, len(EXPORTED_TABLES)))
+    paths: dict[str, Path] = {}
+    skipped: list[str] = []
+    local = threading.local()
+    opened: list[Any] = []
+    opened_lock = threading.Lock()
+
+    def run(table: str) -> tuple[Path, bool, float]:
+        if workers == 1:
+            wconn = conn
+        else:
+            wconn = getattr(local, "conn", None)
+            if wconn is None:
+                wconn = local.conn = _snapshot_connection(snapshot)
+                with opened_lock:
+                    opened.append(wconn)
+        start = time.perf_counter()
+        path, was_skipped = _export_table(
+            wconn, table, target_dir,
+            batch_size=batch_size, method=method, force=force, layout=layout,
+            row_group_size=row_group_size, profile=profile, jsonb=jsonb, ipc=ipc,
+        )
+        return path, was_skipped, time.perf_counter() - start
+
+    snapshot = _begin_export_snapshot(conn)
     # transient=False: parquet export is disk I/O (file writes), persist
     # the bar + elapsed time in the log.
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold]📦 Exporting to parquet"),
-        BarColumn(bar_width=30),
-        MofNCompleteColumn(),
-        TextColumn("[dim]{task.fields[current]}"),
-        TimeElapsedColumn(),
-        console=console,
-        transient=False,
-    ) as progress:
-        task = progress.add_task("export", total=len(EXPORTED_TABLES), current="")
-        for table in EXPORTED_TABLES:
-            progress.update(task, current=table)
-            try:
-                paths.append(export_table(conn, table, target_dir=target_dir))
-            except Exception as e:
-                logger.error("Failed to export %s: %s", table, e)
-                raise
-            progress.update(task, advance=1)
-    return paths
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[bold]📦 Exporting to parquet"),
+            BarColumn(bar_width=30),
+            MofNCompleteColumn(),
+            TextColumn("[dim]{task.fields[current]}"),
+            TimeElapsedColumn(),
+            console=console,
+            transient=False,
+        ) as progress:
+            task = progress.add_task("export", total=len(EXPORTED_TABLES), current="")
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(run, table): table for table in EXPORTED_TABLES}
+                for fut in as_completed(futures):
+                    table = futures[fut]
+                    try:
+                        path, was_skipped, secs = fut.result()
+                    except Exception as e:
+                        logger.error("Failed to export %s: %s", table, e)
+                        pool.shutdown(cancel_futures=True)
+                        raise
+                    paths[table] = path
+                    if was_skipped:
+                        skipped.append(table)
+                        progress.console.print(
+                            f"   [dim]↷ {table:<28} {secs:6.2f}s  unchanged[/dim]"
+                        )
+                    else:
+                        progress.console.print(
+                            f"   [green]✓[/green] {table:<28} [dim]{secs:6.2f}s[/dim]"
+                        )
+                    progress.update(task, advance=1, current=table)
+                    if on_exported is not None:
+                        on_exported(table, path, secs)
+    finally:
+        for wconn in opened:
+            wconn.close()
+        # Ends the snapshot transaction; conn is back to its default
+        # isolation level for the caller.
+        conn.rollback()
+    if skipped:
+        console.print(
+            f"   ⏭️  Skipped [bold]{len(skipped)}[/bold] unchanged "
+            f"table{'s' if len(skipped) != 1 else ''} (fingerprint match)"
+        )
+    write_manifest(target_dir, [
+        (table, paths[table], read_sidecar(target_dir / f"{table}{SIDECAR_SUFFIX}"))
+        for table in EXPORTED_TABLES
+    ])
+    console.print(f"   [green]✓[/green] Wrote {MANIFEST_NAME}")
+    return [paths[table] for table in EXPORTED_TABLES]
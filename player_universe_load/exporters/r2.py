@@ -6,22 +6,58 @@ metadata in Neon" pattern — viz apps query Postgres for the latest
 artifact pointers, fetch the binary from R2 directly, and verify against
 the recorded sha256.
 
-S3 PUT is atomic — single-object overwrite — so a partial upload never
-surfaces to readers. We compute sha256 locally and record it after a
-successful PUT, so the metadata row only exists when the object does.
+Objects are content-addressed by default: ``<table>/<sha256>.parquet``
+(``<table>/<partition>/<sha256>.parquet`` for Hive partitions). A key's
+bytes never change, so objects carry a year-long immutable Cache-Control
+and the only mutable pointers are ``parquet_artifacts`` and the uploaded
+manifest.json. Every uploaded generation is also kept in
+``parquet_artifact_history`` with its key scheme and manifest entry, and
+rollback_artifact points both back at an earlier one without writing any
+parquet object. ``key_scheme="fixed"`` keeps the older overwrite-in-place
+keys (``<table>.parquet``, ``.../part-0.parquet``) for readers that glob
+the bucket.
+
+S3 PUT is atomic, so a partial upload never surfaces to readers. We
+compute sha256 locally and record it after a successful PUT, so the
+metadata row only exists when the object does.
+
+upload_all runs the PUTs on a thread pool sharing one client and writes
+every parquet_artifacts row once they finish: one multi-row upsert, one
+commit.
+
+Files at or above MultipartConfig.threshold go up as multipart uploads
+with parts sent in parallel; the object only appears on
+CompleteMultipartUpload, so readers still never see a partial.
+
+sha256 and row_count come from the export sidecar, recorded while the
+exporter wrote the file, as long as the file's size and mtime still match;
+otherwise the file is hashed here and its rows read from the parquet
+footer. The source table is never re-counted, so row_count is what the
+file holds even if Postgres has moved on since the export. A file whose
+sha256 equals the one parquet_artifacts records for the same object is
+not sent again (``force=True`` re-sends everything). Only the row's
+``verified_at`` moves; ``uploaded_at`` keeps the time of the PUT.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import os
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
 import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
 from botocore.config import Config
+from botocore.exceptions import ClientError
+from psycopg2.extras import Json, execute_values
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -32,10 +68,28 @@ from rich.progress import (
 )
 
 from ..db import console
-from .parquet import EXPORTED_TABLES, PARQUET_DIR
+from .manifest import MANIFEST_NAME, read_manifest, sha256_file, sidecar_file_entry
+from .parquet import EXPORTED_TABLES, PARQUET_DIR, SIDECAR_SUFFIX, read_sidecar
 
 logger = logging.getLogger(__name__)
 
+KEY_SCHEMES = ("content", "fixed")
+DEFAULT_KEY_SCHEME = "content"
+# Content-addressed keys never change meaning, so caches may keep them forever.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# manifest.json is the mutable entry point: always revalidate.
+_MANIFEST_CACHE_CONTROL = "no-cache"
+
+# Concurrent PUTs in upload_all. Uploads wait on the network, not the CPU,
+# so threads overlap their round trips; the client's connection pool is
+# sized to match so no worker waits for a socket.
+DEFAULT_UPLOAD_WORKERS = 8
+
+_MIB = 1024 * 1024
+# S3 multipart limits: every part but the last >= 5 MiB, at most 10,000 parts.
+_MIN_PART_SIZE = 5 * _MIB
+_MAX_PARTS = 10_000
+
 
 @dataclass(frozen=True)
 class R2Config:
@@ -75,12 +129,39 @@ class R2Config:
         )
 
 
-def _s3_client(cfg: R2Config):
+@dataclass(frozen=True)
+class MultipartConfig:
+    """When and how to split an upload into parallel multipart parts.
+
+    Files of at least ``threshold`` bytes are uploaded in ``part_size``
+    parts, ``max_workers`` at a time; smaller files keep the single PUT.
+    A failed part is retried on its own by botocore instead of restarting
+    the whole object. Peak memory per file is about
+    ``part_size * max_workers``.
+    """
+
+    threshold: int = 64 * _MIB
+    part_size: int = 16 * _MIB
+    max_workers: int = 4
+
+    def __post_init__(self) -> None:
+        if self.part_size < _MIN_PART_SIZE:
+            raise ValueError(
+                f"part_size must be at least {_MIN_PART_SIZE} bytes (S3 minimum), "
+                f"got {self.part_size}"
+            )
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+
+
+def _s3_client(cfg: R2Config, max_pool_connections: int = 10):
     """Build a boto3 S3 client pointed at the R2 endpoint.
 
     region_name='auto' is required for R2; signature_version='s3v4' matches
     R2's SigV4-only auth. addressing_style='virtual' avoids R2's
-    path-style-deprecation noise.
+    path-style-deprecation noise. boto3 clients are thread-safe, so one
+    client serves every upload worker; ``max_pool_connections`` (botocore
+    defaults to 10) should be at least the worker count.
     """
     return boto3.client(
         "s3",
@@ -88,67 +169,360 @@ def _s3_client(cfg: R2Config):
         aws_access_key_id=cfg.access_key_id,
         aws_secret_access_key=cfg.secret_access_key,
         region_name="auto",
-        config=Config(signature_version="s3v4", s3={"addressing_style": "virtual"}),
+        config=Config(
+            signature_version="s3v4",
+            s3={"addressing_style": "virtual"},
+            max_pool_connections=max_pool_connections,
+        ),
     )
 
 
-def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Stream-hash a file to keep peak memory bounded for large parquets."""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
-def _row_count(conn, table: str) -> int:
-    with conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {table}")
-        return cur.fetchone()[0]
+# Multi-row statements for _record_uploads: VALUES %s takes every uploaded
+# file of a run, each expanded through the matching *_VALUES template.
+_UPSERT_ARTIFACTS = """
+    INSERT INTO parquet_artifacts
+      (table_name, partition_path, object_key, bucket, endpoint, sha256,
+       etag, size_bytes, row_count, uploaded_at, verified_at)
+    VALUES %s
+    ON CONFLICT (table_name, partition_path) DO UPDATE SET
+      object_key = EXCLUDED.object_key,
+      bucket = EXCLUDED.bucket,
+      endpoint = EXCLUDED.endpoint,
+      sha256 = EXCLUDED.sha256,
+      etag = EXCLUDED.etag,
+      size_bytes = EXCLUDED.size_bytes,
+      row_count = EXCLUDED.row_count,
+      uploaded_at = CURRENT_TIMESTAMP,
+      verified_at = CURRENT_TIMESTAMP
+"""
+_INSERT_HISTORY = """
+    INSERT INTO parquet_artifact_history
+      (table_name, partition_path, object_key, bucket, endpoint, sha256,
+       etag, size_bytes, row_count, key_scheme, manifest_entry, uploaded_at)
+    VALUES %s
+    ON CONFLICT (table_name, partition_path, bucket, object_key) DO UPDATE SET
+      endpoint = EXCLUDED.endpoint,
+      sha256 = EXCLUDED.sha256,
+      etag = EXCLUDED.etag,
+      size_bytes = EXCLUDED.size_bytes,
+      row_count = EXCLUDED.row_count,
+      key_scheme = EXCLUDED.key_scheme,
+      manifest_entry = EXCLUDED.manifest_entry,
+      uploaded_at = CURRENT_TIMESTAMP
+"""
+_ARTIFACT_VALUES = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+_HISTORY_VALUES = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)"
 
 
-def _upsert_artifact(
+def _record_uploads(
     conn,
+    cfg: R2Config,
+    uploaded: list[dict[str, Any]],
     *,
-    table_name: str,
-    object_key: str,
-    bucket: str,
-    endpoint: str,
-    sha256: str,
-    etag: str | None,
-    size_bytes: int,
-    row_count: int,
+    stale_tables: tuple[str, ...] = (),
+    manifest: dict | None = None,
 ) -> None:
-    """Insert-or-replace one parquet_artifacts row keyed on table_name."""
+    """Write ``uploaded``'s parquet_artifacts rows in one transaction.
+
+    Uploaded files are upserted (and added to parquet_artifact_history,
+    with their key scheme and, given the export's ``manifest``, their
+    manifest entry for rollback_artifact) by one multi-row statement
+    each; skipped files' rows, which already
+    describe the object, only get a new ``verified_at``. Rows of
+    ``stale_tables`` whose partition isn't in ``uploaded`` are dropped —
+    a table that switched layouts (single file <-> Hive dataset) or lost
+    partitions. The R2 objects themselves are left in place; only the
+    pointers go. One commit at the end; any failure rolls it all back.
+    """
+    rows = [
+        (r["table"], r["partition"], r["object_key"], cfg.bucket, cfg.endpoint,
+         r["sha256"], r["etag"], r["size_bytes"], r["row_count"])
+        for r in uploaded if not r["skipped"]
+    ]
+    entries = _manifest_entries(manifest, uploaded)
+    history = []
+    for row, r in zip(rows, (r for r in uploaded if not r["skipped"])):
+        entry = entries.get((r["table"], r["partition"]))
+        history.append((*row, r["key_scheme"], Json(entry) if entry else None))
+    skipped = [r for r in uploaded if r["skipped"]]
+    try:
+        with conn.cursor() as cur:
+            if rows:
+                # page_size: every row in a single statement.
+                execute_values(cur, _UPSERT_ARTIFACTS, rows,
+                               template=_ARTIFACT_VALUES, page_size=len(rows))
+                execute_values(cur, _INSERT_HISTORY, history,
+                               template=_HISTORY_VALUES, page_size=len(history))
+            if skipped:
+                cur.execute(
+                    "UPDATE parquet_artifacts a SET verified_at = CURRENT_TIMESTAMP "
+                    "FROM unnest(%s::text[], %s::text[]) AS s(table_name, partition_path) "
+                    "WHERE a.table_name = s.table_name "
+                    "AND a.partition_path = s.partition_path",
+                    ([r["table"] for r in skipped], [r["partition"] for r in skipped]),
+                )
+            if stale_tables:
+                cur.execute(
+                    "DELETE FROM parquet_artifacts "
+                    "WHERE table_name = ANY(%s) AND (table_name, partition_path) "
+                    "NOT IN (SELECT * FROM unnest(%s::text[], %s::text[]))",
+                    (list(stale_tables), [r["table"] for r in uploaded],
+                     [r["partition"] for r in uploaded]),
+                )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+@dataclass(frozen=True)
+class _Upload:
+    """One planned PUT: a local parquet and where its metadata row goes."""
+
+    table: str
+    partition_path: str
+    local_path: Path
+    # The overwrite-in-place key used by key_scheme="fixed".
+    object_key: str
+    # From the export (sidecar, else footer); None if neither has it.
+    row_count: int | None
+    # Prefix of the content-addressed key ("<table>" or "<table>/<partition>",
+    # after key_prefix); None for fixed keys.
+    content_dir: str | None = None
+    # sha256 the exporter hashed while writing the file, if still current.
+    sha256: str | None = None
+    # What parquet_artifacts currently records for this (table, partition).
+    recorded_key: str | None = None
+    recorded_sha256: str | None = None
+    recorded_etag: str | None = None
+
+    @property
+    def key_scheme(self) -> str:
+        return "fixed" if self.content_dir is None else "content"
+
+    def key(self, sha256: str) -> str:
+        """The object key for this file's content."""
+        if self.content_dir is None:
+            return self.object_key
+        return f"{self.content_dir}/{sha256}.parquet"
+
+
+def _with_recorded(conn, cfg: R2Config, plan: list[_Upload]) -> list[_Upload]:
+    """``plan`` with each upload's recorded key, sha256 and etag filled in.
+
+    A row only counts when it points at the same bucket and endpoint;
+    _put_file also requires the recorded key to be the one it would write.
+    """
     with conn.cursor() as cur:
         cur.execute(
-            """
-            INSERT INTO parquet_artifacts
-              (table_name, object_key, bucket, endpoint, sha256, etag,
-               size_bytes, row_count, uploaded_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-            ON CONFLICT (table_name) DO UPDATE SET
-              object_key = EXCLUDED.object_key,
-              bucket = EXCLUDED.bucket,
-              endpoint = EXCLUDED.endpoint,
-              sha256 = EXCLUDED.sha256,
-              etag = EXCLUDED.etag,
-              size_bytes = EXCLUDED.size_bytes,
-              row_count = EXCLUDED.row_count,
-              uploaded_at = CURRENT_TIMESTAMP
-            """,
-            (
-                table_name,
-                object_key,
-                bucket,
-                endpoint,
-                sha256,
-                etag,
-                size_bytes,
-                row_count,
-            ),
+            "SELECT table_name, partition_path, object_key, sha256, etag "
+            "FROM parquet_artifacts "
+            "WHERE bucket = %s AND endpoint = %s AND table_name = ANY(%s)",
+            (cfg.bucket, cfg.endpoint, sorted({u.table for u in plan})),
+        )
+        recorded = {(t, p): (key, sha, etag) for t, p, key, sha, etag in cur.fetchall()}
+    planned = []
+    for upload in plan:
+        key, sha256, etag = recorded.get(
+            (upload.table, upload.partition_path), (None, None, None)
         )
-    conn.commit()
+        planned.append(replace(
+            upload, recorded_key=key, recorded_sha256=sha256, recorded_etag=etag
+        ))
+    return planned
+
+
+def _remote_matches(s3, bucket: str, key: str, sha256: str, size_bytes: int) -> bool:
+    """HEAD ``key``: does the object carry this sha256 and size?"""
+    try:
+        resp = s3.head_object(Bucket=bucket, Key=key)
+    except ClientError:
+        return False
+    return (
+        (resp.get("Metadata") or {}).get("sha256") == sha256
+        and resp.get("ContentLength") == size_bytes
+    )
+
+
+def _multipart_put(
+    s3,
+    bucket: str,
+    key: str,
+    local_path: Path,
+    size_bytes: int,
+    sha256: str,
+    multipart: MultipartConfig,
+    extra_args: dict[str, str],
+) -> dict[str, Any]:
+    """Upload ``local_path`` as a multipart upload; return the complete response.
+
+    The whole-file sha256 (hashed before the first part) goes into the
+    object metadata at CreateMultipartUpload, exactly as with put_object.
+    Each worker reads its own byte range, so no part waits on another.
+    Any failure aborts the upload so no orphaned parts are billed.
+    """
+    # Grow parts if needed to stay within the 10,000-part limit.
+    part_size = max(multipart.part_size, -(-size_bytes // _MAX_PARTS))
+    ranges = [
+        (number, offset, min(part_size, size_bytes - offset))
+        for number, offset in enumerate(range(0, size_bytes, part_size), start=1)
+    ]
+    upload_id = s3.create_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        ContentType="application/vnd.apache.parquet",
+        Metadata={"sha256": sha256},
+        **extra_args,
+    )["UploadId"]
+
+    def put_part(part: tuple[int, int, int]) -> dict[str, Any]:
+        number, offset, length = part
+        with local_path.open("rb") as f:
+            f.seek(offset)
+            body = f.read(length)
+        resp = s3.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body
+        )
+        return {"PartNumber": number, "ETag": resp["ETag"]}
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=multipart.max_workers, thread_name_prefix="r2-part"
+        ) as pool:
+            parts = list(pool.map(put_part, ranges))
+        return s3.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+
+
+def _put_file(
+    upload: _Upload,
+    cfg: R2Config,
+    s3,
+    multipart: MultipartConfig | None = None,
+    check_remote: bool = False,
+) -> dict[str, Any]:
+    """PUT one local parquet file; touches no database state.
+
+    Safe to run on upload_all's worker threads. The file is only read to
+    hash it when the export sidecar gave no ``upload.sha256``. Files of at
+    least ``multipart.threshold`` bytes take the multipart path. A file whose
+    sha256 and key match ``upload.recorded_*`` is skipped (``skipped`` in
+    the result) — with ``check_remote``, only if a HEAD also finds that
+    sha256 in the object's metadata, which catches objects deleted or
+    replaced outside this pipeline.
+    """
+    multipart = multipart or MultipartConfig()
+    local_path = upload.local_path
+    sha256 = upload.sha256 or sha256_file(local_path)
+    size_bytes = local_path.stat().st_size
+    object_key = upload.key(sha256)
+    result = {
+        "table": upload.table,
+        "partition": upload.partition_path,
+        "object_key": object_key,
+        "size_bytes": size_bytes,
+        "sha256": sha256,
+        "etag": upload.recorded_etag,
+        "row_count": upload.row_count,
+        "key_scheme": upload.key_scheme,
+        "skipped": True,
+    }
+
+    unchanged = upload.recorded_sha256 == sha256 and upload.recorded_key == object_key
+    if unchanged and (
+        not check_remote
+        or _remote_matches(s3, cfg.bucket, object_key, sha256, size_bytes)
+    ):
+        logger.info(
+            "Unchanged %s at s3://%s/%s (sha256=%s), skipped",
+            upload.table, cfg.bucket, object_key, sha256[:16],
+        )
+        return result
+
+    extra_args = {}
+    if upload.content_dir is not None:
+        extra_args["CacheControl"] = _IMMUTABLE_CACHE_CONTROL
+    if size_bytes and size_bytes >= multipart.threshold:
+        resp = _multipart_put(
+            s3, cfg.bucket, object_key, local_path, size_bytes, sha256, multipart,
+            extra_args,
+        )
+    else:
+        # S3 PUT is atomic per object; concurrent readers see either the
+        # previous version or the new one, never a partial.
+        with local_path.open("rb") as f:
+            resp = s3.put_object(
+                Bucket=cfg.bucket,
+                Key=object_key,
+                Body=f,
+                ContentType="application/vnd.apache.parquet",
+                Metadata={"sha256": sha256},
+                **extra_args,
+            )
+    etag = (resp.get("ETag") or "").strip('"') or None
+
+    logger.info(
+        "Uploaded %s -> s3://%s/%s (%d bytes, sha256=%s)",
+        upload.table,
+        cfg.bucket,
+        object_key,
+        size_bytes,
+        sha256[:16],
+    )
+    return {**result, "etag": etag, "skipped": False}
+
+
+def _check_key_scheme(key_scheme: str) -> None:
+    if key_scheme not in KEY_SCHEMES:
+        raise ValueError(f"key_scheme must be one of {KEY_SCHEMES}, got {key_scheme!r}")
+
+
+def _exported_file(
+    sidecar: dict | None, partition_path: str, local_path: Path
+) -> tuple[str | None, int | None]:
+    """(sha256, row_count) of one exported file, as the exporter recorded them.
+
+    Both come from the sidecar entry written with the file while it still
+    describes it. Otherwise sha256 is None (_put_file hashes the file) and
+    the row count is read from the parquet footer — None if the file has
+    no readable footer.
+    """
+    written = sidecar_file_entry(sidecar, partition_path, local_path.stat())
+    if written and written.get("row_count") is not None:
+        return written["sha256"], written["row_count"]
+    try:
+        row_count = pq.ParquetFile(local_path).metadata.num_rows
+    except pa.ArrowInvalid:
+        logger.warning("No parquet footer in %s; recording row_count NULL", local_path)
+        row_count = None
+    return (written["sha256"] if written else None), row_count
+
+
+def _file_upload(
+    table: str, source_dir: Path, key_prefix: str, key_scheme: str
+) -> _Upload:
+    """Plan the single-file upload of ``<table>.parquet``."""
+    local_path = source_dir / f"{table}.parquet"
+    if not local_path.exists():
+        raise FileNotFoundError(
+            f"Local parquet not found: {local_path}. Run export-parquets first."
+        )
+    object_key = f"{key_prefix}{table}.parquet" if key_prefix else f"{table}.parquet"
+    sha256, row_count = _exported_file(
+        read_sidecar(source_dir / f"{table}{SIDECAR_SUFFIX}"), "", local_path
+    )
+    return _Upload(
+        table, "", local_path, object_key, row_count,
+        content_dir=f"{key_prefix}{table}" if key_scheme == "content" else None,
+        sha256=sha256,
+    )
 
 
 def upload_table(
@@ -159,75 +533,203 @@ def upload_table(
     s3=None,
     source_dir: Path = PARQUET_DIR,
     key_prefix: str = "",
+    multipart: MultipartConfig | None = None,
+    force: bool = False,
+    check_remote: bool = False,
+    key_scheme: str = DEFAULT_KEY_SCHEME,
 ) -> dict[str, Any]:
     """Upload one parquet file to R2 and record metadata in Postgres.
 
-    Returns a dict describing the uploaded artifact. Raises if the local
-    parquet file is missing — caller is expected to run ``export-parquets``
-    first.
+    The object key is ``<key_prefix><table>/<sha256>.parquet``, or
+    ``<key_prefix><table>.parquet`` with ``key_scheme="fixed"``.
+    Returns a dict describing the uploaded artifact, with ``skipped`` True
+    when parquet_artifacts already records this sha256 for the object (see
+    _put_file for ``check_remote``; ``force`` always uploads). Raises if
+    the local parquet file is missing — caller is expected to run
+    ``export-parquets`` first.
     """
+    _check_key_scheme(key_scheme)
     cfg = cfg or R2Config.from_env()
     s3 = s3 or _s3_client(cfg)
 
-    local_path = source_dir / f"{table}.parquet"
-    if not local_path.exists():
-        raise FileNotFoundError(
-            f"Local parquet not found: {local_path}. Run export-parquets first."
-        )
+    plan = [_file_upload(table, source_dir, key_prefix, key_scheme)]
+    if not force:
+        plan = _with_recorded(conn, cfg, plan)
+    result = _put_file(plan[0], cfg, s3, multipart, check_remote)
+    _record_uploads(conn, cfg, [result], stale_tables=(table,))
+    return result
+
+
+def _dataset_partitions(dataset_dir: Path) -> list[tuple[str, Path]]:
+    """[(partition_path, file), ...] for a Hive dataset, sorted by path."""
+    return sorted(
+        (f.parent.relative_to(dataset_dir).as_posix(), f)
+        for f in dataset_dir.rglob("*.parquet")
+    )
 
-    sha256 = _sha256_file(local_path)
-    size_bytes = local_path.stat().st_size
-    object_key = f"{key_prefix}{table}.parquet" if key_prefix else f"{table}.parquet"
 
-    # S3 PUT is atomic per object; concurrent readers see either the
-    # previous version or the new one, never a partial.
-    with local_path.open("rb") as f:
-        resp = s3.put_object(
-            Bucket=cfg.bucket,
-            Key=object_key,
-            Body=f,
-            ContentType="application/vnd.apache.parquet",
-            Metadata={"sha256": sha256},
+def _dataset_uploads(
+    table: str, source_dir: Path, key_prefix: str, key_scheme: str
+) -> list[_Upload]:
+    """Plan one upload per partition file of the ``<table>/`` Hive dataset."""
+    dataset_dir = source_dir / table
+    if not dataset_dir.is_dir():
+        raise FileNotFoundError(
+            f"Local dataset not found: {dataset_dir}. "
+            "Run export-parquets --layout hive first."
         )
-    etag = (resp.get("ETag") or "").strip('"') or None
+    sidecar = read_sidecar(source_dir / f"{table}{SIDECAR_SUFFIX}")
+    plan = []
+    for partition_path, local_path in _dataset_partitions(dataset_dir):
+        sha256, row_count = _exported_file(sidecar, partition_path, local_path)
+        plan.append(_Upload(
+            table,
+            partition_path,
+            local_path,
+            f"{key_prefix}{table}/{partition_path}/{local_path.name}",
+            row_count,
+            content_dir=(
+                f"{key_prefix}{table}/{partition_path}"
+                if key_scheme == "content" else None
+            ),
+            sha256=sha256,
+        ))
+    return plan
 
-    row_count = _row_count(conn, table)
 
-    _upsert_artifact(
-        conn,
-        table_name=table,
-        object_key=object_key,
-        bucket=cfg.bucket,
-        endpoint=cfg.endpoint,
-        sha256=sha256,
-        etag=etag,
-        size_bytes=size_bytes,
-        row_count=row_count,
-    )
+def upload_dataset(
+    conn,
+    table: str,
+    cfg: R2Config | None = None,
+    *,
+    s3=None,
+    source_dir: Path = PARQUET_DIR,
+    key_prefix: str = "",
+    multipart: MultipartConfig | None = None,
+    force: bool = False,
+    check_remote: bool = False,
+    key_scheme: str = DEFAULT_KEY_SCHEME,
+) -> list[dict[str, Any]]:
+    """Upload a Hive-partitioned dataset, one parquet_artifacts row per partition.
 
-    logger.info(
-        "Uploaded %s -> s3://%s/%s (%d bytes, sha256=%s)",
-        table,
-        cfg.bucket,
-        object_key,
-        size_bytes,
-        sha256[:16],
-    )
-    return {
-        "table": table,
-        "object_key": object_key,
-        "size_bytes": size_bytes,
-        "sha256": sha256,
-        "etag": etag,
-        "row_count": row_count,
-    }
+    Object keys keep the local partition directories
+    (``<table>/season_id=2026/stat_period=espn_last_7/<sha256>.parquet``).
+    With ``key_scheme="fixed"`` they mirror the local layout exactly
+    (``.../part-0.parquet``), so a DuckDB/Polars ``hive_partitioning`` glob
+    over the bucket sees one file per partition; content-addressed
+    partitions accumulate generations, so list current keys from
+    parquet_artifacts or manifest.json instead of globbing.
+    Unchanged partitions are skipped as in upload_table, and every row is
+    written in one transaction after the last PUT.
+    """
+    _check_key_scheme(key_scheme)
+    cfg = cfg or R2Config.from_env()
+    s3 = s3 or _s3_client(cfg)
+
+    plan = _dataset_uploads(table, source_dir, key_prefix, key_scheme)
+    if not force and plan:
+        plan = _with_recorded(conn, cfg, plan)
+    results = []
+    try:
+        for upload in plan:
+            results.append(_put_file(upload, cfg, s3, multipart, check_remote))
+    except Exception:
+        # As in upload_all: record what landed, drop nothing, re-raise.
+        _record_uploads(conn, cfg, results)
+        raise
+    _record_uploads(conn, cfg, results, stale_tables=(table,))
+    return results
 
 
 # Parquet files start AND end with the 4-byte ASCII magic "PAR1".
-# Checking the leading bytes catches "object exists but wasn't a parquet"
-# regressions cheaply (4 bytes via a Range GET).
+# Checking both ends catches "object exists but wasn't a parquet" and
+# truncated-upload regressions cheaply (4 bytes each via a Range GET).
 _PARQUET_MAGIC = b"PAR1"
 
+# fast: HEAD (size, ETag, sha256 metadata) + Range GETs of both PAR1 magics,
+#       8 bytes of body per object. Trusts the sha256 the uploader stored.
+# deep: stream the whole body through sha256 in _VERIFY_CHUNK pieces, so
+#       memory stays flat however large the object.
+VERIFY_MODES = ("fast", "deep")
+DEFAULT_VERIFY_MODE = "deep"
+# Objects checked at once by verify_all; like uploads, network-bound.
+DEFAULT_VERIFY_WORKERS = 8
+_VERIFY_CHUNK = 1024 * 1024
+
+
+def _verify_fast(
+    s3, bucket: str, object_key: str, expected_sha256: str, expected_size: int,
+    expected_etag: str | None,
+) -> tuple[str | None, int]:
+    """(error or None, body bytes read) for a HEAD + magic-bytes check."""
+    try:
+        head = s3.head_object(Bucket=bucket, Key=object_key)
+    except Exception as e:  # botocore.ClientError or transport errors
+        return f"HEAD failed: {e}", 0
+    size = head.get("ContentLength")
+    if size != expected_size:
+        return f"size mismatch: expected {expected_size}, got {size}", 0
+    meta_sha256 = (head.get("Metadata") or {}).get("sha256") or ""
+    if meta_sha256 != expected_sha256:
+        return (
+            f"sha256 metadata mismatch: expected {expected_sha256[:16]}..., "
+            f"got {meta_sha256[:16] or 'none'}..."
+        ), 0
+    etag = (head.get("ETag") or "").strip('"') or None
+    if expected_etag and etag != expected_etag:
+        return f"etag mismatch: expected {expected_etag}, got {etag}", 0
+    try:
+        lead, tail = (
+            s3.get_object(Bucket=bucket, Key=object_key, Range=r)["Body"].read()
+            for r in ("bytes=0-3", "bytes=-4")
+        )
+    except Exception as e:
+        return f"GET failed: {e}", 0
+    bytes_read = len(lead) + len(tail)
+    if lead != _PARQUET_MAGIC:
+        return f"bad magic: expected b'PAR1', got {lead!r}", bytes_read
+    if tail != _PARQUET_MAGIC:
+        return f"bad magic: expected trailing b'PAR1', got {tail!r}", bytes_read
+    return None, bytes_read
+
+
+def _verify_deep(
+    s3, bucket: str, object_key: str, expected_sha256: str, expected_size: int,
+) -> tuple[str | None, int]:
+    """(error or None, body bytes read) for a streamed full-body check."""
+    try:
+        resp = s3.get_object(Bucket=bucket, Key=object_key)
+    except Exception as e:  # botocore.ClientError or transport errors
+        return f"GET failed: {e}", 0
+
+    h = hashlib.sha256()
+    size = 0
+    lead = tail = b""
+    body = resp["Body"]
+    try:
+        for chunk in iter(lambda: body.read(_VERIFY_CHUNK), b""):
+            if len(lead) < 4:
+                lead += chunk[: 4 - len(lead)]
+            tail = (tail + chunk)[-4:]
+            h.update(chunk)
+            size += len(chunk)
+    except Exception as e:
+        return f"GET failed: {e}", size
+
+    if size != expected_size:
+        return f"size mismatch: expected {expected_size}, got {size}", size
+    if lead != _PARQUET_MAGIC:
+        return f"bad magic: expected b'PAR1', got {lead!r}", size
+    if tail != _PARQUET_MAGIC:
+        return f"bad magic: expected trailing b'PAR1', got {tail!r}", size
+    actual_sha256 = h.hexdigest()
+    if actual_sha256 != expected_sha256:
+        return (
+            f"sha256 mismatch: expected {expected_sha256[:16]}..., "
+            f"got {actual_sha256[:16]}..."
+        ), size
+    return None, size
+
 
 def verify_table(
     conn,
@@ -235,87 +737,112 @@ def verify_table(
     cfg: R2Config | None = None,
     *,
     s3=None,
+    partition_path: str = "",
+    mode: str = DEFAULT_VERIFY_MODE,
 ) -> dict[str, Any]:
     """Verify one R2 object matches its parquet_artifacts row.
 
-    Checks:
-      1. Object exists in R2 (HEAD via get_object).
-      2. First 4 bytes are the parquet PAR1 magic.
-      3. Full-object sha256 matches the recorded sha256.
+    ``mode="deep"`` checks:
+      1. Object exists in R2 (GET).
+      2. Size matches the recorded size_bytes.
+      3. The body starts and ends with the parquet PAR1 magic.
+      4. Full-object sha256, hashed as the body streams in, matches.
 
-    Returns a result dict including ``ok: bool`` and any ``error`` reason.
+    ``mode="fast"`` checks existence, size, ETag (when recorded) and the
+    ``sha256`` user metadata with one HEAD, then the two PAR1 magics with
+    4-byte Range GETs; it never downloads the body.
+
+    Returns a result dict including ``ok: bool``, any ``error`` reason and
+    ``bytes_read`` (body bytes fetched).
     """
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"mode must be one of {VERIFY_MODES}, got {mode!r}")
     cfg = cfg or R2Config.from_env()
     s3 = s3 or _s3_client(cfg)
 
     with conn.cursor() as cur:
         cur.execute(
-            "SELECT object_key, sha256, size_bytes "
-            "FROM parquet_artifacts WHERE table_name = %s",
-            (table,),
+            "SELECT object_key, sha256, size_bytes, etag FROM parquet_artifacts "
+            "WHERE table_name = %s AND partition_path = %s",
+            (table, partition_path),
         )
         row = cur.fetchone()
     if row is None:
-        return {"table": table, "ok": False, "error": "no parquet_artifacts row"}
-    object_key, expected_sha256, expected_size = row
+        return {"table": table, "partition": partition_path, "ok": False,
+                "mode": mode, "bytes_read": 0, "error": "no parquet_artifacts row"}
+    return _verify_object(s3, cfg, (table, partition_path, *row), mode)
 
-    try:
-        resp = s3.get_object(Bucket=cfg.bucket, Key=object_key)
-    except Exception as e:  # botocore.ClientError or transport errors
-        return {"table": table, "ok": False, "error": f"GET failed: {e}"}
-
-    body = resp["Body"].read()
-    if len(body) != expected_size:
-        return {
-            "table": table,
-            "ok": False,
-            "error": f"size mismatch: expected {expected_size}, got {len(body)}",
-        }
-    if body[:4] != _PARQUET_MAGIC:
-        return {
-            "table": table,
-            "ok": False,
-            "error": f"bad magic: expected b'PAR1', got {body[:4]!r}",
-        }
-    actual_sha256 = hashlib.sha256(body).hexdigest()
-    if actual_sha256 != expected_sha256:
-        return {
-            "table": table,
-            "ok": False,
-            "error": f"sha256 mismatch: expected {expected_sha256[:16]}..., "
-                     f"got {actual_sha256[:16]}...",
-        }
-    return {
+
+def _verify_object(s3, cfg: R2Config, artifact: tuple, mode: str) -> dict[str, Any]:
+    """Check one object against its parquet_artifacts values; no DB access.
+
+    ``artifact`` is (table_name, partition_path, object_key, sha256,
+    size_bytes, etag). Safe to run on verify_all's worker threads.
+    """
+    table, partition_path, object_key, sha256, size_bytes, etag = artifact
+    if mode == "fast":
+        error, bytes_read = _verify_fast(
+            s3, cfg.bucket, object_key, sha256, size_bytes, etag
+        )
+    else:
+        error, bytes_read = _verify_deep(s3, cfg.bucket, object_key, sha256, size_bytes)
+    result = {
         "table": table,
+        "partition": partition_path,
+        "mode": mode,
+        "bytes_read": bytes_read,
+    }
+    if error is not None:
+        return {**result, "ok": False, "error": error}
+    return {
+        **result,
         "ok": True,
         "object_key": object_key,
-        "sha256": actual_sha256,
-        "size_bytes": len(body),
+        "sha256": sha256,
+        "size_bytes": size_bytes,
     }
 
 
 def verify_all(
     conn,
     cfg: R2Config | None = None,
+    *,
+    mode: str = DEFAULT_VERIFY_MODE,
+    max_workers: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Verify every parquet_artifacts row against its R2 object."""
+    """Verify every parquet_artifacts row (each partition too) against R2.
+
+    Reads all rows in one query, then checks up to ``max_workers``
+    (default DEFAULT_VERIFY_WORKERS) objects at once over one shared
+    client, each as verify_table would in ``mode``. Results are returned in
+    (table_name, partition_path) order however the checks finish.
+    """
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"mode must be one of {VERIFY_MODES}, got {mode!r}")
     cfg = cfg or R2Config.from_env()
-    s3 = _s3_client(cfg)
+    workers = max_workers or DEFAULT_VERIFY_WORKERS
+    s3 = _s3_client(cfg, max_pool_connections=workers)
 
     with conn.cursor() as cur:
         cur.execute(
-            "SELECT table_name FROM parquet_artifacts ORDER BY table_name"
+            "SELECT table_name, partition_path, object_key, sha256, size_bytes, etag "
+            "FROM parquet_artifacts ORDER BY table_name, partition_path"
         )
-        tables = [r[0] for r in cur.fetchall()]
+        artifacts = cur.fetchall()
 
-    results: list[dict[str, Any]] = []
     with _progress("🔍 Verifying R2 objects") as progress:
-        task = progress.add_task("verify", total=len(tables), current="")
-        for t in tables:
-            progress.update(task, current=t)
-            results.append(verify_table(conn, t, cfg, s3=s3))
-            progress.update(task, advance=1)
-    return results
+        task = progress.add_task("verify", total=len(artifacts), current="")
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="r2-verify"
+        ) as pool:
+            futures = {
+                pool.submit(_verify_object, s3, cfg, artifact, mode): i
+                for i, artifact in enumerate(artifacts)
+            }
+            for future in as_completed(futures):
+                progress.update(task, advance=1, current=artifacts[futures[future]][0])
+    # dicts keep insertion order: futures is in artifact order.
+    return [future.result() for future in futures]
 
 
 def _progress(title: str) -> Progress:
@@ -337,40 +864,391 @@ def _progress(title: str) -> Progress:
     )
 
 
+def _plan_table(
+    table: str, source_dir: Path, key_prefix: str, key_scheme: str
+) -> list[_Upload]:
+    """Plan ``table``'s uploads: one per partition for a Hive dataset dir."""
+    if (source_dir / table).is_dir():
+        return _dataset_uploads(table, source_dir, key_prefix, key_scheme)
+    return [_file_upload(table, source_dir, key_prefix, key_scheme)]
+
+
+def _await_puts(
+    pool: ThreadPoolExecutor,
+    futures: dict[Future, int],
+    plan: list[_Upload],
+    progress: Progress,
+    task,
+) -> tuple[list[dict[str, Any]], Exception | None]:
+    """Wait for ``futures`` (future -> plan index); return (landed results, error).
+
+    The first failure cancels every PUT not yet started. PUTs already in
+    flight are waited for, and those that landed are still returned, in
+    plan order, so the caller can record them.
+    """
+    results: list[dict[str, Any] | None] = [None] * len(plan)
+    error: Exception | None = None
+    for future in as_completed(futures):
+        i = futures[future]
+        try:
+            results[i] = future.result()
+        except Exception as e:
+            logger.error("Failed to upload %s: %s", plan[i].object_key, e)
+            error = e
+            pool.shutdown(wait=False, cancel_futures=True)
+            break
+        progress.update(task, advance=1, current=plan[i].table)
+    pool.shutdown(wait=True)
+    for future, i in futures.items():
+        landed = future.done() and not future.cancelled() and future.exception() is None
+        if results[i] is None and landed:
+            results[i] = future.result()
+    return [r for r in results if r is not None], error
+
+
+def _manifest_entries(
+    manifest: dict | None, uploaded: list[dict[str, Any]]
+) -> dict[tuple[str, str], dict]:
+    """(table, partition) -> copy of its manifest artifact with object_key set.
+
+    In manifest order. Artifacts not in ``uploaded`` get ``object_key``
+    None; ``manifest`` itself is not modified.
+    """
+    keys = {(r["table"], r["partition"]): r["object_key"] for r in uploaded}
+    entries = {}
+    for artifact in (manifest or {}).get("artifacts", []):
+        key = (artifact["table"], artifact["partition_path"])
+        entries[key] = {**artifact, "object_key": keys.get(key)}
+    return entries
+
+
+def _put_manifest(s3, bucket: str, key_prefix: str, manifest: dict) -> None:
+    s3.put_object(
+        Bucket=bucket,
+        Key=f"{key_prefix}{MANIFEST_NAME}",
+        Body=json.dumps(manifest, separators=(",", ":")).encode(),
+        ContentType="application/json",
+        CacheControl=_MANIFEST_CACHE_CONTROL,
+    )
+
+
+def _upload_manifest(
+    s3, cfg: R2Config, key_prefix: str, manifest: dict | None,
+    uploaded: list[dict[str, Any]],
+) -> None:
+    """PUT the export's manifest.json, if any, with each artifact's object_key."""
+    if manifest is None:
+        return
+    artifacts = list(_manifest_entries(manifest, uploaded).values())
+    _put_manifest(s3, cfg.bucket, key_prefix, {**manifest, "artifacts": artifacts})
+
+
 def upload_all(
     conn,
     cfg: R2Config | None = None,
     *,
     source_dir: Path = PARQUET_DIR,
     key_prefix: str = "",
+    max_workers: int | None = None,
+    multipart: MultipartConfig | None = None,
+    force: bool = False,
+    check_remote: bool = False,
+    key_scheme: str = DEFAULT_KEY_SCHEME,
 ) -> list[dict[str, Any]]:
-    """Upload every table in EXPORTED_TABLES; return per-table result dicts.
+    """Upload every table in EXPORTED_TABLES; return per-artifact result dicts.
+
+    Tables exported as Hive datasets (a ``<table>/`` directory) upload one
+    object per partition; the rest upload as one file. Every file is
+    planned first (a missing one raises before any PUT), then up to
+    ``max_workers`` PUTs (default DEFAULT_UPLOAD_WORKERS) run at once over
+    a single boto3 client, large files as parallel multipart uploads per
+    ``multipart``. Results come back in plan order — EXPORTED_TABLES
+    order, partitions sorted — whatever order the PUTs finish in.
+    Files unchanged since their recorded upload are skipped as in
+    upload_table and come back with ``skipped`` True.
 
-    Reuses a single boto3 S3 client across uploads so the TLS connection
-    and signing context aren't rebuilt 13 times.
+    The parquet_artifacts upserts and stale-row deletes then run in one
+    transaction. If a PUT fails, the objects that did land are still
+    recorded (their old rows would otherwise point at replaced bytes), no
+    stale rows are dropped, and the error is re-raised.
+
+    The export's manifest.json, if present, is uploaded last as
+    ``<key_prefix>manifest.json`` with Cache-Control no-cache. Each of its
+    artifacts gains the ``object_key`` it was uploaded under, so one GET
+    tells a client what changed and where to fetch it. It has no
+    parquet_artifacts row.
     """
+    _check_key_scheme(key_scheme)
     cfg = cfg or R2Config.from_env()
-    s3 = _s3_client(cfg)
-    results: list[dict[str, Any]] = []
+    workers = max_workers or DEFAULT_UPLOAD_WORKERS
+    multipart = multipart or MultipartConfig()
+    # Each file worker may run its own pool of part uploads.
+    s3 = _s3_client(cfg, max_pool_connections=workers * multipart.max_workers)
+
+    plan: list[_Upload] = []
+    for table in EXPORTED_TABLES:
+        plan.extend(_plan_table(table, source_dir, key_prefix, key_scheme))
+    if not force:
+        plan = _with_recorded(conn, cfg, plan)
+
     with _progress("☁️  Uploading to R2") as progress:
-        task = progress.add_task(
-            "upload", total=len(EXPORTED_TABLES), current=""
+        task = progress.add_task("upload", total=len(plan), current="")
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="r2-upload")
+        futures = {
+            pool.submit(_put_file, upload, cfg, s3, multipart, check_remote): i
+            for i, upload in enumerate(plan)
+        }
+        uploaded, error = _await_puts(pool, futures, plan, progress, task)
+
+    manifest = read_manifest(source_dir)
+    _record_uploads(
+        conn, cfg, uploaded, stale_tables=EXPORTED_TABLES if error is None else (),
+        manifest=manifest,
+    )
+    if error is not None:
+        raise error
+    # Last, so it never lists objects that aren't in the bucket yet.
+    _upload_manifest(s3, cfg, key_prefix, manifest, uploaded)
+    return uploaded
+
+
+class UploadPipeline:
+    """upload_all fed one table at a time, as each table finishes exporting.
+
+    ``submit(table)`` plans the table's files (as upload_all would) and
+    starts their PUTs on the pool right away, so uploads overlap whatever
+    the caller does next — typically exporting the following tables (see
+    exporters.pipeline). ``finish()`` waits for the rest and then behaves
+    like the end of upload_all: one transaction of parquet_artifacts
+    writes, stale rows dropped, manifest.json uploaded last. ``abort()``
+    is for a producer that failed: it stops unstarted PUTs and records
+    the objects that already landed, without dropping stale rows.
+
+    ``conn`` is used only on the calling thread; give the pipeline its own
+    connection when the producer holds a transaction open on another.
+    ``busy_seconds``, ``first_submit`` and ``last_done`` (perf_counter
+    times) describe the upload stage for utilization reporting.
+    """
+
+    def __init__(
+        self,
+        conn,
+        cfg: R2Config | None = None,
+        *,
+        source_dir: Path = PARQUET_DIR,
+        key_prefix: str = "",
+        max_workers: int | None = None,
+        multipart: MultipartConfig | None = None,
+        force: bool = False,
+        check_remote: bool = False,
+        key_scheme: str = DEFAULT_KEY_SCHEME,
+    ) -> None:
+        _check_key_scheme(key_scheme)
+        self._conn = conn
+        self._cfg = cfg or R2Config.from_env()
+        self._source_dir = source_dir
+        self._key_prefix = key_prefix
+        self._multipart = multipart or MultipartConfig()
+        self._force = force
+        self._check_remote = check_remote
+        self._key_scheme = key_scheme
+        self.workers = max_workers or DEFAULT_UPLOAD_WORKERS
+        self._s3 = _s3_client(
+            self._cfg, max_pool_connections=self.workers * self._multipart.max_workers
         )
-        for table in EXPORTED_TABLES:
-            progress.update(task, current=table)
-            try:
-                results.append(
-                    upload_table(
-                        conn,
-                        table,
-                        cfg,
-                        s3=s3,
-                        source_dir=source_dir,
-                        key_prefix=key_prefix,
-                    )
-                )
-            except Exception as e:
-                logger.error("Failed to upload %s: %s", table, e)
-                raise
-            progress.update(task, advance=1)
-    return results
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="r2-upload"
+        )
+        self._plan: list[_Upload] = []
+        self._futures: dict[Future, int] = {}
+        self._lock = threading.Lock()
+        self.busy_seconds = 0.0
+        self.first_submit: float | None = None
+        self.last_done: float | None = None
+
+    def _put(self, upload: _Upload) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return _put_file(
+                upload, self._cfg, self._s3, self._multipart, self._check_remote
+            )
+        finally:
+            done = time.perf_counter()
+            with self._lock:
+                self.busy_seconds += done - start
+                self.last_done = max(self.last_done or done, done)
+
+    def submit(self, table: str) -> int:
+        """Plan ``table``'s files and start their PUTs; return how many."""
+        uploads = _plan_table(
+            table, self._source_dir, self._key_prefix, self._key_scheme
+        )
+        if not self._force and uploads:
+            uploads = _with_recorded(self._conn, self._cfg, uploads)
+        if self.first_submit is None:
+            self.first_submit = time.perf_counter()
+        for upload in uploads:
+            self._futures[self._pool.submit(self._put, upload)] = len(self._plan)
+            self._plan.append(upload)
+        return len(uploads)
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Wait for every PUT, record them and upload the manifest; return results.
+
+        Results are in submit order (partitions sorted within a table).
+        A failed PUT is handled as in upload_all and re-raised.
+        """
+        with _progress("☁️  Uploading to R2") as progress:
+            task = progress.add_task("upload", total=len(self._plan), current="")
+            uploaded, error = _await_puts(
+                self._pool, self._futures, self._plan, progress, task
+            )
+        manifest = read_manifest(self._source_dir)
+        _record_uploads(
+            self._conn, self._cfg, uploaded,
+            stale_tables=EXPORTED_TABLES if error is None else (),
+            manifest=manifest,
+        )
+        if error is not None:
+            raise error
+        _upload_manifest(self._s3, self._cfg, self._key_prefix, manifest, uploaded)
+        return uploaded
+
+    def abort(self) -> list[dict[str, Any]]:
+        """Cancel unstarted PUTs; record (and return) the ones that landed."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        landed = [
+            (i, future.result()) for future, i in self._futures.items()
+            if not future.cancelled() and future.exception() is None
+        ]
+        uploaded = [result for _, result in sorted(landed, key=lambda x: x[0])]
+        _record_uploads(self._conn, self._cfg, uploaded)
+        return uploaded
+
+
+# Manifest fields describing a file's content. A generation uploaded without
+# a manifest has no recorded entry, so rollback_artifact drops these from the
+# entry it repoints rather than leave the newer generation's values behind.
+_MANIFEST_CONTENT_FIELDS = (
+    "mtime_ns", "schema", "schema_hash", "fingerprint", "columns",
+)
+
+
+def _rollback_manifest(
+    s3, bucket: str, key_prefix: str, table: str, partition_path: str,
+    recorded: dict | None, pointer: dict[str, Any],
+) -> bool:
+    """Re-PUT the bucket's manifest.json pointing this artifact at ``pointer``.
+
+    ``pointer`` (object_key, sha256, size_bytes, row_count) is laid over
+    the generation's ``recorded`` manifest entry or, lacking one, over the
+    current entry minus _MANIFEST_CONTENT_FIELDS. Returns False when the
+    bucket has no manifest or the manifest doesn't list the artifact.
+    """
+    try:
+        body = s3.get_object(Bucket=bucket, Key=f"{key_prefix}{MANIFEST_NAME}")["Body"]
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+            return False
+        raise
+    manifest = json.loads(body.read())
+    for i, artifact in enumerate(manifest.get("artifacts", [])):
+        if (artifact["table"], artifact["partition_path"]) == (table, partition_path):
+            break
+    else:
+        return False
+    if recorded is None:
+        recorded = {k: v for k, v in artifact.items() if k not in _MANIFEST_CONTENT_FIELDS}
+    manifest["artifacts"][i] = {**recorded, **pointer}
+    _put_manifest(s3, bucket, key_prefix, manifest)
+    return True
+
+
+def rollback_artifact(
+    conn,
+    table: str,
+    sha256: str,
+    cfg: R2Config | None = None,
+    *,
+    s3=None,
+    partition_path: str = "",
+) -> dict[str, Any]:
+    """Point ``table`` (or one partition) back at an earlier uploaded generation.
+
+    The parquet_artifacts row is replaced by the parquet_artifact_history
+    row with that sha256, keeping its original uploaded_at. The bucket's
+    manifest.json, if it lists the artifact, is re-PUT with that
+    generation's entry (as recorded at upload) so manifest readers see the
+    rollback too; the row is committed only once that PUT succeeded. No
+    parquet object is written or deleted. Only content-addressed
+    generations qualify — a fixed key has since been overwritten. Run
+    verify-r2 afterwards to confirm the object is still there.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT object_key, bucket, endpoint, etag, size_bytes, row_count, "
+            "uploaded_at, key_scheme, manifest_entry FROM parquet_artifact_history "
+            "WHERE table_name = %s AND partition_path = %s AND sha256 = %s "
+            "ORDER BY uploaded_at DESC LIMIT 1",
+            (table, partition_path, sha256),
+        )
+        row = cur.fetchone()
+    label = f"{table}/{partition_path}" if partition_path else table
+    if row is None:
+        raise ValueError(f"No uploaded generation of {label} with sha256 {sha256}")
+    (object_key, bucket, endpoint, etag, size_bytes, row_count, uploaded_at,
+     key_scheme, manifest_entry) = row
+    if key_scheme != "content":
+        raise ValueError(
+            f"Generation {sha256[:16]}... of {label} was uploaded to the fixed "
+            f"key {object_key}, since overwritten; only content-addressed "
+            "generations can be rolled back to"
+        )
+    cfg = replace(cfg or R2Config.from_env(), bucket=bucket, endpoint=endpoint)
+    s3 = s3 or _s3_client(cfg)
+    # Content keys end in <table>[/<partition>]/<sha256>.parquet; the rest
+    # is the key_prefix the manifest was uploaded under.
+    suffix = "/".join(p for p in (table, partition_path, f"{sha256}.parquet") if p)
+    key_prefix = object_key[: -len(suffix)]
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO parquet_artifacts
+                  (table_name, partition_path, object_key, bucket, endpoint, sha256,
+                   etag, size_bytes, row_count, uploaded_at, verified_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NULL)
+                ON CONFLICT (table_name, partition_path) DO UPDATE SET
+                  object_key = EXCLUDED.object_key,
+                  bucket = EXCLUDED.bucket,
+                  endpoint = EXCLUDED.endpoint,
+                  sha256 = EXCLUDED.sha256,
+                  etag = EXCLUDED.etag,
+                  size_bytes = EXCLUDED.size_bytes,
+                  row_count = EXCLUDED.row_count,
+                  uploaded_at = EXCLUDED.uploaded_at,
+                  verified_at = NULL
+                """,
+                (table, partition_path, object_key, bucket, endpoint, sha256, etag,
+                 size_bytes, row_count, uploaded_at),
+            )
+        manifest_updated = _rollback_manifest(
+            s3, bucket, key_prefix, table, partition_path, manifest_entry,
+            {"object_key": object_key, "sha256": sha256,
+             "size_bytes": size_bytes, "row_count": row_count},
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info("Rolled %s back to s3://%s/%s", label, bucket, object_key)
+    return {
+        "table": table,
+        "partition": partition_path,
+        "object_key": object_key,
+        "sha256": sha256,
+        "size_bytes": size_bytes,
+        "row_count": row_count,
+        "uploaded_at": uploaded_at,
+        "manifest_updated": manifest_updated,
+    }
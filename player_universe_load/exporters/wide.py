@@ -0,0 +1,211 @@
+"""Denormalized one-row-per-player-per-season table for analytics.
+
+Most notebooks start by joining players, both stats tables, valuations and
+roster_slots and pivoting stat_period. ``player_universe_wide`` is that
+join done once, as a single SELECT the parquet exporter reads like any
+other table (fingerprint, skip-unchanged, COPY path, R2 upload):
+
+- player attributes from ``players`` (``id_espn`` as ``player_id``);
+- ``<period>_bat_<stat>`` / ``<period>_pit_<stat>`` for every stat column
+  of player_stats_batting / player_stats_pitching and every period label
+  the player loader writes (``espn_current_bat_HR``, ``savant_all_pit_xwOBA``);
+- ``<scenario>_{primary_position,tier,total_z,total_dollars}`` for every
+  VALUATION_TYPES scenario. Two-way players keep their highest-dollar
+  position per scenario;
+- ``roster_count`` and ``rosters``, a JSONB array of the player's roster
+  slots that season (one per league), ordered by league.
+
+Each base table is scanned once; the pivots are ``FILTER``ed aggregates
+over the stats tables' unique (player, season, period) rows.
+
+The column set comes from the loader's column specs and period labels, not
+from the data, so the artifact's schema stays stable across loads even when
+a period has no rows.
+
+Nothing is created in the database: the exporter runs wide_select_sql() as
+a subquery inside its export snapshot, and wide_column_types() stands in
+for information_schema, which only knows real relations.
+"""
+
+from __future__ import annotations
+
+from psycopg2 import sql
+
+from ..loaders.players import (
+    BATTING_DB_COLUMNS,
+    ESPN_PERIOD_LABELS,
+    PITCHING_DB_COLUMNS,
+    PLAYER_COLUMNS,
+    SAVANT_TABULAR_LABELS,
+)
+
+WIDE_TABLE = "player_universe_wide"
+
+# stat_period values pivoted into columns, in column order.
+STAT_PERIODS: tuple[str, ...] = (
+    tuple(ESPN_PERIOD_LABELS.values()) + tuple(SAVANT_TABULAR_LABELS.values())
+)
+
+# Valuation scenarios (player_valuations.valuation_type) pivoted into columns.
+VALUATION_TYPES: tuple[str, ...] = ("preseason", "updated", "ros", "synthetic", "current")
+_VALUATION_FIELDS: tuple[str, ...] = ("primary_position", "tier", "total_z", "total_dollars")
+
+# (stats table, column infix, stat columns)
+_STAT_SOURCES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("player_stats_batting", "bat", BATTING_DB_COLUMNS),
+    ("player_stats_pitching", "pit", PITCHING_DB_COLUMNS),
+)
+
+# Postgres truncates identifiers longer than this, which would silently
+# merge pivot columns.
+_MAX_IDENTIFIER_LENGTH = 63
+
+
+def wide_columns() -> list[str]:
+    """Column names of the wide table, in order."""
+    cols = ["player_id", "season_id"]
+    cols += [c for c in PLAYER_COLUMNS if c != "id_espn"]
+    cols += [f"{vt}_{f}" for vt in VALUATION_TYPES for f in _VALUATION_FIELDS]
+    cols += ["roster_count", "rosters"]
+    for _, infix, stats in _STAT_SOURCES:
+        cols += [f"{period}_{infix}_{stat}" for period in STAT_PERIODS for stat in stats]
+    return cols
+
+
+def _pivot(source: str, infix: str, stats: tuple[str, ...]) -> sql.Composed:
+    """One row per (player, season) of ``source`` with periods as columns."""
+    exprs = [
+        sql.SQL("max({c}) FILTER (WHERE stat_period = {p}) AS {alias}").format(
+            c=sql.Identifier(stat), p=sql.Literal(period),
+            alias=sql.Identifier(f"{period}_{infix}_{stat}"),
+        )
+        for period in STAT_PERIODS
+        for stat in stats
+    ]
+    return sql.SQL(
+        "SELECT player_id, season_id, {exprs} FROM {source} GROUP BY player_id, season_id"
+    ).format(exprs=sql.SQL(", ").join(exprs), source=sql.Identifier(source))
+
+
+def wide_select_sql() -> sql.Composed:
+    """The ``SELECT`` producing player_universe_wide's rows."""
+    names = wide_columns()
+    too_long = [n for n in names if len(n) > _MAX_IDENTIFIER_LENGTH]
+    if too_long:
+        raise ValueError(f"{WIDE_TABLE} column names exceed 63 characters: {too_long}")
+    if len(set(names)) != len(names):
+        raise ValueError(f"{WIDE_TABLE} has duplicate column names")
+
+    valuations = sql.SQL(", ").join(
+        sql.SQL("max(v.{f}) FILTER (WHERE v.valuation_type = {vt}) AS {alias}").format(
+            f=sql.Identifier(f), vt=sql.Literal(vt), alias=sql.Identifier(f"{vt}_{f}"),
+        )
+        for vt in VALUATION_TYPES
+        for f in _VALUATION_FIELDS
+    )
+    player_cols = sql.SQL(", ").join(
+        sql.SQL("p.{}").format(sql.Identifier(c)) for c in PLAYER_COLUMNS if c != "id_espn"
+    )
+    pivots = sql.SQL(", ").join(
+        sql.SQL("{alias} AS ({pivot})").format(
+            alias=sql.Identifier(infix), pivot=_pivot(source, infix, stats)
+        )
+        for source, infix, stats in _STAT_SOURCES
+    )
+    stat_cols = sql.SQL(", ").join(
+        sql.SQL("{}.{}").format(sql.Identifier(infix), sql.Identifier(f"{period}_{infix}_{stat}"))
+        for _, infix, stats in _STAT_SOURCES
+        for period in STAT_PERIODS
+        for stat in stats
+    )
+    stat_joins = sql.SQL(" ").join(
+        sql.SQL("LEFT JOIN {t} USING (player_id, season_id)").format(t=sql.Identifier(infix))
+        for _, infix, _ in _STAT_SOURCES
+    )
+    return sql.SQL("""
+        WITH keys AS (
+            SELECT player_id, season_id FROM player_stats_batting
+            UNION SELECT player_id, season_id FROM player_stats_pitching
+            UNION SELECT player_id, season_id FROM player_projections
+            UNION SELECT player_id, season_id FROM player_valuations
+            UNION SELECT player_id, season_id FROM roster_slots
+        ),
+        val AS (
+            SELECT v.player_id, v.season_id, {valuations}
+            FROM (
+                SELECT DISTINCT ON (player_id, season_id, valuation_type) *
+                FROM player_valuations
+                ORDER BY player_id, season_id, valuation_type,
+                         total_dollars DESC NULLS LAST, primary_position
+            ) v
+            GROUP BY v.player_id, v.season_id
+        ),
+        ros AS (
+            SELECT r.player_id, r.season_id,
+                   count(*)::integer AS roster_count,
+                   jsonb_agg(jsonb_build_object(
+                       'league_id', r.league_id,
+                       'team_id', r.team_id,
+                       'team_name', t.team_name,
+                       'team_abbrev', t.team_abbrev,
+                       'lineup_slot', r.lineup_slot,
+                       'acquisition_type', r.acquisition_type
+                   ) ORDER BY r.league_id, r.team_id) AS rosters
+            FROM roster_slots r JOIN teams t ON t.team_id = r.team_id
+            GROUP BY r.player_id, r.season_id
+        ),
+        {pivots}
+        SELECT k.player_id, k.season_id, {player_cols},
+               {valuation_cols},
+               coalesce(ros.roster_count, 0) AS roster_count, ros.rosters,
+               {stat_cols}
+        FROM keys k
+        JOIN players p ON p.id_espn = k.player_id
+        LEFT JOIN val USING (player_id, season_id)
+        LEFT JOIN ros USING (player_id, season_id)
+        {stat_joins}
+    """).format(
+        valuations=valuations,
+        pivots=pivots,
+        player_cols=player_cols,
+        valuation_cols=sql.SQL(", ").join(
+            sql.SQL("val.{}").format(sql.Identifier(f"{vt}_{f}"))
+            for vt in VALUATION_TYPES
+            for f in _VALUATION_FIELDS
+        ),
+        stat_cols=stat_cols,
+        stat_joins=stat_joins,
+    )
+
+
+def wide_column_types(conn) -> list[tuple[str, str, int | None, int | None]]:
+    """[(column_name, data_type, numeric_precision, numeric_scale), ...].
+
+    What information_schema.columns would report for a view of
+    wide_select_sql(), read from a ``LIMIT 0`` run of the query itself.
+    """
+    query = sql.SQL("SELECT * FROM ({select}) AS {alias} LIMIT 0").format(
+        select=wide_select_sql(), alias=sql.Identifier(WIDE_TABLE)
+    )
+    with conn.cursor() as cur:
+        cur.execute(query)
+        description = cur.description
+        cur.execute(
+            "SELECT oid, CASE WHEN typcategory = 'A' THEN 'ARRAY' "
+            "WHEN typtype = 'e' THEN 'USER-DEFINED' "
+            "ELSE format_type(oid, NULL) END "
+            "FROM pg_type WHERE oid = ANY(%s)",
+            (sorted({c.type_code for c in description}),),
+        )
+        data_types = dict(cur.fetchall())
+    columns = []
+    for c in description:
+        data_type = data_types[c.type_code]
+        # An unconstrained NUMERIC (every aggregate here) has no typmod.
+        constrained = data_type == "numeric" and c.internal_size != -1
+        columns.append((
+            c.name, data_type,
+            c.precision if constrained else None,
+            c.scale if constrained else None,
+        ))
+    return columns
@@ -12,7 +12,7 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from ..db import bulk_insert, console, json_serialize
+from ..db import bulk_insert, console, ensure_season_partitions, json_serialize
 
 
 # New nested stats shape: stats.{espn,fangraphs,savant}.{period}
@@ -279,16 +279,43 @@ def _build_pitching_row(player_id: int, season_id: int, period: str, stats: dict
     )
 
 
-def load_players(conn, data: list[dict[str, Any]], season_id: int) -> dict[str, int]:
-    """Load players, their stats, projections, and valuations."""
-    counts = {"players": 0, "batting": 0, "pitching": 0, "projections": 0, "valuations": 0}
+PLAYER_COLUMNS: tuple[str, ...] = (
+    "id_espn", "id_fangraphs", "id_xmlbam", "name", "first_name", "last_name",
+    "name_ascii", "slug", "fangraphs_api_route", "headshot", "primary_position",
+    "eligible_slots", "pro_team", "weight", "display_weight", "height",
+    "display_height", "bats", "throws", "date_of_birth", "birth_place",
+    "debut_year", "injury_status", "status", "injured", "active", "jersey",
+)
+PROJECTION_COLUMNS: tuple[str, ...] = (
+    "player_id", "season_id", "projection_source", "projection_period",
+    "player_type", "projections",
+)
+VALUATION_COLUMNS: tuple[str, ...] = (
+    "player_id", "season_id", "valuation_type", "primary_position", "tier",
+    "total_z", "total_dollars",
+)
 
+# Insert column list per table, in the order prepare_player_rows builds rows.
+PLAYER_TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "players": PLAYER_COLUMNS,
+    "player_stats_batting": ("player_id", "season_id", "stat_period") + BATTING_DB_COLUMNS,
+    "player_stats_pitching": ("player_id", "season_id", "stat_period") + PITCHING_DB_COLUMNS,
+    "player_projections": PROJECTION_COLUMNS,
+    "player_valuations": VALUATION_COLUMNS,
+}
+
+
+def prepare_player_rows(data: list[dict[str, Any]], season_id: int) -> dict[str, list[tuple]]:
+    """Build insert rows per table (keys of PLAYER_TABLE_COLUMNS) from player JSON.
+
+    Pure: touches no database, so the same rows can go to bulk_insert or
+    straight to parquet (exporters.direct).
+    """
     player_rows = []
     batting_rows = []
     pitching_rows = []
     projection_rows = []
     valuation_rows = []
-    valuation_detail_rows = []
 
     def _process_one(player: dict[str, Any]) -> None:
         """Closure: append row data for one player to the parent lists."""
@@ -410,39 +437,46 @@ def load_players(conn, data: list[dict[str, Any]], season_id: int) -> dict[str,
         f"{len(batting_rows):,} batting, {len(pitching_rows):,} pitching, "
         f"{len(projection_rows):,} projections, {len(valuation_rows):,} valuations[/dim]"
     )
+    return {
+        "players": player_rows,
+        "player_stats_batting": batting_rows,
+        "player_stats_pitching": pitching_rows,
+        "player_projections": projection_rows,
+        "player_valuations": valuation_rows,
+    }
+
+
+def load_players(conn, data: list[dict[str, Any]], season_id: int, sink=None) -> dict[str, int]:
+    """Load players, their stats, projections, and valuations.
+
+    ``sink`` (an exporters.direct.DirectParquetSink) also receives every
+    batch handed to bulk_insert, for writing parquet without reading the
+    tables back.
+    """
+    counts = {"players": 0, "batting": 0, "pitching": 0, "projections": 0, "valuations": 0}
 
-    counts["players"] = bulk_insert(conn, "players", [
-        "id_espn", "id_fangraphs", "id_xmlbam", "name", "first_name", "last_name",
-        "name_ascii", "slug", "fangraphs_api_route", "headshot", "primary_position",
-        "eligible_slots", "pro_team", "weight", "display_weight", "height",
-        "display_height", "bats", "throws", "date_of_birth", "birth_place",
-        "debut_year", "injury_status", "status", "injured", "active", "jersey"
-    ], player_rows)
-
-    if batting_rows:
-        counts["batting"] = bulk_insert(conn, "player_stats_batting",
-            ["player_id", "season_id", "stat_period"] + list(BATTING_DB_COLUMNS),
-            batting_rows
-        )
-
-    if pitching_rows:
-        counts["pitching"] = bulk_insert(conn, "player_stats_pitching",
-            ["player_id", "season_id", "stat_period"] + list(PITCHING_DB_COLUMNS),
-            pitching_rows
-        )
-
-    if projection_rows:
-        counts["projections"] = bulk_insert(conn, "player_projections",
-            ["player_id", "season_id", "projection_source", "projection_period", "player_type", "projections"],
-            projection_rows
-        )
-
-    if valuation_rows:
-        counts["valuations"] = bulk_insert(conn, "player_valuations",
-            ["player_id", "season_id", "valuation_type", "primary_position", "tier", "total_z", "total_dollars"],
-            valuation_rows
-        )
+    # Stats/projections/valuations are partitioned by season; the season's
+    # partitions must exist before any row routes to them.
+    ensure_season_partitions(conn, season_id)
+
+    rows = prepare_player_rows(data, season_id)
+    valuation_detail_rows = []
 
+    def _insert(table: str, count_key: str) -> None:
+        if not rows[table] and table != "players":
+            return
+        columns = list(PLAYER_TABLE_COLUMNS[table])
+        counts[count_key] = bulk_insert(conn, table, columns, rows[table])
+        if sink is not None:
+            sink.add(table, columns, rows[table])
+
+    _insert("players", "players")
+    _insert("player_stats_batting", "batting")
+    _insert("player_stats_pitching", "pitching")
+    _insert("player_projections", "projections")
+    _insert("player_valuations", "valuations")
+
+    if rows["player_valuations"]:
         with conn.cursor() as cur:
             for player in data:
                 vals = player.get("valuations")
@@ -462,11 +496,13 @@ def load_players(conn, data: list[dict[str, Any]], season_id: int) -> dict[str,
                     dollar_values = val.get("dollar_values") or {}
                     for stat_cat, z_score in val["z_scores"].items():
                         dollar_val = dollar_values.get(stat_cat)
-                        valuation_detail_rows.append((valuation_id, stat_cat, z_score, dollar_val))
+                        valuation_detail_rows.append(
+                            (valuation_id, season_id, stat_cat, z_score, dollar_val)
+                        )
 
         if valuation_detail_rows:
             bulk_insert(conn, "player_valuation_details",
-                ["valuation_id", "stat_category", "z_score", "dollar_value"],
+                ["valuation_id", "season_id", "stat_category", "z_score", "dollar_value"],
                 valuation_detail_rows
             )
 
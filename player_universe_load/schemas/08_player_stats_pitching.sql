@@ -1,8 +1,11 @@
 -- Player Stats - Pitching
+-- LIST-partitioned by season_id (one partition per season, created and
+-- attached by db.ensure_season_partitions before that season loads).
+-- Queries filtered on season_id prune to the one season's partition.
 DROP TABLE IF EXISTS player_stats_pitching CASCADE;
 
 CREATE TABLE player_stats_pitching (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     player_id INTEGER NOT NULL REFERENCES players(id_espn) ON DELETE CASCADE,
     season_id INTEGER NOT NULL,
     stat_period VARCHAR(50) DEFAULT 'current_season',
@@ -39,9 +42,10 @@ CREATE TABLE player_stats_pitching (
     "wOBA" NUMERIC, "wOBAdiff" NUMERIC,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Unique keys on a partitioned table must include the partition key.
+    PRIMARY KEY (id, season_id),
     UNIQUE(player_id, season_id, stat_period)
-);
+) PARTITION BY LIST (season_id);
 
 CREATE INDEX idx_pitching_stats_player ON player_stats_pitching(player_id);
-CREATE INDEX idx_pitching_stats_season ON player_stats_pitching(season_id);
 CREATE INDEX idx_pitching_stats_period ON player_stats_pitching(stat_period);
@@ -2,10 +2,12 @@
 -- Stores fantasy value calculations per player/position/season/scenario.
 -- valuation_type discriminates between scenarios: preseason, updated, ros, synthetic, current.
 -- Two-way players (e.g., Shohei Ohtani) have multiple rows with different positions.
+-- LIST-partitioned by season_id, like the stats tables. The primary key is
+-- (id, season_id), so player_valuation_details references both columns.
 DROP TABLE IF EXISTS player_valuations CASCADE;
 
 CREATE TABLE player_valuations (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     player_id INTEGER NOT NULL REFERENCES players(id_espn) ON DELETE CASCADE,
     season_id INTEGER NOT NULL,
     valuation_type VARCHAR(20) NOT NULL,
@@ -15,8 +17,9 @@ CREATE TABLE player_valuations (
     total_dollars NUMERIC,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, season_id),
     UNIQUE(player_id, season_id, primary_position, valuation_type)
-);
+) PARTITION BY LIST (season_id);
 
 CREATE INDEX idx_valuations_player ON player_valuations(player_id);
 CREATE INDEX idx_valuations_position ON player_valuations(primary_position);
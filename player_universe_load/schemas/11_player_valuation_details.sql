@@ -1,14 +1,20 @@
 -- Player Valuation Details
+-- Carries its parent's season_id so it can be LIST-partitioned by season and
+-- reference player_valuations' (id, season_id) primary key.
 DROP TABLE IF EXISTS player_valuation_details CASCADE;
 
 CREATE TABLE player_valuation_details (
-    id SERIAL PRIMARY KEY,
-    valuation_id INTEGER NOT NULL REFERENCES player_valuations(id) ON DELETE CASCADE,
+    id SERIAL,
+    valuation_id INTEGER NOT NULL,
+    season_id INTEGER NOT NULL,
     stat_category VARCHAR(20) NOT NULL,
     z_score NUMERIC,
     dollar_value NUMERIC,
-    UNIQUE(valuation_id, stat_category)
-);
+    PRIMARY KEY (id, season_id),
+    FOREIGN KEY (valuation_id, season_id)
+        REFERENCES player_valuations(id, season_id) ON DELETE CASCADE,
+    UNIQUE(valuation_id, season_id, stat_category)
+) PARTITION BY LIST (season_id);
 
 CREATE INDEX idx_valuation_details_valuation ON player_valuation_details(valuation_id);
 CREATE INDEX idx_valuation_details_category ON player_valuation_details(stat_category);
@@ -1,16 +1,60 @@
 -- Parquet Artifacts
 -- Tracks the parquet files uploaded to object storage (Cloudflare R2 or any
--- S3-compatible backend). One row per table_name; UPSERT replaces the prior
--- artifact entry when a new run uploads.
+-- S3-compatible backend). One row per (table_name, partition_path); UPSERT
+-- replaces the prior artifact entry when a new run uploads. Single-file
+-- tables use partition_path ''; Hive-partitioned datasets get one row per
+-- partition so readers can pick partitions before fetching anything.
 --
 -- This is the metadata-in-Postgres half of the "files in R2, metadata in
 -- Neon" pattern. Hasura tracks it like any other table; viz apps query for
 -- the latest object_key + sha256 to know what to fetch and verify.
-DROP TABLE IF EXISTS parquet_artifacts CASCADE;
+--
+-- Not dropped on reload: load-and-sync reloads every other table before it
+-- uploads, and upload-parquets only skips a file whose sha256 is recorded
+-- here. The pointers describe R2 objects, which outlive the load.
+CREATE TABLE IF NOT EXISTS parquet_artifacts (
+    id SERIAL PRIMARY KEY,
+    table_name VARCHAR(64) NOT NULL,
+    -- e.g. 'season_id=2026/stat_period=espn_last_7'; '' for single files.
+    partition_path VARCHAR(256) NOT NULL DEFAULT '',
+    object_key VARCHAR(512) NOT NULL,
+    bucket VARCHAR(128) NOT NULL,
+    endpoint VARCHAR(256) NOT NULL,
+    sha256 CHAR(64) NOT NULL,
+    etag VARCHAR(128),
+    size_bytes BIGINT NOT NULL,
+    row_count BIGINT,
+    -- Time of the last PUT. A re-upload of identical bytes is skipped and
+    -- only moves verified_at, the last run that found the object current.
+    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    verified_at TIMESTAMP,
+    UNIQUE (table_name, partition_path)
+);
 
-CREATE TABLE parquet_artifacts (
+-- Tables created before partitions and verified_at: one row per
+-- table_name, which the per-partition rows would violate. A table created
+-- above already has this unique index (its UNIQUE constraint's).
+ALTER TABLE parquet_artifacts
+    ADD COLUMN IF NOT EXISTS partition_path VARCHAR(256) NOT NULL DEFAULT '',
+    ADD COLUMN IF NOT EXISTS verified_at TIMESTAMP,
+    DROP CONSTRAINT IF EXISTS parquet_artifacts_table_name_key;
+CREATE UNIQUE INDEX IF NOT EXISTS parquet_artifacts_table_name_partition_path_key
+    ON parquet_artifacts(table_name, partition_path);
+
+CREATE INDEX IF NOT EXISTS idx_parquet_artifacts_table ON parquet_artifacts(table_name);
+CREATE INDEX IF NOT EXISTS idx_parquet_artifacts_uploaded
+    ON parquet_artifacts(uploaded_at DESC);
+
+-- Every generation ever uploaded, one row per (table, partition, object).
+-- With content-addressed keys (<table>/<sha256>.parquet) each row still
+-- names a live object, so rolling back is copying one of these rows over
+-- the parquet_artifacts pointer and re-uploading manifest.json with the
+-- generation's manifest_entry; no parquet object is touched. Like
+-- parquet_artifacts it is not dropped on reload: the objects outlive the load.
+CREATE TABLE IF NOT EXISTS parquet_artifact_history (
     id SERIAL PRIMARY KEY,
-    table_name VARCHAR(64) NOT NULL UNIQUE,
+    table_name VARCHAR(64) NOT NULL,
+    partition_path VARCHAR(256) NOT NULL DEFAULT '',
     object_key VARCHAR(512) NOT NULL,
     bucket VARCHAR(128) NOT NULL,
     endpoint VARCHAR(256) NOT NULL,
@@ -18,8 +62,24 @@ CREATE TABLE parquet_artifacts (
     etag VARCHAR(128),
     size_bytes BIGINT NOT NULL,
     row_count BIGINT,
-    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
+    -- 'content' (<table>/<sha256>.parquet, never overwritten) or 'fixed'
+    -- (<table>.parquet, overwritten by the next upload). Only content
+    -- generations can be rolled back to.
+    key_scheme VARCHAR(16) NOT NULL CHECK (key_scheme IN ('content', 'fixed')),
+    -- The artifact's manifest.json entry as uploaded; NULL when no
+    -- manifest went up with it (upload_table, upload_dataset).
+    manifest_entry JSONB,
+    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    UNIQUE (table_name, partition_path, bucket, object_key)
 );
 
-CREATE INDEX idx_parquet_artifacts_table ON parquet_artifacts(table_name);
-CREATE INDEX idx_parquet_artifacts_uploaded ON parquet_artifacts(uploaded_at DESC);
+-- Tables created before key_scheme and manifest_entry were recorded. Their
+-- rows count as fixed, which rollback refuses: nothing says their key
+-- still holds those bytes.
+ALTER TABLE parquet_artifact_history
+    ADD COLUMN IF NOT EXISTS key_scheme VARCHAR(16) NOT NULL DEFAULT 'fixed'
+        CHECK (key_scheme IN ('content', 'fixed')),
+    ADD COLUMN IF NOT EXISTS manifest_entry JSONB;
+
+CREATE INDEX IF NOT EXISTS idx_parquet_artifact_history_sha
+    ON parquet_artifact_history(table_name, partition_path, sha256);
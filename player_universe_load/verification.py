@@ -23,10 +23,13 @@ def _verify_single_database(db_name: str, db_url: str):
     try:
         with conn.cursor() as cur:
             # Check all tables
+            # Season partitions are counted through their parent table.
             cur.execute("""
                 SELECT table_name
                 FROM information_schema.tables
                 WHERE table_schema = 'public'
+                  AND format('%I.%I', table_schema, table_name)::regclass
+                      NOT IN (SELECT inhrelid FROM pg_inherits)
                 ORDER BY table_name
             """)
             tables = [row[0] for row in cur.fetchall()]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Parquet export benchmark: COPY fast path vs the cursor path.
+
+Exports every table in EXPORTED_TABLES (or the ones named with --tables)
+through both export methods into a scratch directory, times each run, and
+checks that the two parquet files hold identical data.
+
+- Connects via DATABASE_URL, falling back to LOCAL_DATABASE_URL.
+- Reports the median of --repeat runs per table and method.
+- Exits non-zero if any table's COPY output differs from the cursor output.
+
+Read-only against the database. Safe to run at any frequency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from player_universe_load.db import get_connection
+from player_universe_load.exporters.parquet import (
+    EXPORT_BATCH_SIZE,
+    EXPORTED_TABLES,
+    export_table,
+)
+
+
+def fail(msg: str) -> None:
+    print(f"FAIL: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _time_export(conn, table: str, target: Path, method: str, repeat: int,
+                 batch_size: int) -> tuple[float, Path]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path = export_table(conn, table, target_dir=target, batch_size=batch_size,
+                            method=method, force=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", nargs="+", default=list(EXPORTED_TABLES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        local = os.environ.get("LOCAL_DATABASE_URL")
+        if not local:
+            fail("DATABASE_URL / LOCAL_DATABASE_URL env var not set")
+        os.environ["DATABASE_URL"] = local
+
+    conn = get_connection()
+    mismatched = []
+    total_cursor = total_copy = 0.0
+    try:
+        with tempfile.TemporaryDirectory() as scratch:
+            root = Path(scratch)
+            print(f"\n{'table':<32} {'rows':>10} {'cursor s':>10} {'copy s':>10} {'speedup':>8}")
+            for table in args.tables:
+                t_cursor, p_cursor = _time_export(
+                    conn, table, root / "cursor", "cursor", args.repeat, args.batch_size
+                )
+                t_copy, p_copy = _time_export(
+                    conn, table, root / "copy", "copy", args.repeat, args.batch_size
+                )
+                a, b = pq.read_table(p_cursor), pq.read_table(p_copy)
+                if not a.equals(b):
+                    mismatched.append(table)
+                total_cursor += t_cursor
+                total_copy += t_copy
+                speedup = t_cursor / t_copy if t_copy else float("inf")
+                print(f"{table:<32} {a.num_rows:>10,} {t_cursor:>10.3f} "
+                      f"{t_copy:>10.3f} {speedup:>7.1f}x")
+    finally:
+        conn.close()
+
+    speedup = total_cursor / total_copy if total_copy else float("inf")
+    print(f"{'total':<32} {'':>10} {total_cursor:>10.3f} {total_copy:>10.3f} "
+          f"{speedup:>7.1f}x")
+    if mismatched:
+        fail(f"COPY output differs from cursor output: {mismatched}")
+    print("\nBENCH OK (outputs identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Parquet point-lookup benchmark: heap-order layout vs sorted layout.
+
+Reads one table (default player_stats_batting) from Postgres and writes it
+twice into a scratch directory:
+
+- before: heap order, written the way the exporter used to (one
+  ``pq.write_table`` call, default row groups, no page index/bloom).
+- after:  sorted by the table's SORT_KEYS with the exporter's writer options
+  (row_group_size, page index, sorting_columns, bloom filters on player_id).
+
+Then times ``pq.read_table(filters=[("player_id", "=", id)])`` for a sample
+of player ids against both files and reports median/p95 latency plus how
+many row groups each lookup had to touch (min/max statistics containing the
+id). ``--scale N`` replicates the rows N times under renumbered player ids so
+the fixture-sized tables are big enough for row-group pruning to matter.
+
+Read-only against the database. Safe to run at any frequency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from player_universe_load.db import get_connection
+from player_universe_load.exporters import parquet as parquet_mod
+
+
+def fail(msg: str) -> None:
+    print(f"FAIL: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _heap_order_table(conn, table: str) -> pa.Table:
+    cols = parquet_mod.table_columns(conn, table)
+    schema = parquet_mod.arrow_schema_for(conn, table)
+    batches = parquet_mod._iter_record_batches(
+        conn, table, schema, cols, parquet_mod.EXPORT_BATCH_SIZE
+    )
+    return pa.Table.from_batches(list(batches), schema=schema)
+
+
+def _scaled(t: pa.Table, scale: int) -> pa.Table:
+    """Replicate ``t`` ``scale`` times under distinct player ids.
+
+    Real ids are sparse (ESPN ids run into the millions), so each copy
+    renumbers them densely: copy k maps the i-th distinct id to k * n + i.
+    """
+    if scale <= 1:
+        return t
+    distinct = pc.unique(t["player_id"])
+    dense = pc.index_in(t["player_id"], value_set=distinct).cast(pa.int32())
+    idx = t.schema.get_field_index("player_id")
+    copies = [
+        t.set_column(idx, "player_id",
+                     pc.add(dense, pa.scalar(k * len(distinct), pa.int32())))
+        for k in range(scale)
+    ]
+    return pa.concat_tables(copies)
+
+
+def _row_groups_touched(path: Path, player_id: int) -> int:
+    meta = pq.ParquetFile(path).metadata
+    col = pq.ParquetFile(path).schema_arrow.get_field_index("player_id")
+    touched = 0
+    for i in range(meta.num_row_groups):
+        stats = meta.row_group(i).column(col).statistics
+        if stats is None or not stats.has_min_max or stats.min <= player_id <= stats.max:
+            touched += 1
+    return touched
+
+
+def _bench(path: Path, ids: list[int]) -> dict:
+    timings, touched = [], []
+    for pid in ids:
+        start = time.perf_counter()
+        got = pq.read_table(path, filters=[("player_id", "=", pid)])
+        timings.append((time.perf_counter() - start) * 1000)
+        if got.num_rows == 0:
+            fail(f"lookup for player_id={pid} returned no rows from {path.name}")
+        touched.append(_row_groups_touched(path, pid))
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "row_groups": pq.ParquetFile(path).metadata.num_row_groups,
+        "avg_touched": statistics.mean(touched),
+        "size_bytes": path.stat().st_size,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--table", default="player_stats_batting")
+    parser.add_argument("--scale", type=int, default=200)
+    parser.add_argument("--lookups", type=int, default=50)
+    parser.add_argument("--row-group-size", type=int,
+                        default=parquet_mod.DEFAULT_ROW_GROUP_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        local = os.environ.get("LOCAL_DATABASE_URL")
+        if not local:
+            fail("DATABASE_URL / LOCAL_DATABASE_URL env var not set")
+        os.environ["DATABASE_URL"] = local
+
+    conn = get_connection()
+    try:
+        base = _heap_order_table(conn, args.table)
+    finally:
+        conn.close()
+    if "player_id" not in base.schema.names:
+        fail(f"{args.table} has no player_id column")
+    data = _scaled(base, args.scale)
+
+    sort_keys = parquet_mod.sort_columns(args.table)
+    ordered = data.sort_by(
+        [(name, "descending" if desc else "ascending") for name, desc in sort_keys],
+        null_placement="at_end",
+    ) if sort_keys else data
+    rng = random.Random(args.seed)
+    ids = rng.sample(pc.unique(data["player_id"]).to_pylist(),
+                     min(args.lookups, len(pc.unique(data["player_id"]))))
+
+    with tempfile.TemporaryDirectory() as scratch:
+        before = Path(scratch) / "before.parquet"
+        after = Path(scratch) / "after.parquet"
+        pq.write_table(data, before, compression="zstd")
+        options = parquet_mod._write_options(
+            data.schema, sort_keys, data.num_rows, args.row_group_size
+        )
+        with pq.ParquetWriter(after, data.schema, **options) as writer:
+            writer.write_table(ordered, row_group_size=args.row_group_size)
+
+        results = {"before": _bench(before, ids), "after": _bench(after, ids)}
+
+    print(f"\n{args.table}: {data.num_rows:,} rows (scale {args.scale}), "
+          f"{len(ids)} point lookups on player_id")
+    print(f"{'layout':<8} {'median ms':>10} {'p95 ms':>8} {'row groups':>11} "
+          f"{'touched':>8} {'bytes':>12}")
+    for name, r in results.items():
+        print(f"{name:<8} {r['median_ms']:>10.2f} {r['p95_ms']:>8.2f} "
+              f"{r['row_groups']:>11} {r['avg_touched']:>8.1f} {r['size_bytes']:>12,}")
+    speedup = results["before"]["median_ms"] / results["after"]["median_ms"]
+    print(f"\nmedian speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Parquet profile report: "exact" vs "compact" column types per table.
+
+Exports every table in EXPORTED_TABLES (or the ones named with --tables)
+with both export profiles into a scratch directory and reports, per table:
+
+- file size of each profile and the delta;
+- median time of --repeat reads into Arrow (``pq.read_table``);
+- median time of --repeat reads into pandas (``.to_pandas()``), where
+  decimal128 columns become Python Decimal objects and dictionary columns
+  become categoricals. pandas is not a project dependency; without it the
+  pandas column is left out.
+
+Read-only against the database. Safe to run at any frequency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+try:
+    import pandas  # noqa: F401
+    HAVE_PANDAS = True
+except ImportError:
+    HAVE_PANDAS = False
+
+from player_universe_load.db import get_connection
+from player_universe_load.exporters.parquet import EXPORTED_TABLES, export_table
+
+
+def fail(msg: str) -> None:
+    print(f"FAIL: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _median_read(path: Path, repeat: int, pandas: bool) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        table = pq.read_table(path)
+        if pandas:
+            table.to_pandas()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def _delta(before: float, after: float) -> str:
+    return f"{(after - before) / before * 100:+.0f}%" if before else "n/a"
+
+
+def _pandas_cell(before: float, after: float) -> str:
+    if not HAVE_PANDAS:
+        return ""
+    return f"{before:>7.1f}→{after:<7.1f}{_delta(before, after):>3}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", nargs="+", default=list(EXPORTED_TABLES))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        local = os.environ.get("LOCAL_DATABASE_URL")
+        if not local:
+            fail("DATABASE_URL / LOCAL_DATABASE_URL env var not set")
+        os.environ["DATABASE_URL"] = local
+
+    conn = get_connection()
+    totals = {"exact": [0, 0.0, 0.0], "compact": [0, 0.0, 0.0]}
+    try:
+        with tempfile.TemporaryDirectory() as scratch:
+            root = Path(scratch)
+            print(f"\n{'table':<28} {'exact KB':>9} {'compact KB':>10} {'size':>6} "
+                  f"{'arrow ms':>15} {'pandas ms' if HAVE_PANDAS else '':>17}")
+            for table in args.tables:
+                row = {}
+                for profile in ("exact", "compact"):
+                    path = export_table(conn, table, target_dir=root / profile,
+                                        profile=profile, force=True)
+                    size = path.stat().st_size
+                    arrow_ms = _median_read(path, args.repeat, pandas=False)
+                    pandas_ms = (_median_read(path, args.repeat, pandas=True)
+                                 if HAVE_PANDAS else 0.0)
+                    row[profile] = (size, arrow_ms, pandas_ms)
+                    for i, v in enumerate(row[profile]):
+                        totals[profile][i] += v
+                (es, ea, ep), (cs, ca, cp) = row["exact"], row["compact"]
+                print(f"{table:<28} {es / 1024:>9.1f} {cs / 1024:>10.1f} {_delta(es, cs):>6} "
+                      f"{ea:>6.1f}→{ca:<6.1f}{_delta(ea, ca):>3} {_pandas_cell(ep, cp)}")
+    finally:
+        conn.close()
+
+    (es, ea, ep), (cs, ca, cp) = totals["exact"], totals["compact"]
+    print(f"{'total':<28} {es / 1024:>9.1f} {cs / 1024:>10.1f} {_delta(es, cs):>6} "
+          f"{ea:>6.1f}→{ca:<6.1f}{_delta(ea, ca):>3} {_pandas_cell(ep, cp)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""R2 sync benchmark: upload_all / verify_all against a local S3 stand-in.
+
+Generates --files parquet artifacts of about --size-mb each, spread as Hive
+partitions over the EXPORTED_TABLES datasets (so upload_all plans them like
+a real ``--layout hive`` export), then times --repeat runs of each scenario
+through the exporter's own code paths:
+
+- upload:      upload_all(force=True), every file PUT;
+- skip:        upload_all() again, every file found unchanged;
+- skip-head:   the same with check_remote, one HEAD per file;
+- verify-fast: verify_all(mode="fast");
+- verify-deep: verify_all(mode="deep").
+
+Per scenario it reports the median wall time, MB/s and files/s, plus
+per-file latency percentiles (p50/p90/p99/max over every file of every
+run; for uploads that is _put_file, hashing included). ``--json PATH``
+writes the same numbers with the run's settings, for comparing runs.
+
+Runs against an S3-compatible stand-in, never the configured bucket:
+
+- ``--endpoint URL`` (e.g. a local MinIO at http://localhost:9000, with
+  AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY set for it); or
+- without --endpoint, an in-process moto server. moto is not a project
+  dependency (``pip install 'moto[server]'``).
+
+parquet_artifacts writes go to a scratch schema (copies of the real
+tables), dropped on exit, so the database's artifact pointers are left
+alone. Connects via DATABASE_URL, falling back to LOCAL_DATABASE_URL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from psycopg2 import sql
+
+try:
+    from moto.server import ThreadedMotoServer
+    HAVE_MOTO = True
+except ImportError:
+    HAVE_MOTO = False
+
+from player_universe_load.db import get_connection
+from player_universe_load.exporters import r2
+from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+_MIB = 1024 * 1024
+_ARTIFACT_TABLES = ("parquet_artifacts", "parquet_artifact_history")
+
+
+def fail(msg: str) -> None:
+    print(f"FAIL: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _write_artifacts(root: Path, files: int, size_mb: float) -> int:
+    """``files`` random parquets, round-robin over EXPORTED_TABLES; total bytes."""
+    rows = max(1, int(size_mb * _MIB) // 1024)
+    total = 0
+    for i in range(files):
+        table = EXPORTED_TABLES[i % len(EXPORTED_TABLES)]
+        d = root / table / f"bench={i // len(EXPORTED_TABLES)}"
+        d.mkdir(parents=True)
+        # Random payloads, uncompressed: the file size is the requested size.
+        data = pa.table({
+            "player_id": pa.array(range(rows), pa.int64()),
+            "payload": pa.array([os.urandom(1024) for _ in range(rows)], pa.binary()),
+        })
+        pq.write_table(data, d / "part-0.parquet", compression="none")
+        total += (d / "part-0.parquet").stat().st_size
+    return total
+
+
+def _scratch_schema(conn) -> str:
+    """Create a schema holding empty copies of the artifact tables; use it."""
+    schema = f"bench_r2_{os.getpid()}"
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("CREATE SCHEMA {}").format(sql.Identifier(schema)))
+        for table in _ARTIFACT_TABLES:
+            cur.execute(sql.SQL("CREATE TABLE {} (LIKE public.{} INCLUDING ALL)").format(
+                sql.Identifier(schema, table), sql.Identifier(table)))
+        # Session-level, so it survives the commits upload_all makes.
+        cur.execute(sql.SQL("SET search_path TO {}").format(sql.Identifier(schema)))
+    conn.commit()
+    return schema
+
+
+def _timed(module, name: str, latencies: list[float]):
+    """Replace ``module.name`` with a wrapper appending each call's seconds."""
+    inner = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return inner(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    setattr(module, name, wrapper)
+    return inner
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _scenario(run, repeat: int, files: int, total_bytes: int, hook: str) -> dict:
+    """Time ``run()`` ``repeat`` times, collecting per-file latency via ``hook``."""
+    latencies: list[float] = []
+    inner = _timed(r2, hook, latencies)
+    walls = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            walls.append(time.perf_counter() - start)
+    finally:
+        setattr(r2, hook, inner)
+    wall = statistics.median(walls)
+    ordered = sorted(latencies)
+    return {
+        "wall_s": wall,
+        "mb_per_s": total_bytes / _MIB / wall,
+        "files_per_s": files / wall,
+        "latency_ms": {
+            "p50": _percentile(ordered, 0.50) * 1000,
+            "p90": _percentile(ordered, 0.90) * 1000,
+            "p99": _percentile(ordered, 0.99) * 1000,
+            "max": ordered[-1] * 1000,
+        },
+        "runs_s": walls,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--endpoint", default=None,
+                        help="S3-compatible endpoint (default: in-process moto)")
+    parser.add_argument("--bucket", default="bench-r2-sync")
+    parser.add_argument("--files", type=int, default=60,
+                        help=f"Artifacts to generate (at least {len(EXPORTED_TABLES)})")
+    parser.add_argument("--size-mb", type=float, default=4.0,
+                        help="Approximate size of each artifact")
+    parser.add_argument("--upload-workers", type=int, default=r2.DEFAULT_UPLOAD_WORKERS)
+    parser.add_argument("--verify-workers", type=int, default=r2.DEFAULT_VERIFY_WORKERS)
+    parser.add_argument("--key-scheme", choices=r2.KEY_SCHEMES,
+                        default=r2.DEFAULT_KEY_SCHEME)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, default=None,
+                        help="Also write the results as JSON to this path")
+    args = parser.parse_args()
+    if args.files < len(EXPORTED_TABLES):
+        fail(f"--files must be at least {len(EXPORTED_TABLES)} (one per exported table)")
+
+    if not os.environ.get("DATABASE_URL"):
+        local = os.environ.get("LOCAL_DATABASE_URL")
+        if not local:
+            fail("DATABASE_URL / LOCAL_DATABASE_URL env var not set")
+        os.environ["DATABASE_URL"] = local
+
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        if not HAVE_MOTO:
+            fail("no --endpoint given and moto is not installed")
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        server = ThreadedMotoServer(port=0, verbose=False)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint = f"http://{host}:{port}"
+
+    cfg = r2.R2Config(
+        account_id="bench",
+        access_key_id=os.environ.get("AWS_ACCESS_KEY_ID", "bench"),
+        secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY", "bench"),
+        bucket=args.bucket,
+        endpoint=endpoint,
+    )
+    conn = get_connection()
+    schema = None
+    try:
+        s3 = r2._s3_client(cfg)
+        try:
+            # R2's region is "auto"; stand-ins want it as the location.
+            s3.create_bucket(Bucket=cfg.bucket, CreateBucketConfiguration={
+                "LocationConstraint": "auto"})
+        except s3.exceptions.BucketAlreadyOwnedByYou:
+            pass
+        schema = _scratch_schema(conn)
+
+        with tempfile.TemporaryDirectory() as scratch:
+            root = Path(scratch)
+            total = _write_artifacts(root, args.files, args.size_mb)
+            upload = dict(source_dir=root, max_workers=args.upload_workers,
+                          key_scheme=args.key_scheme)
+            scenarios = {
+                "upload": (lambda: r2.upload_all(conn, cfg, force=True, **upload),
+                           "_put_file"),
+                "skip": (lambda: r2.upload_all(conn, cfg, **upload), "_put_file"),
+                "skip-head": (lambda: r2.upload_all(conn, cfg, check_remote=True,
+                                                    **upload), "_put_file"),
+                "verify-fast": (lambda: r2.verify_all(
+                    conn, cfg, mode="fast", max_workers=args.verify_workers),
+                    "_verify_object"),
+                "verify-deep": (lambda: r2.verify_all(
+                    conn, cfg, mode="deep", max_workers=args.verify_workers),
+                    "_verify_object"),
+            }
+            results = {
+                name: _scenario(run, args.repeat, args.files, total, hook)
+                for name, (run, hook) in scenarios.items()
+            }
+    finally:
+        if schema is not None:
+            conn.rollback()
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL("DROP SCHEMA {} CASCADE").format(sql.Identifier(schema)))
+            conn.commit()
+        conn.close()
+        if server is not None:
+            server.stop()
+
+    print(f"\n{args.files} files x ~{args.size_mb:g}MB ({total / _MIB:.1f}MB) -> "
+          f"{endpoint}, median of {args.repeat}")
+    print(f"{'scenario':<12} {'seconds':>8} {'MB/s':>8} {'files/s':>8} "
+          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, r in results.items():
+        lat = r["latency_ms"]
+        print(f"{name:<12} {r['wall_s']:>8.2f} {r['mb_per_s']:>8.1f} "
+              f"{r['files_per_s']:>8.1f} {lat['p50']:>8.1f} {lat['p90']:>8.1f} "
+              f"{lat['p99']:>8.1f} {lat['max']:>8.1f}")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps({
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "endpoint": "moto" if server is not None else endpoint,
+            "files": args.files,
+            "size_mb": args.size_mb,
+            "total_bytes": total,
+            "upload_workers": args.upload_workers,
+            "verify_workers": args.verify_workers,
+            "key_scheme": args.key_scheme,
+            "repeat": args.repeat,
+            "scenarios": results,
+        }, indent=2) + "\n")
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""R2 upload benchmark: single PUT vs parallel multipart.
+
+Uploads a generated file of --size-mb through the exporter's own
+``_put_file`` once as a single PUT and once per --part-sizes value as a
+multipart upload with --part-workers parts in flight. Reports the median
+of --repeat runs (seconds and MB/s) per mode.
+
+Runs against an S3-compatible stand-in, never the configured bucket:
+
+- ``--endpoint URL`` (e.g. a local MinIO at http://localhost:9000, with
+  AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY set for it); or
+- without --endpoint, an in-process moto server. moto is not a project
+  dependency (``pip install 'moto[server]'``).
+
+A local stand-in has no real network latency, so it shows the client-side
+overhead of each mode and the part-level parallelism; gains against R2
+over a WAN link are larger. No database access.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from moto.server import ThreadedMotoServer
+    HAVE_MOTO = True
+except ImportError:
+    HAVE_MOTO = False
+
+from player_universe_load.exporters.r2 import (
+    MultipartConfig,
+    R2Config,
+    _put_file,
+    _s3_client,
+    _Upload,
+)
+
+_MIB = 1024 * 1024
+
+
+def fail(msg: str) -> None:
+    print(f"FAIL: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _median_upload(path: Path, cfg: R2Config, s3, multipart: MultipartConfig,
+                   repeat: int) -> float:
+    upload = _Upload("bench", "", path, "bench/bench.parquet", 0)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _put_file(upload, cfg, s3, multipart)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--endpoint", default=None,
+                        help="S3-compatible endpoint (default: in-process moto)")
+    parser.add_argument("--bucket", default="bench-r2-upload")
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--part-sizes", type=int, nargs="+", default=[8, 16, 32],
+                        help="Multipart part sizes to try, in MB")
+    parser.add_argument("--part-workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        if not HAVE_MOTO:
+            fail("no --endpoint given and moto is not installed")
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        server = ThreadedMotoServer(port=0, verbose=False)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint = f"http://{host}:{port}"
+
+    cfg = R2Config(
+        account_id="bench",
+        access_key_id=os.environ.get("AWS_ACCESS_KEY_ID", "bench"),
+        secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY", "bench"),
+        bucket=args.bucket,
+        endpoint=endpoint,
+    )
+    s3 = _s3_client(cfg, max_pool_connections=args.part_workers)
+    try:
+        try:
+            # R2's region is "auto"; stand-ins want it as the location.
+            s3.create_bucket(Bucket=cfg.bucket, CreateBucketConfiguration={
+                "LocationConstraint": "auto"})
+        except s3.exceptions.BucketAlreadyOwnedByYou:
+            pass
+
+        modes = [("single PUT", MultipartConfig(threshold=(args.size_mb + 1) * _MIB))]
+        modes += [
+            (f"multipart {mb}MB x{args.part_workers}",
+             MultipartConfig(threshold=0, part_size=mb * _MIB,
+                             max_workers=args.part_workers))
+            for mb in args.part_sizes
+        ]
+        with tempfile.TemporaryDirectory() as scratch:
+            path = Path(scratch) / "bench.parquet"
+            # Random bytes: nothing on the path can compress them away.
+            with path.open("wb") as f:
+                for _ in range(args.size_mb):
+                    f.write(os.urandom(_MIB))
+
+            print(f"\n{args.size_mb}MB file -> {endpoint}, median of {args.repeat}")
+            print(f"{'mode':<24} {'seconds':>8} {'MB/s':>8} {'vs PUT':>7}")
+            baseline = None
+            for label, multipart in modes:
+                secs = _median_upload(path, cfg, s3, multipart, args.repeat)
+                baseline = baseline or secs
+                print(f"{label:<24} {secs:>8.2f} {args.size_mb / secs:>8.1f} "
+                      f"{baseline / secs:>6.2f}x")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
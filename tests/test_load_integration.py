@@ -2,7 +2,11 @@
 """Integration tests for database loading."""
 
 import pytest
-from player_universe_load.db import get_connection
+from player_universe_load.db import (
+    SEASON_PARTITIONED_TABLES,
+    ensure_season_partitions,
+    get_connection,
+)
 from player_universe_load.__main__ import load_all
 
 
@@ -185,6 +189,51 @@ def test_jsonb_fields():
         conn.close()
 
 
+def test_season_partitions():
+    """Seasons land in their own partitions and season filters prune the rest."""
+    conn = get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT DISTINCT season_id FROM player_stats_batting")
+            seasons = [row[0] for row in cur.fetchall()]
+            assert len(seasons) == 1
+            season = seasons[0]
+
+            # Loaded season's partitions already exist: nothing to create.
+            assert ensure_season_partitions(conn, season) == []
+
+            other = season - 1
+            created = ensure_season_partitions(conn, other)
+            assert created == [f"{t}_{other}" for t in SEASON_PARTITIONED_TABLES]
+            assert ensure_season_partitions(conn, other) == []
+
+            cur.execute(
+                "EXPLAIN SELECT * FROM player_stats_batting WHERE season_id = %s",
+                (season,),
+            )
+            plan = "\n".join(row[0] for row in cur.fetchall())
+            assert f"player_stats_batting_{season}" in plan
+            assert f"player_stats_batting_{other}" not in plan
+            print(f"✓ season {season} query pruned to one partition")
+
+            # Valuation details carry the season so they co-locate with
+            # their parent valuation.
+            cur.execute("""
+                SELECT COUNT(*)
+                FROM player_valuation_details d
+                JOIN player_valuations v ON v.id = d.valuation_id
+                WHERE d.season_id <> v.season_id
+            """)
+            assert cur.fetchone()[0] == 0
+
+            for table in reversed(SEASON_PARTITIONED_TABLES):
+                cur.execute(f"ALTER TABLE {table} DETACH PARTITION {table}_{other}")
+                cur.execute(f"DROP TABLE {table}_{other}")
+        conn.commit()
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     # Allow running directly: python -m pytest tests/test_load_integration.py -v
     pytest.main([__file__, "-v", "-s"])
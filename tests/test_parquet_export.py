@@ -6,11 +6,15 @@ existing test_load_integration.py runs first and populates it.
 """
 
 import json
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import patch
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor
 
 from player_universe_load.db import get_connection
 from player_universe_load.exporters.parquet import (
@@ -18,6 +22,7 @@ from player_universe_load.exporters.parquet import (
     export_all,
     export_table,
 )
+from player_universe_load.exporters import parquet as parquet_mod
 
 
 @pytest.fixture
@@ -49,12 +54,333 @@ def test_export_row_count_matches_postgres(conn, tmp_target: Path):
     export_all(conn, target_dir=tmp_target)
     with conn.cursor() as cur:
         for t in EXPORTED_TABLES:
-            cur.execute(f"SELECT COUNT(*) FROM {t}")
+            # player_universe_wide is a query, not a relation.
+            cur.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(parquet_mod._table_source(t)))
             pg_count = cur.fetchone()[0]
             pq_count = pq.read_table(tmp_target / f"{t}.parquet").num_rows
             assert pq_count == pg_count, f"{t}: parquet {pq_count} != postgres {pg_count}"
 
 
+def test_parallel_export_reads_one_snapshot(conn, tmp_target: Path):
+    """Writes committed after export_all starts are invisible to every worker."""
+    real_get_connection = parquet_mod.get_connection
+    writer = get_connection()
+    written = []
+
+    def connect_after_concurrent_write():
+        # Runs once per worker, i.e. after the snapshot has been exported.
+        written.append(f"Z{len(written)}")
+        with writer.cursor() as cur:
+            cur.execute(
+                "INSERT INTO position_summary (position, role, valuation_type) "
+                "VALUES (%s, 'HITTER', 'probe')",
+                (written[-1],),
+            )
+        writer.commit()
+        return real_get_connection()
+
+    try:
+        with patch.object(parquet_mod, "get_connection",
+                          side_effect=connect_after_concurrent_write) as worker_conns:
+            paths = export_all(conn, target_dir=tmp_target, max_workers=4)
+        assert worker_conns.call_count == 4
+        assert [p.stem for p in paths] == list(EXPORTED_TABLES)
+        exported = pq.read_table(tmp_target / "position_summary.parquet")
+        assert not set(written) & set(exported.column("position").to_pylist())
+    finally:
+        with writer.cursor() as cur:
+            cur.execute("DELETE FROM position_summary WHERE valuation_type = 'probe'")
+        writer.commit()
+        writer.close()
+
+
+def test_export_all_single_worker_uses_callers_connection(conn, tmp_target: Path):
+    with patch.object(parquet_mod, "get_connection") as worker_conns:
+        paths = export_all(conn, target_dir=tmp_target, max_workers=1)
+    worker_conns.assert_not_called()
+    assert len(paths) == len(EXPORTED_TABLES)
+
+
+def test_unchanged_table_is_skipped(conn, tmp_target: Path):
+    """Second export of an unchanged table leaves the file untouched."""
+    first = export_table(conn, "leagues", target_dir=tmp_target)
+    sidecar = json.loads((tmp_target / "leagues.meta.json").read_text())
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM leagues")
+        assert sidecar["row_count"] == cur.fetchone()[0]
+    before = first.stat().st_mtime_ns
+
+    with patch.object(parquet_mod.pq, "ParquetWriter") as writer:
+        assert export_table(conn, "leagues", target_dir=tmp_target) == first
+    writer.assert_not_called()
+    assert first.stat().st_mtime_ns == before
+
+    export_table(conn, "leagues", target_dir=tmp_target, force=True)
+    assert first.stat().st_mtime_ns != before
+
+
+def test_sidecar_records_hash_of_written_files(conn, tmp_target: Path):
+    """sha256/size/rows/mtime per file, as hashed during the write."""
+    import hashlib
+
+    for table, layout in (("leagues", "file"), ("player_stats_batting", "hive")):
+        path = export_table(conn, table, target_dir=tmp_target, layout=layout)
+        files = json.loads((tmp_target / f"{table}.meta.json").read_text())["files"]
+        on_disk = {"": path} if path.is_file() else {
+            f.parent.relative_to(path).as_posix(): f for f in path.rglob("*.parquet")
+        }
+        assert sorted(files) == sorted(on_disk)
+        for partition_path, f in on_disk.items():
+            entry = files[partition_path]
+            assert entry["sha256"] == hashlib.sha256(f.read_bytes()).hexdigest()
+            assert entry["size_bytes"] == f.stat().st_size
+            assert entry["mtime_ns"] == f.stat().st_mtime_ns
+            assert entry["row_count"] == pq.ParquetFile(f).metadata.num_rows
+
+
+def test_changed_table_is_reexported(conn, tmp_target: Path):
+    """A content change (audit columns aside) invalidates the fingerprint."""
+    export_table(conn, "leagues", target_dir=tmp_target)
+    fp = json.loads((tmp_target / "leagues.meta.json").read_text())["fingerprint"]
+
+    with conn.cursor() as cur:
+        cur.execute("UPDATE leagues SET created_at = now()")
+    assert parquet_mod._table_fingerprint(
+        conn, "leagues", parquet_mod.table_columns(conn, "leagues")
+    )[1] == fp
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute("UPDATE leagues SET league_name = coalesce(league_name, '') || ' (renamed)'")
+        _, skipped = parquet_mod._export_table(
+            conn, "leagues", tmp_target, batch_size=1000, method="copy", force=False
+        )
+        assert not skipped
+        names = pq.read_table(tmp_target / "leagues.parquet").column("league_name").to_pylist()
+        assert all(n.endswith(" (renamed)") for n in names)
+    finally:
+        conn.rollback()
+
+
+def test_export_all_reports_skipped(conn, tmp_target: Path, capsys):
+    export_all(conn, target_dir=tmp_target)
+    capsys.readouterr()
+    export_all(conn, target_dir=tmp_target)
+    out = capsys.readouterr().out
+    assert f"Skipped {len(EXPORTED_TABLES)} unchanged tables" in out
+
+
+def test_export_all_writes_manifest(conn, tmp_target: Path):
+    import hashlib
+
+    from player_universe_load.exporters import manifest as manifest_mod
+
+    # Fresh files are hashed while written; the manifest never re-reads them.
+    with patch.object(manifest_mod, "sha256_file", wraps=manifest_mod.sha256_file) as sha:
+        export_all(conn, target_dir=tmp_target, layout="hive")
+    sha.assert_not_called()
+    manifest = json.loads((tmp_target / "manifest.json").read_text())
+    files = sorted(p.relative_to(tmp_target).as_posix() for p in tmp_target.rglob("*.parquet"))
+    assert sorted(a["path"] for a in manifest["artifacts"]) == files
+    assert not list(tmp_target.glob("manifest.json.tmp"))
+
+    by_path = {a["path"]: a for a in manifest["artifacts"]}
+    for rel, entry in by_path.items():
+        path = tmp_target / rel
+        assert entry["sha256"] == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert entry["size_bytes"] == path.stat().st_size
+        assert entry["row_count"] == pq.ParquetFile(path).metadata.num_rows
+    partitions = [a for a in manifest["artifacts"] if a["table"] == "player_stats_batting"]
+    assert len(partitions) > 1 and all(a["partition_path"] for a in partitions)
+    assert len({a["schema_hash"] for a in partitions}) == 1
+
+    players = by_path["players.parquet"]
+    assert players["sort_keys"] == ["id_espn"]
+    with conn.cursor() as cur:
+        cur.execute("SELECT min(id_espn), max(id_espn), count(*) - count(id_xmlbam), "
+                    "min(weight)::text FROM players")
+        lo, hi, xmlbam_nulls, min_weight = cur.fetchone()
+    assert (players["columns"]["id_espn"]["min"], players["columns"]["id_espn"]["max"]) == (lo, hi)
+    assert players["columns"]["id_xmlbam"]["null_count"] == xmlbam_nulls
+    assert Decimal(players["columns"]["weight"]["min"]) == Decimal(min_weight)
+
+    # Unchanged files keep their bytes, so their sha256 is carried over.
+    with patch.object(manifest_mod, "sha256_file") as sha:
+        export_all(conn, target_dir=tmp_target, layout="hive")
+    sha.assert_not_called()
+    again = json.loads((tmp_target / "manifest.json").read_text())
+    assert [a["sha256"] for a in again["artifacts"]] == [a["sha256"] for a in manifest["artifacts"]]
+
+
+def test_hive_layout_writes_partitioned_dataset(conn, tmp_target: Path):
+    """stats tables -> <table>/season_id=/stat_period=/part-0.parquet."""
+    import pyarrow.dataset as ds
+
+    path = export_table(conn, "player_stats_batting", target_dir=tmp_target, layout="hive")
+    assert path == tmp_target / "player_stats_batting"
+    assert path.is_dir()
+
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT season_id, stat_period, COUNT(*) FROM player_stats_batting "
+            "GROUP BY 1, 2"
+        )
+        expected = {f"season_id={s}/stat_period={p}": n for s, p, n in cur.fetchall()}
+    files = sorted(path.rglob("*.parquet"))
+    got = {
+        f.parent.relative_to(path).as_posix(): pq.ParquetFile(f).metadata.num_rows
+        for f in files
+    }
+    assert got == expected
+
+    # Readers prune on the path; the full dataset round-trips every row.
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    period = next(iter(expected)).split("stat_period=")[1]
+    pruned = dataset.to_table(filter=ds.field("stat_period") == period)
+    assert pruned.num_rows == expected[next(iter(expected))]
+    assert dataset.count_rows() == sum(expected.values())
+
+
+def test_layout_switch_removes_other_layout(conn, tmp_target: Path):
+    export_table(conn, "player_projections", target_dir=tmp_target)
+    assert (tmp_target / "player_projections.parquet").exists()
+
+    # Same data, different layout: the sidecar doesn't match, so it re-exports.
+    export_table(conn, "player_projections", target_dir=tmp_target, layout="hive")
+    assert not (tmp_target / "player_projections.parquet").exists()
+    assert any((tmp_target / "player_projections").glob("season_id=*/projection_source=*"))
+
+    export_table(conn, "player_projections", target_dir=tmp_target, layout="file")
+    assert not (tmp_target / "player_projections").exists()
+    assert (tmp_target / "player_projections.parquet").exists()
+
+
+def test_hive_layout_leaves_unpartitioned_tables_as_files(conn, tmp_target: Path):
+    path = export_table(conn, "leagues", target_dir=tmp_target, layout="hive")
+    assert path == tmp_target / "leagues.parquet"
+
+
+def test_sorted_layout_with_page_index_and_bloom_filters(conn, tmp_target: Path):
+    """Sorted by SORT_KEYS, non-overlapping player_id ranges, indexes written."""
+    path = export_table(conn, "player_stats_batting", target_dir=tmp_target, row_group_size=100)
+    f = pq.ParquetFile(path)
+    meta = f.metadata
+    assert meta.num_row_groups > 1
+
+    rows = f.read(columns=["player_id", "stat_period"]).to_pylist()
+    keys = [(r["player_id"], r["stat_period"]) for r in rows]
+    assert keys == sorted(keys)
+
+    pid = f.schema_arrow.get_field_index("player_id")
+    period = f.schema_arrow.get_field_index("stat_period")
+    ranges = []
+    for i in range(meta.num_row_groups):
+        rg = meta.row_group(i)
+        assert [(c.column_index, c.descending) for c in rg.sorting_columns] == [
+            (pid, False), (period, False)
+        ]
+        col = rg.column(pid)
+        assert col.has_column_index and col.has_offset_index
+        if parquet_mod._SUPPORTS_BLOOM_FILTERS:
+            assert col.bloom_filter_offset is not None
+        ranges.append((col.statistics.min, col.statistics.max))
+    # A player_id falls in at most two adjacent row groups.
+    assert all(a[1] <= b[0] for a, b in zip(ranges, ranges[1:]))
+
+
+def test_descending_sort_key(conn, tmp_target: Path):
+    path = export_table(conn, "player_valuations", target_dir=tmp_target)
+    rows = pq.read_table(path).to_pylist()
+    by_group: dict = {}
+    for r in rows:
+        by_group.setdefault((r["valuation_type"], r["primary_position"]), []).append(
+            r["total_dollars"]
+        )
+    group_order = list(by_group)
+    assert group_order == sorted(group_order)
+    for dollars in by_group.values():
+        present = [d for d in dollars if d is not None]
+        assert present == sorted(present, reverse=True)
+        assert dollars[:len(present)] == present  # NULLS LAST
+
+
+@pytest.mark.parametrize("method", ["cursor", "copy"])
+def test_compact_profile_narrows_types(conn, tmp_target: Path, method):
+    """Dictionary strings and float64 stats; values equal the exact export."""
+    exact = pq.read_table(export_table(conn, "player_valuations", target_dir=tmp_target / "exact"))
+    path = export_table(conn, "player_valuations", target_dir=tmp_target / "compact",
+                        method=method, profile="compact")
+    compact = pq.read_table(path)
+    schema = compact.schema
+
+    assert schema.field("valuation_type").type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("tier").type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("total_dollars").type == pa.float64()
+    assert schema.field("player_id").type == exact.schema.field("player_id").type
+
+    for name in ("valuation_type", "tier", "total_dollars"):
+        expected = [None if v is None else (float(v) if name == "total_dollars" else v)
+                    for v in exact.column(name).to_pylist()]
+        assert compact.column(name).to_pylist() == expected
+
+
+def test_compact_profile_hive_layout(conn, tmp_target: Path):
+    import pyarrow.dataset as ds
+
+    path = export_table(conn, "player_stats_pitching", target_dir=tmp_target,
+                        layout="hive", profile="compact")
+    f = pq.ParquetFile(next(path.rglob("*.parquet")))
+    assert f.schema_arrow.field("ERA").type == pa.float64()
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM player_stats_pitching")
+        assert dataset.count_rows() == cur.fetchone()[0]
+
+
+def test_compact_scale_zero_numeric_becomes_integer(conn, tmp_target: Path):
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS _compact_types")
+        cur.execute(
+            "CREATE TABLE _compact_types (id INTEGER, games NUMERIC(4, 0), "
+            "big NUMERIC(12, 0), rate NUMERIC(5, 3), tier VARCHAR(20))"
+        )
+        cur.execute(
+            "INSERT INTO _compact_types VALUES (1, 162, 123456789012, 0.275, 'A'), "
+            "(2, NULL, NULL, NULL, NULL)"
+        )
+    conn.commit()
+    try:
+        path = export_table(conn, "_compact_types", target_dir=tmp_target, profile="compact")
+        table = pq.read_table(path)
+        assert [table.schema.field(n).type for n in ("games", "big", "rate")] == [
+            pa.int32(), pa.int64(), pa.float64()
+        ]
+        assert table.to_pylist() == [
+            {"id": 1, "games": 162, "big": 123456789012, "rate": 0.275, "tier": "A"},
+            {"id": 2, "games": None, "big": None, "rate": None, "tier": None},
+        ]
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE _compact_types")
+        conn.commit()
+
+
+def test_profile_switch_reexports(conn, tmp_target: Path):
+    export_table(conn, "position_summary", target_dir=tmp_target)
+    _, skipped = parquet_mod._export_table(
+        conn, "position_summary", tmp_target, batch_size=parquet_mod.EXPORT_BATCH_SIZE,
+        method="copy", force=False, profile="compact",
+    )
+    assert not skipped
+    meta = json.loads((tmp_target / "position_summary.meta.json").read_text())
+    assert meta["profile"] == "compact"
+
+
+def test_export_rejects_unknown_profile(conn, tmp_target: Path):
+    with pytest.raises(ValueError, match="Unknown export profile"):
+        export_table(conn, "leagues", target_dir=tmp_target, profile="tiny")
+
+
 def test_atomic_swap_cleans_stale_tmp(conn, tmp_target: Path):
     """A leftover .parquet.tmp from a crashed prior run is swept before retry."""
     tmp_target.mkdir(parents=True, exist_ok=True)
@@ -69,7 +395,7 @@ def test_atomic_swap_cleans_stale_tmp(conn, tmp_target: Path):
 
 
 def test_atomic_swap_no_tmp_on_failure(conn, tmp_target: Path):
-    """When pq.write_table raises, no .parquet.tmp is left behind.
+    """When a row-group write raises, no partial .parquet is surfaced.
 
     unlink(missing_ok=True) at the start of the next run sweeps it; this
     test verifies the contract that .tmp is the only intermediate artifact
@@ -77,7 +403,7 @@ def test_atomic_swap_no_tmp_on_failure(conn, tmp_target: Path):
     """
     tmp_target.mkdir(parents=True, exist_ok=True)
 
-    with patch("player_universe_load.exporters.parquet.pq.write_table",
+    with patch("player_universe_load.exporters.parquet.pq.ParquetWriter.write_batch",
                side_effect=RuntimeError("boom")):
         with pytest.raises(RuntimeError, match="boom"):
             export_table(conn, "players", target_dir=tmp_target)
@@ -92,6 +418,131 @@ def test_atomic_swap_no_tmp_on_failure(conn, tmp_target: Path):
     assert (tmp_target / "players.parquet").exists()
 
 
+def test_streaming_export_row_groups_follow_row_group_size(conn, tmp_target: Path):
+    """Fetch batch size bounds memory; row_group_size alone sets the layout."""
+    small = export_table(conn, "players", target_dir=tmp_target / "small",
+                         batch_size=7, row_group_size=7)
+    regrouped = export_table(conn, "players", target_dir=tmp_target / "regrouped",
+                             batch_size=7, row_group_size=50)
+    whole = export_table(conn, "players", target_dir=tmp_target / "whole")
+
+    meta = pq.ParquetFile(small).metadata
+    assert meta.num_rows > 50
+    assert meta.num_row_groups == -(-meta.num_rows // 7)
+    assert pq.ParquetFile(regrouped).metadata.num_row_groups == -(-meta.num_rows // 50)
+    assert pq.read_table(small).equals(pq.read_table(whole))
+    assert pq.read_table(regrouped).equals(pq.read_table(whole))
+
+
+@pytest.mark.parametrize("table", EXPORTED_TABLES)
+def test_copy_export_matches_cursor_export(conn, tmp_target: Path, table: str):
+    """The COPY fast path writes exactly the data the cursor path writes."""
+    via_cursor = export_table(conn, table, target_dir=tmp_target / "cursor", method="cursor")
+    via_copy = export_table(conn, table, target_dir=tmp_target / "copy", method="copy")
+    assert pq.read_table(via_copy).equals(pq.read_table(via_cursor))
+
+
+def test_copy_export_edge_values_match_cursor(conn, tmp_target: Path):
+    """Non-finite/half-way NUMERICs, NULL vs '', embedded newlines, odd JSONB."""
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS _copy_probe")
+        cur.execute("""
+            CREATE TABLE _copy_probe (
+                id integer, era numeric, label varchar(20), note text,
+                ok boolean, doc jsonb, seen timestamp, born date
+            )
+        """)
+        cur.execute("""
+            INSERT INTO _copy_probe VALUES
+              (1, 'Infinity', '', E'two\nlines, "quoted"', true,
+               '{"b": 1.50, "a": "é"}', '2026-04-01 12:00:00.5', '1990-01-31'),
+              (2, 'NaN', NULL, NULL, false, '"bare string"', NULL, NULL),
+              (3, -4.5675, 'NULL', 'NA', NULL, 'null', NULL, NULL),
+              (4, 0.2785, 't', '', NULL, '[1, 2e3, {"k": null}]', NULL, NULL),
+              (5, -0.0004, 'x', NULL, NULL, NULL, NULL, NULL)
+        """)
+    conn.commit()
+    try:
+        via_cursor = export_table(conn, "_copy_probe", target_dir=tmp_target / "cursor",
+                                  method="cursor")
+        via_copy = export_table(conn, "_copy_probe", target_dir=tmp_target / "copy",
+                                method="copy")
+        a, b = pq.read_table(via_cursor), pq.read_table(via_copy)
+        assert b.equals(a)
+        rows = b.to_pylist()
+        assert [r["era"] for r in rows[:2]] == [None, None]
+        assert rows[0]["label"] == "" and rows[1]["label"] is None
+        assert rows[2]["label"] == "NULL"
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE _copy_probe")
+        conn.commit()
+
+
+@pytest.mark.parametrize("method", ["cursor", "copy"])
+def test_sql_numeric_sanitization_matches_sanitize_decimals(conn, tmp_target: Path, method):
+    """SQL-side NUMERIC rounding is bit-identical to _sanitize_decimals."""
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS _numeric_probe")
+        cur.execute("CREATE TABLE _numeric_probe (id integer, v numeric, w numeric(10, 4))")
+        cur.execute("""
+            INSERT INTO _numeric_probe VALUES
+              (1, 'Infinity', 0.0005), (2, '-Infinity', -0.0005), (3, 'NaN', NULL),
+              (4, 4.5675, 4.5674), (5, 0.2785, 0.2775), (6, -4.5675, -0.0004),
+              (7, 123456789012345.9994, 1.2), (8, 7, 0), (9, -0.0005, 9.9995)
+        """)
+    conn.commit()
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("SELECT * FROM _numeric_probe")
+            rows = parquet_mod._sanitize_decimals([dict(r) for r in cur.fetchall()])
+        schema = parquet_mod.arrow_schema_for(conn, "_numeric_probe")
+        expected = pa.Table.from_pylist(rows, schema=schema)
+
+        p = export_table(conn, "_numeric_probe", target_dir=tmp_target, method=method)
+        assert pq.read_table(p).equals(expected)
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE _numeric_probe")
+        conn.commit()
+
+
+@pytest.mark.parametrize("table", ["player_stats_batting", "player_stats_pitching"])
+def test_stats_export_matches_row_level_sanitization(conn, tmp_target: Path, table):
+    """Loaded stats tables export exactly as the per-cell Python path would."""
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(f'SELECT * FROM {table} ORDER BY player_id, stat_period COLLATE "C"')
+        rows = parquet_mod._sanitize_decimals([dict(r) for r in cur.fetchall()])
+    rows = parquet_mod._stringify_jsonb(
+        rows, [n for n, t in parquet_mod.table_columns(conn, table) if t == "jsonb"]
+    )
+    expected = pa.Table.from_pylist(rows, schema=parquet_mod.arrow_schema_for(conn, table))
+    assert pq.read_table(export_table(conn, table, target_dir=tmp_target)).equals(expected)
+
+
+def test_copy_export_falls_back_for_unsupported_types(conn, tmp_target: Path):
+    """bytea/ARRAY columns route through the cursor path instead of COPY."""
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS _copy_fallback")
+        cur.execute("CREATE TABLE _copy_fallback (id integer, blob bytea)")
+        cur.execute("INSERT INTO _copy_fallback VALUES (1, '\\xdeadbeef')")
+    conn.commit()
+    try:
+        with patch.object(parquet_mod, "_iter_copy_batches") as copy_path:
+            p = export_table(conn, "_copy_fallback", target_dir=tmp_target, method="copy")
+        copy_path.assert_not_called()
+        assert pq.read_table(p).column("blob").to_pylist() == [b"\xde\xad\xbe\xef"]
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE _copy_fallback")
+        conn.commit()
+
+
+def test_export_rejects_unknown_method(conn, tmp_target: Path):
+    with pytest.raises(ValueError, match="Unknown export method"):
+        export_table(conn, "leagues", target_dir=tmp_target, method="binary")
+
+
 def test_jsonb_roundtrip_preserves_structure(conn, tmp_target: Path):
     """JSONB columns serialize as JSON strings and round-trip cleanly."""
     export_table(conn, "players", target_dir=tmp_target)
@@ -111,6 +562,247 @@ def test_jsonb_roundtrip_preserves_structure(conn, tmp_target: Path):
         assert isinstance(bp, dict)
 
 
+@pytest.mark.parametrize("method", ["cursor", "copy"])
+def test_nested_jsonb_matches_json_strings(conn, tmp_target: Path, method):
+    """jsonb="nested" holds the same values as the JSON strings, typed."""
+    strings = pq.read_table(export_table(conn, "players", target_dir=tmp_target / "s"))
+    path = export_table(conn, "players", target_dir=tmp_target / "n",
+                        method=method, jsonb="nested")
+    nested = pq.read_table(path)
+
+    assert nested.schema.field("eligible_slots").type == pa.list_(pa.string())
+    birth_place = nested.schema.field("birth_place").type
+    assert pa.types.is_struct(birth_place)
+    assert {"city", "country"} <= {f.name for f in birth_place}
+
+    for name in ("eligible_slots", "birth_place"):
+        got = nested.column(name).to_pylist()
+        for text, value in zip(strings.column(name).to_pylist(), got):
+            expected = json.loads(text) if text is not None else None
+            if isinstance(value, dict):
+                # Struct rows carry every field; absent keys read back as None.
+                value = {k: v for k, v in value.items() if k in expected}
+            assert value == expected
+
+
+def test_nested_jsonb_struct_field_is_vectorized(conn, tmp_target: Path):
+    import pyarrow.compute as pc
+
+    path = export_table(conn, "leagues", target_dir=tmp_target, jsonb="nested")
+    settings = pq.read_table(path).column("roster_settings")
+    counts = pc.struct_field(settings, "lineup_slot_counts")
+    assert pa.types.is_struct(counts.type)
+    assert pc.struct_field(counts, "0").type == pa.int64()
+
+
+def test_nested_jsonb_falls_back_and_maps(conn, tmp_target: Path):
+    """Mixed shapes stay JSON strings; JSONB_MAP_COLUMNS become maps."""
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS _nested_jsonb")
+        cur.execute(
+            "CREATE TABLE _nested_jsonb (id INTEGER, mixed JSONB, "
+            "eligible_date_by_position JSONB, scores JSONB, empty JSONB)"
+        )
+        cur.execute(
+            "INSERT INTO _nested_jsonb VALUES "
+            """(1, '{"HR": 3}', '{"SS": "2026-04-01"}', '{"a": 1, "b": [1, 2]}', NULL), """
+            """(2, '[{"HR": 3}]', '{"2B": "2026-05-01"}', '{"a": 2.5}', NULL)"""
+        )
+    conn.commit()
+    try:
+        path = export_table(conn, "_nested_jsonb", target_dir=tmp_target, jsonb="nested")
+        table = pq.read_table(path)
+        assert table.schema.field("mixed").type == pa.string()
+        assert table.schema.field("empty").type == pa.string()
+        assert table.schema.field("eligible_date_by_position").type == pa.map_(
+            pa.string(), pa.string()
+        )
+        assert table.schema.field("scores").type == pa.struct(
+            [("a", pa.float64()), ("b", pa.list_(pa.int64()))]
+        )
+        rows = table.to_pylist()
+        assert json.loads(rows[1]["mixed"]) == [{"HR": 3}]
+        assert rows[0]["eligible_date_by_position"] == [("SS", "2026-04-01")]
+        assert rows[1]["scores"] == {"a": 2.5, "b": None}
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE _nested_jsonb")
+        conn.commit()
+
+
+def test_export_rejects_unknown_jsonb_mode(conn, tmp_target: Path):
+    with pytest.raises(ValueError, match="Unknown JSONB mode"):
+        export_table(conn, "leagues", target_dir=tmp_target, jsonb="struct")
+
+
+@pytest.mark.parametrize("ipc", ["uncompressed", "lz4"])
+def test_ipc_side_output_is_memory_mappable(conn, tmp_target: Path, ipc):
+    path = export_table(conn, "players", target_dir=tmp_target, ipc=ipc)
+    arrow_path = tmp_target / "players.arrow"
+    with pa.memory_map(str(arrow_path)) as source:
+        assert pa.ipc.open_file(source).read_all().equals(pq.read_table(path))
+    assert not list(tmp_target.glob("*.tmp"))
+
+    # Unchanged table with the .arrow present is skipped ...
+    _, skipped = parquet_mod._export_table(
+        conn, "players", tmp_target, batch_size=parquet_mod.EXPORT_BATCH_SIZE,
+        method="copy", force=False, ipc=ipc,
+    )
+    assert skipped
+    # ... but a missing .arrow is rewritten, and ipc="off" removes it.
+    arrow_path.unlink()
+    export_table(conn, "players", target_dir=tmp_target, ipc=ipc)
+    assert arrow_path.exists()
+    export_table(conn, "players", target_dir=tmp_target)
+    assert not arrow_path.exists()
+
+
+def test_ipc_side_output_holds_whole_table_for_hive_compact(conn, tmp_target: Path):
+    export_table(conn, "player_stats_batting", target_dir=tmp_target, layout="hive",
+                 profile="compact", ipc="uncompressed")
+    with pa.memory_map(str(tmp_target / "player_stats_batting.arrow")) as source:
+        table = pa.ipc.open_file(source).read_all()
+    dataset = pq.read_table(tmp_target / "player_stats_batting")
+    assert table.num_rows == dataset.num_rows
+    assert table.schema.field("stat_period").type == pa.string()
+    assert table.schema.field("HR").type == pa.float64()
+
+
+def test_export_rejects_unknown_ipc_mode(conn, tmp_target: Path):
+    with pytest.raises(ValueError, match="Unknown IPC mode"):
+        export_table(conn, "leagues", target_dir=tmp_target, ipc="zstd")
+
+
+def _fixture_sink():
+    """DirectParquetSink fed the fixture players the way load_all feeds it."""
+    from datetime import datetime
+
+    from player_universe_load.exporters.direct import DIRECT_TABLES, DirectParquetSink
+    from player_universe_load.loaders.players import PLAYER_TABLE_COLUMNS, prepare_player_rows
+
+    sink = DirectParquetSink()
+    for name in ("hitters.json", "pitchers.json"):
+        data = json.loads((Path("tests/fixtures") / name).read_text())
+        rows = prepare_player_rows(data, datetime.now().year)
+        for table in DIRECT_TABLES:
+            sink.add(table, list(PLAYER_TABLE_COLUMNS[table]), rows[table])
+    return sink
+
+
+@pytest.mark.parametrize("layout", ["file", "hive"])
+def test_direct_parquet_matches_postgres_export(conn, tmp_target: Path, layout):
+    from player_universe_load.exporters.direct import DIRECT_TABLES, check_direct_export
+
+    sink = _fixture_sink()
+    sink.bind(conn)
+    paths = sink.write(tmp_target, layout=layout)
+    assert [p.name.removesuffix(".parquet") for p in paths] == list(DIRECT_TABLES)
+    assert not list(tmp_target.glob("*.meta.json"))
+
+    assert check_direct_export(conn, tmp_target, layout=layout) == []
+    # Matching tables adopt the Postgres sidecar, so a normal export skips them.
+    for table in DIRECT_TABLES:
+        _, skipped = parquet_mod._export_table(
+            conn, table, tmp_target, batch_size=parquet_mod.EXPORT_BATCH_SIZE,
+            method="copy", force=False, layout=layout,
+        )
+        assert skipped
+
+
+def test_direct_parquet_write_rewrites_manifest(conn, tmp_target: Path):
+    """manifest.json describes the direct files, not the export they replaced."""
+    from player_universe_load.exporters.direct import DIRECT_TABLES
+    from player_universe_load.exporters.manifest import read_manifest, sha256_file
+
+    export_all(conn, target_dir=tmp_target)
+    before = {a["table"]: a for a in read_manifest(tmp_target)["artifacts"]}
+    sink = _fixture_sink()
+    sink.bind(conn)
+    sink.write(tmp_target)
+
+    after = {a["table"]: a for a in read_manifest(tmp_target)["artifacts"]}
+    assert set(after) == set(before)
+    for table in DIRECT_TABLES:
+        assert after[table]["sha256"] == sha256_file(tmp_target / f"{table}.parquet")
+        assert after[table]["fingerprint"] is None
+    assert after["leagues"]["sha256"] == before["leagues"]["sha256"]
+
+
+def test_direct_parquet_check_requires_reference_sidecar(conn, tmp_target: Path):
+    from player_universe_load.exporters import direct
+    from player_universe_load.exporters.direct import check_direct_export
+
+    sink = _fixture_sink()
+    sink.bind(conn)
+    sink.write(tmp_target)
+    with patch.object(direct, "read_sidecar", return_value=None):
+        with pytest.raises(RuntimeError, match="no readable sidecar"):
+            check_direct_export(conn, tmp_target, tables=("players",))
+
+
+def test_direct_parquet_check_reports_mismatch(conn, tmp_target: Path):
+    from player_universe_load.exporters.direct import check_direct_export
+
+    sink = _fixture_sink()
+    sink.bind(conn)
+    sink.write(tmp_target)
+    try:
+        # Uncommitted, so only this connection's Postgres export sees it.
+        with conn.cursor() as cur:
+            cur.execute('UPDATE player_stats_batting SET "HR" = "HR" + 1 WHERE "HR" IS NOT NULL')
+        assert check_direct_export(conn, tmp_target) == ["player_stats_batting"]
+        assert not (tmp_target / "player_stats_batting.meta.json").exists()
+        assert (tmp_target / "players.meta.json").exists()
+    finally:
+        conn.rollback()
+
+
+def test_wide_export_pivots_one_row_per_player_season(conn, tmp_target: Path):
+    from player_universe_load.exporters.wide import WIDE_TABLE, wide_columns
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT txid_current()")
+        txid = cur.fetchone()[0]
+    path = export_table(conn, WIDE_TABLE, target_dir=tmp_target)
+    # A plain SELECT: the caller's transaction is still open, no view exists.
+    with conn.cursor() as cur:
+        cur.execute("SELECT txid_current(), to_regclass(%s)", (WIDE_TABLE,))
+        assert cur.fetchone() == (txid, None)
+    wide = pq.read_table(path)
+    assert wide.schema.names == wide_columns()
+    rows = {(r["player_id"], r["season_id"]): r for r in wide.to_pylist()}
+    assert len(rows) == wide.num_rows
+
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(
+            'SELECT player_id, season_id, stat_period, round("HR", 3) AS hr '
+            "FROM player_stats_batting"
+        )
+        batting = cur.fetchall()
+        cur.execute(
+            "SELECT DISTINCT ON (player_id, season_id, valuation_type) "
+            "player_id, season_id, valuation_type, round(total_dollars, 3) AS dollars "
+            "FROM player_valuations ORDER BY player_id, season_id, valuation_type, "
+            "total_dollars DESC NULLS LAST, primary_position"
+        )
+        valuations = cur.fetchall()
+        cur.execute(
+            "SELECT player_id, season_id, array_agg(team_id ORDER BY league_id, team_id) AS teams "
+            "FROM roster_slots GROUP BY player_id, season_id"
+        )
+        rosters = cur.fetchall()
+    assert batting and valuations and rosters
+    for r in batting:
+        assert rows[r["player_id"], r["season_id"]][f"{r['stat_period']}_bat_HR"] == r["hr"]
+    for r in valuations:
+        key = (r["player_id"], r["season_id"])
+        assert rows[key][f"{r['valuation_type']}_total_dollars"] == r["dollars"]
+    for r in rosters:
+        wide_row = rows[r["player_id"], r["season_id"]]
+        assert wide_row["roster_count"] == len(r["teams"])
+        assert [s["team_id"] for s in json.loads(wide_row["rosters"])] == r["teams"]
+
+
 def test_export_single_table_returns_final_path(conn, tmp_target: Path):
     """export_table returns the final .parquet path (not the .tmp)."""
     p = export_table(conn, "leagues", target_dir=tmp_target)
@@ -9,6 +9,7 @@ run manually against the configured bucket).
 from __future__ import annotations
 
 import hashlib
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -53,7 +54,7 @@ def test_sha256_file_matches_hashlib(tmp_path: Path):
     p = tmp_path / "f.bin"
     payload = b"hello\x00world" * 1000
     p.write_bytes(payload)
-    assert r2._sha256_file(p) == hashlib.sha256(payload).hexdigest()
+    assert r2.sha256_file(p) == hashlib.sha256(payload).hexdigest()
 
 
 def test_s3_client_uses_r2_endpoint_and_signing(monkeypatch):
@@ -117,13 +118,15 @@ def test_upload_table_writes_metadata_row(cfg, tmp_path: Path):
 
         result = r2.upload_table(conn, "players", cfg, s3=s3, source_dir=tmp_path)
 
-        # Boto called with R2-correct payload
+        # Boto called with R2-correct payload, under a content-addressed key
+        expected_sha = hashlib.sha256(b"fake parquet bytes").hexdigest()
         s3.put_object.assert_called_once()
         call_kwargs = s3.put_object.call_args.kwargs
         assert call_kwargs["Bucket"] == "testbucket"
-        assert call_kwargs["Key"] == "players.parquet"
+        assert call_kwargs["Key"] == f"players/{expected_sha}.parquet"
         assert call_kwargs["ContentType"] == "application/vnd.apache.parquet"
-        assert "sha256" in call_kwargs["Metadata"]
+        assert call_kwargs["Metadata"] == {"sha256": expected_sha}
+        assert "immutable" in call_kwargs["CacheControl"]
 
         # Metadata row recorded
         with conn.cursor() as cur:
@@ -134,8 +137,8 @@ def test_upload_table_writes_metadata_row(cfg, tmp_path: Path):
             row = cur.fetchone()
             assert row is not None
             object_key, sha256, etag, size_bytes, row_count, bucket = row
-            assert object_key == "players.parquet"
-            assert sha256 == hashlib.sha256(b"fake parquet bytes").hexdigest()
+            assert object_key == f"players/{expected_sha}.parquet"
+            assert sha256 == expected_sha
             assert etag == "abc123etag"  # quotes stripped
             assert size_bytes == len(b"fake parquet bytes")
             assert row_count == result["row_count"]
@@ -215,11 +218,382 @@ def test_upload_table_key_prefix(cfg, tmp_path: Path):
         r2.upload_table(
             conn, "players", cfg, s3=s3, source_dir=tmp_path, key_prefix="prod/2026/"
         )
-        assert s3.put_object.call_args.kwargs["Key"] == "prod/2026/players.parquet"
+        sha = hashlib.sha256(b"x").hexdigest()
+        assert s3.put_object.call_args.kwargs["Key"] == f"prod/2026/players/{sha}.parquet"
     finally:
         conn.close()
 
 
+def _artifact_times(conn, table: str):
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT uploaded_at, verified_at FROM parquet_artifacts "
+            "WHERE table_name = %s",
+            (table,),
+        )
+        return cur.fetchone()
+
+
+def test_upload_table_skips_unchanged_file(cfg, tmp_path: Path):
+    """Same sha256 as the recorded row -> no PUT, only verified_at moves."""
+    (tmp_path / "teams.parquet").write_bytes(b"same bytes")
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"t1"'}
+
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = 'teams'")
+        conn.commit()
+        first = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+        uploaded_at, verified_at = _artifact_times(conn, "teams")
+
+        second = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+
+        assert s3.put_object.call_count == 1
+        assert not first["skipped"] and second["skipped"]
+        assert second["etag"] == "t1"
+        assert second["size_bytes"] == len(b"same bytes")
+        again_uploaded, again_verified = _artifact_times(conn, "teams")
+        assert again_uploaded == uploaded_at
+        assert again_verified > verified_at
+
+        r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path, force=True)
+        assert s3.put_object.call_count == 2
+    finally:
+        conn.close()
+
+
+def test_upload_skip_survives_schema_reload(cfg, tmp_path: Path):
+    """load-local re-runs the schema files; recorded uploads must outlive it."""
+    (tmp_path / "teams.parquet").write_bytes(b"reloaded bytes")
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"t1"'}
+    schema_file = (
+        Path(db.__file__).parent / "schemas" / "13_parquet_artifacts.sql"
+    )
+
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = 'teams'")
+        conn.commit()
+        first = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+
+        db.execute_schema_file(conn, schema_file)
+        conn.commit()
+        second = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+
+        assert s3.put_object.call_count == 1
+        assert not first["skipped"] and second["skipped"]
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = 'teams'")
+            cur.execute(
+                "DELETE FROM parquet_artifact_history WHERE table_name = 'teams'"
+            )
+        conn.commit()
+        conn.close()
+
+
+def test_upload_table_takes_sha256_from_export_sidecar(cfg, tmp_path: Path):
+    """A current sidecar entry saves re-hashing; a stale one is ignored."""
+    f = tmp_path / "teams.parquet"
+    f.write_bytes(b"exported bytes")
+    recorded = "a" * 64
+    (tmp_path / "teams.meta.json").write_text(json.dumps({"files": {"": {
+        "sha256": recorded, "size_bytes": f.stat().st_size, "row_count": 0,
+        "mtime_ns": f.stat().st_mtime_ns,
+    }}}))
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "sha256_file") as sha:
+            result = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+        sha.assert_not_called()
+        assert result["sha256"] == recorded
+        assert s3.put_object.call_args.kwargs["Key"] == f"teams/{recorded}.parquet"
+
+        # Rewritten after the export: the sidecar no longer describes it.
+        f.write_bytes(b"edited by hand, longer")
+        result = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+        assert result["sha256"] == hashlib.sha256(b"edited by hand, longer").hexdigest()
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = 'teams'")
+        conn.commit()
+        conn.close()
+
+
+def test_upload_table_head_check_reuploads_missing_object(cfg, tmp_path: Path):
+    """check_remote: skip only if the object's sha256 metadata still matches."""
+    from botocore.exceptions import ClientError
+
+    payload = b"head-checked"
+    (tmp_path / "leagues.parquet").write_bytes(payload)
+    sha = hashlib.sha256(payload).hexdigest()
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"l1"'}
+
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = 'leagues'")
+        conn.commit()
+        r2.upload_table(conn, "leagues", cfg, s3=s3, source_dir=tmp_path)
+
+        s3.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        result = r2.upload_table(
+            conn, "leagues", cfg, s3=s3, source_dir=tmp_path, check_remote=True
+        )
+        assert not result["skipped"]
+        assert s3.put_object.call_count == 2
+
+        s3.head_object.side_effect = None
+        s3.head_object.return_value = {
+            "Metadata": {"sha256": sha}, "ContentLength": len(payload),
+        }
+        result = r2.upload_table(
+            conn, "leagues", cfg, s3=s3, source_dir=tmp_path, check_remote=True
+        )
+        assert result["skipped"]
+        assert s3.put_object.call_count == 2
+    finally:
+        conn.close()
+
+
+# -------------------- multipart --------------------
+
+
+class _MultipartS3:
+    """Thread-safe fake of the S3 multipart calls; reassembles the object."""
+
+    def __init__(self, fail_part: int | None = None):
+        import threading
+
+        self.lock = threading.Lock()
+        self.parts: dict[int, bytes] = {}
+        self.created: dict = {}
+        self.completed: dict | None = None
+        self.aborted = False
+        self.fail_part = fail_part
+        self.put_object = MagicMock(return_value={"ETag": '"single"'})
+
+    def create_multipart_upload(self, **kwargs):
+        self.created = kwargs
+        return {"UploadId": "u1"}
+
+    def upload_part(self, *, PartNumber, Body, UploadId, **kwargs):
+        assert UploadId == "u1"
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part failed")
+        with self.lock:
+            self.parts[PartNumber] = Body
+        return {"ETag": f'"p{PartNumber}"'}
+
+    def complete_multipart_upload(self, *, MultipartUpload, **kwargs):
+        self.completed = MultipartUpload
+        return {"ETag": '"abc-3"'}
+
+    def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+_PART = 5 * 1024 * 1024
+
+
+def _put(tmp_path: Path, payload: bytes, s3, multipart) -> dict:
+    f = tmp_path / "big.parquet"
+    f.write_bytes(payload)
+    upload = r2._Upload("big", "", f, "big.parquet", 0)
+    cfg = r2.R2Config("a", "k", "s", "bk", "https://e")
+    return r2._put_file(upload, cfg, s3, multipart)
+
+
+def test_multipart_config_rejects_parts_below_s3_minimum():
+    with pytest.raises(ValueError, match="at least"):
+        r2.MultipartConfig(part_size=1024)
+
+
+def test_put_file_uploads_large_file_in_parallel_parts(tmp_path: Path):
+    payload = bytes(range(256)) * (2 * _PART // 256) + b"tail"
+    s3 = _MultipartS3()
+    mp = r2.MultipartConfig(threshold=_PART, part_size=_PART, max_workers=3)
+
+    result = _put(tmp_path, payload, s3, mp)
+
+    s3.put_object.assert_not_called()
+    assert s3.created["Metadata"] == {"sha256": hashlib.sha256(payload).hexdigest()}
+    assert [p["PartNumber"] for p in s3.completed["Parts"]] == [1, 2, 3]
+    assert b"".join(s3.parts[n] for n in sorted(s3.parts)) == payload
+    assert result["etag"] == "abc-3"
+    assert result["sha256"] == hashlib.sha256(payload).hexdigest()
+
+
+def test_put_file_keeps_single_put_below_threshold(tmp_path: Path):
+    s3 = _MultipartS3()
+    result = _put(tmp_path, b"small", s3, r2.MultipartConfig(threshold=_PART))
+    s3.put_object.assert_called_once()
+    assert s3.created == {}
+    assert result["etag"] == "single"
+
+
+def test_put_file_aborts_multipart_on_part_failure(tmp_path: Path):
+    s3 = _MultipartS3(fail_part=2)
+    mp = r2.MultipartConfig(threshold=_PART, part_size=_PART)
+    with pytest.raises(RuntimeError, match="part failed"):
+        _put(tmp_path, b"x" * (2 * _PART + 1), s3, mp)
+    assert s3.aborted
+    assert s3.completed is None
+
+
+def test_upload_table_fixed_key_scheme_overwrites_in_place(cfg, tmp_path: Path):
+    (tmp_path / "players.parquet").write_bytes(b"fixed")
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+
+    conn = db.get_connection()
+    try:
+        result = r2.upload_table(
+            conn, "players", cfg, s3=s3, source_dir=tmp_path, key_scheme="fixed",
+            force=True,
+        )
+        call_kwargs = s3.put_object.call_args.kwargs
+        assert call_kwargs["Key"] == result["object_key"] == "players.parquet"
+        assert "CacheControl" not in call_kwargs
+        with pytest.raises(ValueError, match="key_scheme"):
+            r2.upload_table(conn, "players", cfg, s3=s3, source_dir=tmp_path,
+                            key_scheme="sha")
+    finally:
+        conn.close()
+
+
+class _FakeBucket:
+    """put_object / get_object over a dict, enough for manifest round trips."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+
+    def put_object(self, *, Key, Body, **kwargs):
+        self.objects[Key] = Body if isinstance(Body, bytes) else Body.read()
+        return {"ETag": '"e"'}
+
+    def get_object(self, *, Bucket, Key):
+        import io
+
+        from botocore.exceptions import ClientError
+
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+
+def test_rollback_artifact_repoints_without_touching_r2(cfg, tmp_path: Path):
+    """Two content-addressed generations; rollback only swaps pointers."""
+    pq_file = tmp_path / "teams.parquet"
+    s3 = _FakeBucket()
+
+    conn = db.get_connection()
+    try:
+        pq_file.write_bytes(b"generation one")
+        first = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+        pq_file.write_bytes(b"generation two!")
+        second = r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path)
+        assert first["object_key"] != second["object_key"]
+        objects = dict(s3.objects)
+
+        rolled = r2.rollback_artifact(conn, "teams", first["sha256"], cfg, s3=s3)
+
+        # No manifest in the bucket: nothing in R2 is written.
+        assert s3.objects == objects
+        assert not rolled["manifest_updated"]
+        assert rolled["object_key"] == first["object_key"]
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT object_key, sha256, size_bytes, verified_at "
+                "FROM parquet_artifacts WHERE table_name = 'teams'"
+            )
+            assert cur.fetchone() == (
+                first["object_key"], first["sha256"], len(b"generation one"), None,
+            )
+
+        with pytest.raises(ValueError, match="No uploaded generation"):
+            r2.rollback_artifact(conn, "teams", "0" * 64, cfg, s3=s3)
+
+        pq_file.write_bytes(b"fixed generation")
+        fixed = r2.upload_table(
+            conn, "teams", cfg, s3=s3, source_dir=tmp_path, key_scheme="fixed"
+        )
+        with pytest.raises(ValueError, match="fixed key"):
+            r2.rollback_artifact(conn, "teams", fixed["sha256"], cfg, s3=s3)
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = 'teams'")
+            cur.execute(
+                "DELETE FROM parquet_artifact_history WHERE table_name = 'teams'"
+            )
+        conn.commit()
+        conn.close()
+
+
+def test_rollback_artifact_reuploads_manifest_entry(cfg, tmp_path: Path):
+    """The bucket's manifest.json follows the pointer back."""
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    def export(payload: bytes, stat: int) -> None:
+        for t in EXPORTED_TABLES:
+            (tmp_path / f"{t}.parquet").write_bytes(payload)
+        (tmp_path / "manifest.json").write_text(json.dumps({"artifacts": [
+            {"table": t, "partition_path": "", "sha256": hashlib.sha256(payload).hexdigest(),
+             "size_bytes": len(payload), "row_count": None,
+             "columns": {"player_id": {"max": stat}}}
+            for t in ("players", "teams")
+        ]}))
+
+    def manifest_entry(table: str) -> dict:
+        manifest = json.loads(s3.objects["v1/manifest.json"])
+        return next(a for a in manifest["artifacts"] if a["table"] == table)
+
+    s3 = _FakeBucket()
+    shas = [hashlib.sha256(p).hexdigest() for p in (b"gen one", b"gen two!", b"gen three")]
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3):
+            export(b"gen one", 1)
+            r2.upload_all(conn, cfg, source_dir=tmp_path, key_prefix="v1/")
+            first = manifest_entry("teams")
+            export(b"gen two!", 2)
+            r2.upload_all(conn, cfg, source_dir=tmp_path, key_prefix="v1/")
+        assert manifest_entry("teams")["columns"]["player_id"]["max"] == 2
+
+        rolled = r2.rollback_artifact(conn, "teams", shas[0], cfg, s3=s3)
+
+        assert rolled["manifest_updated"]
+        assert manifest_entry("teams") == first
+        assert manifest_entry("players")["sha256"] == shas[1]
+
+        # Uploaded without a manifest: only the pointer fields are known.
+        (tmp_path / "teams.parquet").write_bytes(b"gen three")
+        r2.upload_table(conn, "teams", cfg, s3=s3, source_dir=tmp_path, key_prefix="v1/")
+        r2.rollback_artifact(conn, "teams", shas[2], cfg, s3=s3)
+        entry = manifest_entry("teams")
+        assert entry["object_key"] == f"v1/teams/{shas[2]}.parquet"
+        assert entry["sha256"] == shas[2]
+        assert "columns" not in entry
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE sha256 = ANY(%s)", (shas,))
+            cur.execute(
+                "DELETE FROM parquet_artifact_history WHERE sha256 = ANY(%s)", (shas,)
+            )
+        conn.commit()
+        conn.close()
+
+
 # -------------------- upload_all --------------------
 
 
@@ -236,7 +610,7 @@ def test_upload_all_iterates_exported_tables(cfg, tmp_path: Path):
     conn = db.get_connection()
     try:
         with patch.object(r2, "_s3_client", return_value=s3):
-            results = r2.upload_all(conn, cfg, source_dir=tmp_path)
+            results = r2.upload_all(conn, cfg, source_dir=tmp_path, force=True)
         assert len(results) == len(EXPORTED_TABLES)
         assert {r["table"] for r in results} == set(EXPORTED_TABLES)
         # One PUT per table
@@ -245,6 +619,132 @@ def test_upload_all_iterates_exported_tables(cfg, tmp_path: Path):
         conn.close()
 
 
+class _CountingConn:
+    """Connection proxy logging every executed statement and commit."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self):
+        self.commits += 1
+        self._conn.commit()
+
+    def cursor(self, *args, **kwargs):
+        proxy = self
+
+        class _Cursor:
+            def __init__(self, cur):
+                self._cur = cur
+
+            def __getattr__(self, name):
+                return getattr(self._cur, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._cur.close()
+
+            def execute(self, query, params=None):
+                text = query.decode() if isinstance(query, bytes) else query
+                proxy.statements.append(" ".join(text.split()))
+                return self._cur.execute(query, params)
+
+        return _Cursor(self._conn.cursor(*args, **kwargs))
+
+
+def test_upload_all_writes_export_row_counts_in_one_statement(cfg, tmp_path: Path):
+    """Row counts come from the export sidecars; one upsert, one commit."""
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    for n, t in enumerate(EXPORTED_TABLES):
+        f = tmp_path / f"{t}.parquet"
+        f.write_bytes(b"counted")
+        (tmp_path / f"{t}.meta.json").write_text(json.dumps({"files": {"": {
+            "sha256": hashlib.sha256(b"counted").hexdigest(),
+            "size_bytes": f.stat().st_size, "row_count": 1000 + n,
+            "mtime_ns": f.stat().st_mtime_ns,
+        }}}))
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+    sha = hashlib.sha256(b"counted").hexdigest()
+
+    conn = db.get_connection()
+    counting = _CountingConn(conn)
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3):
+            r2.upload_all(counting, cfg, source_dir=tmp_path, force=True)
+
+        assert counting.commits == 1
+        assert not [s for s in counting.statements if "COUNT(" in s]
+        upserts = [
+            s for s in counting.statements
+            if s.startswith("INSERT INTO parquet_artifacts ")
+        ]
+        assert len(upserts) == 1
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT table_name, row_count FROM parquet_artifacts WHERE sha256 = %s",
+                (sha,),
+            )
+            recorded = dict(cur.fetchall())
+        assert recorded == {t: 1000 + n for n, t in enumerate(EXPORTED_TABLES)}
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE sha256 = %s", (sha,))
+            cur.execute("DELETE FROM parquet_artifact_history WHERE sha256 = %s", (sha,))
+        conn.commit()
+        conn.close()
+
+
+def test_upload_all_uploads_manifest_last(cfg, tmp_path: Path):
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    for t in EXPORTED_TABLES:
+        (tmp_path / f"{t}.parquet").write_bytes(b"x")
+    (tmp_path / "manifest.json").write_text('{"artifacts": []}')
+
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3):
+            r2.upload_all(
+                conn, cfg, source_dir=tmp_path, key_prefix="v1/", force=True
+            )
+        assert s3.put_object.call_count == len(EXPORTED_TABLES) + 1
+        last = s3.put_object.call_args.kwargs
+        assert last["Key"] == "v1/manifest.json"
+        assert last["ContentType"] == "application/json"
+        assert last["CacheControl"] == "no-cache"
+        assert json.loads(last["Body"]) == {"artifacts": []}
+    finally:
+        conn.close()
+
+
+def test_manifest_entries_copies_artifacts():
+    """object_key goes on copies; the export's manifest stays as read."""
+    manifest = {"artifacts": [
+        {"table": "players", "partition_path": "", "sha256": "a"},
+        {"table": "teams", "partition_path": "", "sha256": "b"},
+    ]}
+    before = json.loads(json.dumps(manifest))
+    uploaded = [{"table": "players", "partition": "", "object_key": "v1/players/a.parquet"}]
+
+    entries = r2._manifest_entries(manifest, uploaded)
+
+    assert manifest == before
+    assert list(entries) == [("players", ""), ("teams", "")]
+    assert entries[("players", "")]["object_key"] == "v1/players/a.parquet"
+    assert entries[("teams", "")]["object_key"] is None
+
+
 def test_upload_all_propagates_failure(cfg, tmp_path: Path):
     """First upload fails -> exception bubbles out, loop short-circuits."""
     from player_universe_load.exporters.parquet import EXPORTED_TABLES
@@ -264,6 +764,283 @@ def test_upload_all_propagates_failure(cfg, tmp_path: Path):
         conn.close()
 
 
+def test_upload_all_puts_concurrently_in_plan_order(cfg, tmp_path: Path):
+    """PUTs overlap up to max_workers; results keep EXPORTED_TABLES order."""
+    import threading
+    import time
+
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    for t in EXPORTED_TABLES:
+        (tmp_path / f"{t}.parquet").write_bytes(b"x")
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def put_object(**kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        # Earlier tables finish last, so completion order != plan order.
+        table = kwargs["Key"].split("/")[0]
+        time.sleep(0.002 * (len(EXPORTED_TABLES) - EXPORTED_TABLES.index(table)))
+        with lock:
+            state["active"] -= 1
+        return {"ETag": '"e"'}
+
+    s3 = MagicMock()
+    s3.put_object.side_effect = put_object
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3) as mk:
+            results = r2.upload_all(
+                conn, cfg, source_dir=tmp_path, max_workers=4, force=True
+            )
+        # Four file workers, each with up to MultipartConfig.max_workers parts.
+        assert mk.call_args.kwargs["max_pool_connections"] == 4 * 4
+        assert [r["table"] for r in results] == list(EXPORTED_TABLES)
+        assert 1 < state["peak"] <= 4
+    finally:
+        conn.close()
+
+
+def test_upload_all_records_landed_objects_when_one_put_fails(cfg, tmp_path: Path):
+    """A failed PUT re-raises, but objects that landed still get their rows."""
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    for t in EXPORTED_TABLES:
+        (tmp_path / f"{t}.parquet").write_bytes(b"fresh")
+    failing = EXPORTED_TABLES[-1]
+
+    def put_object(**kwargs):
+        if kwargs["Key"].startswith(f"{failing}/"):
+            raise RuntimeError("boom")
+        return {"ETag": '"e"'}
+
+    s3 = MagicMock()
+    s3.put_object.side_effect = put_object
+    fresh = hashlib.sha256(b"fresh").hexdigest()
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3):
+            with pytest.raises(RuntimeError, match="boom"):
+                r2.upload_all(
+                    conn, cfg, source_dir=tmp_path, max_workers=1, force=True
+                )
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT table_name FROM parquet_artifacts WHERE sha256 = %s", (fresh,)
+            )
+            recorded = {r[0] for r in cur.fetchall()}
+        assert recorded == set(EXPORTED_TABLES) - {failing}
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE sha256 = %s", (fresh,))
+        conn.commit()
+        conn.close()
+
+
+# -------------------- pipelined export -> upload --------------------
+
+
+def _fake_export(tmp_path: Path, fail_after: int | None = None, wait_for=None):
+    """Stand-in export_all: writes each table's file, then calls on_exported.
+
+    ``wait_for(table)`` runs after each hand-off and before the next table
+    is "exported"; ``fail_after`` raises once that many tables are done.
+    """
+    import time
+
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    def export_all(conn, target_dir, *, on_exported, **kwargs):
+        for n, table in enumerate(EXPORTED_TABLES):
+            if n == fail_after:
+                raise RuntimeError("export failed")
+            start = time.perf_counter()
+            time.sleep(0.005)
+            (tmp_path / f"{table}.parquet").write_bytes(b"piped")
+            on_exported(table, tmp_path / f"{table}.parquet", time.perf_counter() - start)
+            if wait_for is not None:
+                wait_for(table)
+        return [tmp_path / f"{t}.parquet" for t in EXPORTED_TABLES]
+
+    return export_all
+
+
+def test_export_and_upload_puts_while_exporting(cfg, tmp_path: Path):
+    """Each table's PUT starts before the next table is exported."""
+    import threading
+
+    from player_universe_load.exporters import pipeline as pipeline_mod
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    landed = {t: threading.Event() for t in EXPORTED_TABLES}
+
+    def put_object(**kwargs):
+        landed[kwargs["Key"].split("/")[0]].set()
+        return {"ETag": '"e"'}
+
+    def wait_for(table):
+        assert landed[table].wait(5), f"{table} was not uploaded during export"
+
+    s3 = MagicMock()
+    s3.put_object.side_effect = put_object
+    piped = hashlib.sha256(b"piped").hexdigest()
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3), patch.object(
+            pipeline_mod, "export_all", _fake_export(tmp_path, wait_for=wait_for)
+        ):
+            paths, results, stats = pipeline_mod.export_and_upload(
+                None, conn, cfg, target_dir=tmp_path, force=True
+            )
+        assert len(paths) == len(EXPORTED_TABLES)
+        assert [r["table"] for r in results] == list(EXPORTED_TABLES)
+        assert stats["overlap"] > 0
+        for stage in ("export", "upload"):
+            assert 0 < stats[stage]["utilization"] <= 1
+        with conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM parquet_artifacts WHERE sha256 = %s", (piped,))
+            assert cur.fetchone()[0] == len(EXPORTED_TABLES)
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE sha256 = %s", (piped,))
+        conn.commit()
+        conn.close()
+
+
+def test_export_and_upload_records_landed_objects_when_export_fails(cfg, tmp_path: Path):
+    from player_universe_load.exporters import pipeline as pipeline_mod
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+    piped = hashlib.sha256(b"piped").hexdigest()
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3), patch.object(
+            pipeline_mod, "export_all", _fake_export(tmp_path, fail_after=2)
+        ):
+            with pytest.raises(RuntimeError, match="export failed"):
+                pipeline_mod.export_and_upload(
+                    None, conn, cfg, target_dir=tmp_path, force=True
+                )
+        with conn.cursor() as cur:
+            cur.execute("SELECT table_name FROM parquet_artifacts WHERE sha256 = %s", (piped,))
+            assert {r[0] for r in cur.fetchall()} == set(EXPORTED_TABLES[:2])
+        # No manifest goes up for a failed export.
+        assert s3.put_object.call_count == 2
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE sha256 = %s", (piped,))
+        conn.commit()
+        conn.close()
+
+
+def test_cli_parquet_and_sync_pipelined(monkeypatch):
+    from player_universe_load import cli
+
+    with patch.object(cli, "get_connection") as get_conn, patch.object(
+        cli, "export_and_upload", return_value=([], [], {})
+    ) as piped, patch.object(cli, "export_parquets") as ep:
+        cli.parquet_and_sync(pipelined=True)
+    ep.assert_not_called()
+    piped.assert_called_once()
+    # Uploads plan and record on a second connection, off the export snapshot.
+    assert get_conn.call_count == 2
+
+
+# -------------------- upload_dataset --------------------
+
+
+def _write_fake_dataset(root: Path, table: str, partitions: dict[str, int]) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    for partition_path, n in partitions.items():
+        d = root / table / partition_path
+        d.mkdir(parents=True)
+        pq.write_table(pa.table({"player_id": list(range(n))}), d / "part-0.parquet")
+
+
+def test_upload_dataset_one_row_per_partition(cfg, tmp_path: Path):
+    partitions = {
+        "season_id=2026/stat_period=espn_last_7": 3,
+        "season_id=2026/stat_period=savant_all": 5,
+    }
+    _write_fake_dataset(tmp_path, "_ds_stats", partitions)
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+
+    conn = db.get_connection()
+    try:
+        # A stale single-file row for the same table must be replaced.
+        _seed_artifact(conn, "_ds_stats", "0" * 64, 1)
+        results = r2.upload_dataset(
+            conn, "_ds_stats", cfg, s3=s3, source_dir=tmp_path, key_prefix="p/"
+        )
+        assert [r["partition"] for r in results] == sorted(partitions)
+        keys = [c.kwargs["Key"] for c in s3.put_object.call_args_list]
+        shas = {
+            p: r2.sha256_file(tmp_path / "_ds_stats" / p / "part-0.parquet")
+            for p in partitions
+        }
+        assert keys == [f"p/_ds_stats/{p}/{shas[p]}.parquet" for p in sorted(partitions)]
+
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT partition_path, row_count FROM parquet_artifacts "
+                "WHERE table_name = '_ds_stats' ORDER BY partition_path"
+            )
+            assert dict(cur.fetchall()) == partitions
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = '_ds_stats'")
+        conn.commit()
+        conn.close()
+
+
+def test_upload_all_routes_dataset_dirs(cfg, tmp_path: Path):
+    from player_universe_load.exporters.parquet import EXPORTED_TABLES
+
+    for t in EXPORTED_TABLES:
+        if t != "player_stats_pitching":
+            (tmp_path / f"{t}.parquet").write_bytes(b"x")
+    _write_fake_dataset(
+        tmp_path, "player_stats_pitching",
+        {"season_id=2026/stat_period=a": 1, "season_id=2026/stat_period=b": 2},
+    )
+    s3 = MagicMock()
+    s3.put_object.return_value = {"ETag": '"e"'}
+
+    conn = db.get_connection()
+    try:
+        with patch.object(r2, "_s3_client", return_value=s3):
+            results = r2.upload_all(conn, cfg, source_dir=tmp_path)
+        assert len(results) == len(EXPORTED_TABLES) + 1
+        pitching = [r for r in results if r["table"] == "player_stats_pitching"]
+        assert [r["partition"] for r in pitching] == [
+            "season_id=2026/stat_period=a", "season_id=2026/stat_period=b",
+        ]
+    finally:
+        conn.close()
+
+
+def test_upload_dataset_missing_dir_raises(cfg, tmp_path: Path):
+    conn = db.get_connection()
+    try:
+        with pytest.raises(FileNotFoundError, match="--layout hive"):
+            r2.upload_dataset(conn, "player_stats_batting", cfg, s3=MagicMock(),
+                              source_dir=tmp_path)
+    finally:
+        conn.close()
+
+
 # -------------------- CLI integration --------------------
 
 
@@ -305,7 +1082,7 @@ def _seed_artifact(conn, table_name: str, sha256: str, size_bytes: int,
               (table_name, object_key, bucket, endpoint, sha256, etag,
                size_bytes, row_count)
             VALUES (%s, %s, 'b', 'e', %s, NULL, %s, 0)
-            ON CONFLICT (table_name) DO UPDATE SET
+            ON CONFLICT (table_name, partition_path) DO UPDATE SET
               object_key = EXCLUDED.object_key,
               sha256 = EXCLUDED.sha256,
               size_bytes = EXCLUDED.size_bytes
@@ -315,11 +1092,24 @@ def _seed_artifact(conn, table_name: str, sha256: str, size_bytes: int,
     conn.commit()
 
 
-def _fake_s3_returning(body_bytes: bytes) -> MagicMock:
+def _fake_s3_returning(body_bytes: bytes, metadata_sha256: str | None = None) -> MagicMock:
+    """Fake S3 serving ``body_bytes`` as a stream, with Range and HEAD support."""
+    import io
+
+    def get_object(*, Range=None, **kwargs):
+        data = body_bytes
+        if Range == "bytes=0-3":
+            data = body_bytes[:4]
+        elif Range == "bytes=-4":
+            data = body_bytes[-4:]
+        return {"Body": io.BytesIO(data)}
+
     s3 = MagicMock()
-    body = MagicMock()
-    body.read.return_value = body_bytes
-    s3.get_object.return_value = {"Body": body}
+    s3.get_object.side_effect = get_object
+    s3.head_object.return_value = {
+        "ContentLength": len(body_bytes),
+        "Metadata": {"sha256": metadata_sha256 or hashlib.sha256(body_bytes).hexdigest()},
+    }
     return s3
 
 
@@ -397,7 +1187,7 @@ def test_verify_table_bad_magic(cfg):
 
 
 def test_verify_table_sha256_mismatch(cfg):
-    actual = b"PAR1\x00other-bytes"
+    actual = b"PAR1\x00other-bytes" + b"PAR1"
     conn = db.get_connection()
     try:
         # Recorded sha is for different bytes
@@ -413,8 +1203,86 @@ def test_verify_table_sha256_mismatch(cfg):
         conn.close()
 
 
+def test_verify_table_deep_streams_in_chunks(cfg, monkeypatch):
+    """deep mode hashes chunk by chunk and checks the trailing magic too."""
+    monkeypatch.setattr(r2, "_VERIFY_CHUNK", 3)
+    good = b"PAR1" + b"z" * 20 + b"PAR1"
+    truncated = good[:-2]
+    conn = db.get_connection()
+    try:
+        _seed_artifact(conn, "_vt_deep", hashlib.sha256(good).hexdigest(), len(good))
+        result = r2.verify_table(conn, "_vt_deep", cfg, s3=_fake_s3_returning(good))
+        assert result["ok"] and result["bytes_read"] == len(good)
+
+        _seed_artifact(conn, "_vt_deep", hashlib.sha256(truncated).hexdigest(),
+                       len(truncated))
+        result = r2.verify_table(conn, "_vt_deep", cfg, s3=_fake_s3_returning(truncated))
+        assert not result["ok"]
+        assert "trailing" in result["error"]
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = '_vt_deep'")
+        conn.commit()
+        conn.close()
+
+
+def test_verify_table_fast_uses_head_and_magic_ranges(cfg):
+    payload = b"PAR1" + b"f" * 50 + b"PAR1"
+    sha = hashlib.sha256(payload).hexdigest()
+    conn = db.get_connection()
+    try:
+        _seed_artifact(conn, "_vt_fast", sha, len(payload))
+        s3 = _fake_s3_returning(payload)
+        result = r2.verify_table(conn, "_vt_fast", cfg, s3=s3, mode="fast")
+        assert result["ok"] and result["bytes_read"] == 8
+        ranges = [c.kwargs.get("Range") for c in s3.get_object.call_args_list]
+        assert ranges == ["bytes=0-3", "bytes=-4"]
+
+        stale = _fake_s3_returning(payload, metadata_sha256="f" * 64)
+        result = r2.verify_table(conn, "_vt_fast", cfg, s3=stale, mode="fast")
+        assert not result["ok"]
+        assert "sha256 metadata mismatch" in result["error"]
+        stale.get_object.assert_not_called()
+
+        with pytest.raises(ValueError, match="mode"):
+            r2.verify_table(conn, "_vt_fast", cfg, s3=s3, mode="quick")
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = '_vt_fast'")
+        conn.commit()
+        conn.close()
+
+
+def test_verify_table_partition(cfg):
+    payload = b"PAR1" + b"p" * 10 + b"PAR1"
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO parquet_artifacts
+                  (table_name, partition_path, object_key, bucket, endpoint,
+                   sha256, size_bytes, row_count)
+                VALUES ('_vt_part', 'season_id=2026', '_vt_part/season_id=2026/part-0.parquet',
+                        'b', 'e', %s, %s, 1)
+                """,
+                (hashlib.sha256(payload).hexdigest(), len(payload)),
+            )
+        conn.commit()
+        s3 = _fake_s3_returning(payload)
+        assert not r2.verify_table(conn, "_vt_part", cfg, s3=s3)["ok"]
+        result = r2.verify_table(conn, "_vt_part", cfg, s3=s3, partition_path="season_id=2026")
+        assert result["ok"] and result["partition"] == "season_id=2026"
+        assert s3.get_object.call_args.kwargs["Key"] == "_vt_part/season_id=2026/part-0.parquet"
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name = '_vt_part'")
+        conn.commit()
+        conn.close()
+
+
 def test_verify_all_iterates_tables(cfg):
-    payload = b"PAR1\x00\x01"
+    payload = b"PAR1\x00\x01" + b"PAR1"
     conn = db.get_connection()
     try:
         with conn.cursor() as cur:
@@ -436,6 +1304,49 @@ def test_verify_all_iterates_tables(cfg):
         conn.close()
 
 
+def test_verify_all_checks_concurrently_in_table_order(cfg):
+    """Checks overlap; results still come back sorted by table."""
+    import threading
+    import time
+
+    payload = b"PAR1" + b"v" * 10 + b"PAR1"
+    s3 = _fake_s3_returning(payload)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+    serve = s3.get_object.side_effect
+
+    def slow_get(**kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        # _va_a finishes last.
+        time.sleep(0.05 if kwargs["Key"].startswith("_va_a") else 0.01)
+        with lock:
+            state["active"] -= 1
+        return serve(**kwargs)
+
+    s3.get_object.side_effect = slow_get
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name LIKE '_va_%'")
+        conn.commit()
+        for name in ("_va_a", "_va_b", "_va_c"):
+            _seed_artifact(conn, name, hashlib.sha256(payload).hexdigest(), len(payload))
+
+        with patch.object(r2, "_s3_client", return_value=s3) as mk:
+            results = r2.verify_all(conn, cfg, max_workers=3)
+        assert mk.call_args.kwargs["max_pool_connections"] == 3
+        ours = [r["table"] for r in results if r["table"].startswith("_va_")]
+        assert ours == ["_va_a", "_va_b", "_va_c"]
+        assert state["peak"] > 1
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM parquet_artifacts WHERE table_name LIKE '_va_%'")
+        conn.commit()
+        conn.close()
+
+
 # -------------------- CLI: parquet-and-sync + verify-r2 --------------------
 
 
@@ -487,6 +1398,22 @@ def test_cli_main_parquet_and_sync_subcommand(monkeypatch):
         pas.assert_called_once()
 
 
+def test_cli_main_rollback_r2_requires_table_and_sha(monkeypatch):
+    import sys
+    from player_universe_load import cli
+
+    monkeypatch.setattr(sys, "argv", ["player-universe-load", "rollback-r2"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+    monkeypatch.setattr(sys, "argv", [
+        "player-universe-load", "rollback-r2", "--table", "players", "--sha256", "ab",
+    ])
+    with patch("player_universe_load.cli.rollback_r2") as rb:
+        assert cli.main() == 0
+        rb.assert_called_once_with("players", "ab", partition="")
+
+
 def test_cli_main_verify_r2_subcommand(monkeypatch):
     import sys
     from player_universe_load import cli
@@ -84,7 +84,7 @@ def test_table_columns_raises_on_unknown_table():
     conn = db.get_connection()
     try:
         with pytest.raises(RuntimeError, match="not found in information_schema"):
-            parquet_mod._table_columns(conn, "no_such_table_xyz")
+            parquet_mod.table_columns(conn, "no_such_table_xyz")
     finally:
         conn.close()
 
@@ -170,7 +170,7 @@ def test_arrow_schema_unknown_pg_type_falls_back_to_string(tmp_path: Path):
         with conn.cursor() as cur:
             cur.execute("CREATE TEMP TABLE _unknown_probe (label inet)")
             conn.commit()
-        schema = parquet_mod._arrow_schema_for(conn, "_unknown_probe")
+        schema = parquet_mod.arrow_schema_for(conn, "_unknown_probe")
         assert schema.field("label").type == pa.string()
     finally:
         conn.close()
@@ -230,6 +230,97 @@ def test_stringify_jsonb_no_cols_short_circuits():
     assert parquet_mod._stringify_jsonb(rows, []) is rows
 
 
+
+def test_merge_json_types_unifies_and_rejects():
+    import pyarrow as pa
+
+    a = parquet_mod._json_type({"x": 1, "y": None})
+    b = parquet_mod._json_type({"x": 2.5, "z": ["s"]})
+    merged = parquet_mod._merge_json_types(a, b)
+    assert merged == pa.struct([
+        ("x", pa.float64()), ("y", pa.null()), ("z", pa.list_(pa.string())),
+    ])
+    # Never-seen types become string in the written schema.
+    assert parquet_mod._finalize_json_type(merged).field("y").type == pa.string()
+    with pytest.raises(parquet_mod._MixedJsonShape):
+        parquet_mod._merge_json_types(a, parquet_mod._json_type([1]))
+    with pytest.raises(parquet_mod._MixedJsonShape):
+        parquet_mod._json_type(1 << 64)
+
+
+def test_finalize_json_type_wide_or_empty_struct_becomes_map():
+    import pyarrow as pa
+
+    wide = pa.struct([(str(i), pa.int64()) for i in range(parquet_mod._MAX_STRUCT_FIELDS + 1)])
+    assert parquet_mod._finalize_json_type(wide) == pa.map_(pa.string(), pa.int64())
+    assert parquet_mod._finalize_json_type(pa.struct([])) == pa.map_(pa.string(), pa.string())
+
+
+def test_wide_columns_are_unique_postgres_identifiers():
+    from player_universe_load.exporters import wide
+
+    cols = wide.wide_columns()
+    assert len(cols) == len(set(cols))
+    assert max(map(len, cols)) <= 63
+    assert "espn_current_bat_HR" in cols and "espn_current_pit_HR" in cols
+    assert "ros_total_dollars" in cols
+
+
+# -------------------- exporters/direct.py --------------------
+
+
+def test_direct_sink_replays_on_conflict_semantics():
+    from player_universe_load.exporters.direct import DirectParquetSink
+
+    sink = DirectParquetSink()
+    sink.add("players", ["id_espn", "id_xmlbam", "name"], [
+        (1, 10, "first"),
+        (1, 11, "same id_espn"),       # DO NOTHING: id_espn taken
+        (2, 10, "same id_xmlbam"),     # DO NOTHING: partial unique index
+        (3, None, "null xmlbam"),
+        (4, None, "null never conflicts"),
+    ])
+    assert [r["name"] for r in sink._rows["players"]] == [
+        "first", "null xmlbam", "null never conflicts"
+    ]
+
+    cols = ["player_id", "season_id", "stat_period", "HR"]
+    sink.add("player_stats_batting", cols, [(1, 2026, "espn_current", 5)])
+    sink.add("player_stats_batting", cols, [
+        (2, 2026, "espn_current", 1),
+        (1, 2026, "espn_current", 7),  # DO UPDATE: last write wins
+        (1, 2026, "espn_last_7", 2),
+    ])
+    rows = sink._rows["player_stats_batting"]
+    assert [(r["player_id"], r["stat_period"], r["HR"]) for r in rows] == [
+        (1, "espn_current", 7), (2, "espn_current", 1), (1, "espn_last_7", 2),
+    ]
+    # Upserted row keeps its SERIAL; the conflicting attempt still used one.
+    assert [r["_serial"] for r in rows] == [1, 2, 4]
+
+    sink.add("leagues", ["league_id"], [(1,)])  # not a direct table: ignored
+    assert "leagues" not in sink._rows
+
+
+def test_direct_jsonb_text_matches_jsonb_roundtrip():
+    from player_universe_load.exporters.direct import _jsonb_text
+
+    assert _jsonb_text('{"bb": 1, "a": -0.0, "c": 1e16, "nested": {"zz": 1, "y": 2}}') == (
+        '{"a": 0.0, "c": 10000000000000000, "bb": 1, "nested": {"y": 2, "zz": 1}}'
+    )
+    assert _jsonb_text('"bare"') == "bare"
+    assert _jsonb_text(None) is None
+
+
+def test_direct_numeric_applies_typmod_then_export_rounding():
+    from player_universe_load.exporters.direct import _coerce
+
+    assert _coerce(150.25, "numeric", 1) == Decimal("150.300")
+    assert _coerce(0.12345, "numeric", None) == Decimal("0.123")
+    assert _coerce(float("nan"), "numeric", None) is None
+    assert _coerce(12.5, "integer", None) == 13
+    assert _coerce(True, "character varying", None) == "true"
+
 # -------------------- validation/schema_validator.py --------------------
 
 
@@ -601,9 +692,91 @@ def test_load_all_missing_files_emits_warnings(tmp_path: Path, monkeypatch, caps
     out = capsys.readouterr().out
     assert "Hitters file not found" in out
     assert "Pitchers file not found" in out
-    assert "League file not found" in out
+    assert "No league summary files found" in out
     assert "No team files found" in out
-    assert "Schedule file not found" in out
+
+
+def test_discover_leagues_globs_summary_files(tmp_path: Path):
+    for name in ("league_20_summary.json", "league_3_summary.json",
+                 "league_3_schedule.json", "league_abc_summary.json"):
+        (tmp_path / name).write_text("{}")
+    assert main_mod.discover_leagues(tmp_path) == [3, 20]
+
+
+def test_load_all_loads_every_league_concurrently(tmp_path: Path, monkeypatch, capsys):
+    """Two league summaries -> both loaded, each with its own timing line.
+
+    League 20002 gets one roster and no schedule; a roster for a league
+    with no summary is skipped with a warning rather than failing the FK.
+    """
+    import shutil
+
+    fixtures = Path("tests/fixtures")
+    data = tmp_path / "data"
+    shutil.copytree(fixtures, data)
+
+    summary = json.loads((fixtures / "league_10998_summary.json").read_text())
+    summary["league_id"] = 20002
+    (data / "league_20002_summary.json").write_text(json.dumps(summary))
+    for team_id, league_id in ((9017, 20002), (9018, 30003)):
+        team = json.loads((fixtures / "team_17_roster.json").read_text())
+        team["team_id"], team["league_id"] = team_id, league_id
+        (data / f"team_{team_id}_roster.json").write_text(json.dumps(team))
+
+    missing = tmp_path / "missing"
+    monkeypatch.setattr(main_mod, "TRANSFORM_DIR", missing)
+    monkeypatch.setattr(main_mod, "LOAD_DIR", missing)
+    monkeypatch.setattr(main_mod, "FIXTURES_DIR", data)
+    main_mod.load_all(max_workers=2)
+
+    out = capsys.readouterr().out
+    assert "League 10998:" in out and "League 20002:" in out
+    assert out.count("⏱️  league") == 2
+    assert "Skipping 1 team file(s) for league 30003" in out
+    assert "league_20002_schedule.json" in out  # schedule-missing warning
+
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT league_id FROM leagues ORDER BY league_id")
+            assert [r[0] for r in cur.fetchall()] == [10998, 20002]
+            cur.execute("SELECT league_id FROM teams WHERE team_id IN (9017, 9018)")
+            assert cur.fetchall() == [(20002,)]
+            cur.execute("SELECT COUNT(*) FROM matchups WHERE league_id = 20002")
+            assert cur.fetchone()[0] == 0
+            # SERIAL ids follow league order, so exports are stable run to run
+            cur.execute("SELECT league_id FROM league_scoring_categories ORDER BY id")
+            ids = [r[0] for r in cur.fetchall()]
+            assert ids == sorted(ids) and set(ids) == {10998, 20002}
+            cur.execute("SELECT league_id FROM roster_slots ORDER BY id")
+            ids = [r[0] for r in cur.fetchall()]
+            assert ids == sorted(ids) and set(ids) == {10998, 20002}
+    finally:
+        conn.close()
+
+
+def test_stage_order_runs_each_stage_in_league_order():
+    """A later league waits for the earlier one, stage by stage."""
+    import threading
+
+    order = main_mod._StageOrder(3)
+    seen: list[tuple[str, int]] = []
+
+    def league(index: int) -> None:
+        for stage in main_mod.LEAGUE_STAGES:
+            with order.turn(stage, index):
+                seen.append((stage, index))
+
+    later = threading.Thread(target=league, args=(1,))
+    later.start()
+    later.join(timeout=0.2)
+    assert later.is_alive() and seen == []
+
+    order.release(0)  # league 0 failed before any stage finished
+    later.join(timeout=5)
+    assert not later.is_alive()
+    league(2)
+    assert seen == [(stage, i) for i in (1, 2) for stage in main_mod.LEAGUE_STAGES]
 
 
 def test_load_all_error_path_rolls_back(monkeypatch):
@@ -999,7 +1172,38 @@ def test_cli_local_url_override(monkeypatch):
 def test_cli_load_local_delegates(monkeypatch):
     with patch("player_universe_load.cli.load_all") as la:
         cli.load_local(year=2026)
-        la.assert_called_once_with(year=2026)
+        la.assert_called_once_with(
+            year=2026, max_workers=None, direct_parquet_dir=None, layout="file",
+            verify_direct=False,
+        )
+
+
+def test_cli_load_local_direct_parquet_targets_parquet_dir(monkeypatch):
+    with patch("player_universe_load.cli.load_all") as la:
+        cli.load_local(direct_parquet=True, layout="hive")
+        assert la.call_args.kwargs["direct_parquet_dir"] == cli.PARQUET_DIR
+        assert la.call_args.kwargs["layout"] == "hive"
+
+
+def test_finish_direct_parquet_checks_postgres_only_when_asked(tmp_path: Path):
+    """The default --direct-parquet path never exports from Postgres."""
+    writer = MagicMock()
+    with patch.object(main_mod, "check_direct_export", return_value=[]) as check:
+        main_mod._finish_direct_parquet(MagicMock(), writer, tmp_path, "file")
+        writer.result.assert_called_once()
+        check.assert_not_called()
+
+        main_mod._finish_direct_parquet(MagicMock(), writer, tmp_path, "file", verify=True)
+        check.assert_called_once()
+
+
+def test_cli_main_verify_direct_needs_direct_parquet(monkeypatch):
+    monkeypatch.setattr(
+        sys, "argv", ["player-universe-load", "load-local", "--verify-direct"]
+    )
+    with patch("player_universe_load.cli.load_local") as ll, pytest.raises(SystemExit):
+        cli.main()
+    ll.assert_not_called()
 
 
 def test_cli_export_parquets_runs(monkeypatch, tmp_path: Path):
@@ -1072,12 +1276,33 @@ def test_cli_load_and_sync_orchestrates(monkeypatch):
          patch("player_universe_load.cli.upload_parquets") as up, \
          patch("player_universe_load.cli.sync_to_neon") as sn:
         cli.load_and_sync(year=2026)
-        ll.assert_called_once_with(year=2026)
+        ll.assert_called_once_with(year=2026, workers=None)
         ep.assert_called_once()
         up.assert_called_once()
         sn.assert_called_once()
 
 
+def test_cli_main_load_and_sync_passes_export_and_upload_options(monkeypatch):
+    monkeypatch.setattr(sys, "argv", [
+        "player-universe-load", "load-and-sync", "--force", "--layout", "hive",
+        "--profile", "compact", "--key-scheme", "fixed", "--head-check",
+        "--export-workers", "2", "--upload-workers", "3", "--part-size-mb", "8",
+    ])
+    with patch("player_universe_load.cli.load_local") as ll, \
+         patch("player_universe_load.cli.export_parquets") as ep, \
+         patch("player_universe_load.cli.upload_parquets") as up, \
+         patch("player_universe_load.cli.sync_to_neon"):
+        assert cli.main() == 0
+    ll.assert_called_once_with(year=None, workers=None)
+    exported = ep.call_args.kwargs
+    assert exported["force"] and exported["workers"] == 2
+    assert (exported["layout"], exported["profile"]) == ("hive", "compact")
+    uploaded = up.call_args.kwargs
+    assert uploaded["force"] and uploaded["check_remote"]
+    assert (uploaded["workers"], uploaded["key_scheme"]) == (3, "fixed")
+    assert uploaded["multipart"].part_size == 8 * 1024 * 1024
+
+
 def test_cli_verify_delegates():
     with patch("player_universe_load.verification.verify_database") as vd:
         cli.verify()